@@ -14,6 +14,7 @@ import logging
 from ...repo.db import get_db
 from ...core.oauth import google_oauth, get_current_user, get_current_user_optional
 from ...models.user import User
+from ...services.user_preferences import invalidate_preferences_cache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -214,6 +215,9 @@ def update_user_preferences(
         
         db.commit()
         
+        # 설정 조회 캐시 무효화
+        invalidate_preferences_cache(current_user.google_id)
+        
         return {
             "success": True,
             "preferences": current_preferences,
@@ -260,6 +264,9 @@ def update_notification_settings(
         
         db.commit()
         
+        # 설정 조회 캐시에 알림 설정이 포함되므로 무효화
+        invalidate_preferences_cache(current_user.google_id)
+        
         return {
             "success": True,
             "notification_settings": current_settings,
@@ -14,6 +14,7 @@ from ...repo.db import SessionLocal
 from ...repo.company import CompanyRepo
 from ...models.company import Company, UserFollowing, CompanyMention
 from ...services.company_extractor import process_all_pending_companies
+from ...services.user_preferences import invalidate_following_companies_cache
 from ...workers.company_tasks import (
     process_all_pending_companies_task,
     # summarize_following_companies_task,  # TODO: 구현 예정
@@ -294,6 +295,7 @@ def follow_company(
             notification_enabled=notification_enabled,
             auto_summarize=auto_summarize
         )
+        invalidate_following_companies_cache(user_id)
         
         db.close()
         
@@ -343,6 +345,7 @@ def unfollow_company(
         
         # 팔로잉 삭제
         repo.delete_user_following(following.id)
+        invalidate_following_companies_cache(user_id)
         
         db.close()
         
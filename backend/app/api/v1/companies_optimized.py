@@ -16,6 +16,7 @@ from ...models.user import User
 from ...repo.company import CompanyRepo
 from ...models.company import Company, UserFollowing, CompanyMention
 from ...services.following_cache import FollowingCacheService
+from ...services.user_preferences import invalidate_following_companies_cache
 from ...repo.redis_client import get_redis_client
 
 router = APIRouter()
@@ -215,6 +216,7 @@ def follow_company_fast(
         db.commit()
         
         # Redis 캐시 업데이트
+        invalidate_following_companies_cache(user_id)
         following_cache.add_following(
             user_id=user_id,
             company_id=company_id,
@@ -264,6 +266,7 @@ def unfollow_company_fast(
             db.commit()
         
         # Redis 캐시에서 제거
+        invalidate_following_companies_cache(user_id)
         following_cache.remove_following(user_id, company_id)
         
         return {
@@ -46,7 +46,8 @@ async def get_market_indices(
         elif market == 'GLOBAL':
             indices = await market_service.get_global_indices()
         else:
-            indices = await market_service.get_all_indices()
+            all_indices = await market_service.get_all_indices()
+            indices = all_indices["indices"]
         
         return {
             "market": market or "ALL",
@@ -145,7 +146,7 @@ async def get_market_summary(
         market_service = MarketDataService()
         
         # 모든 지수 데이터 조회
-        all_indices = await market_service.get_all_indices()
+        all_indices = (await market_service.get_all_indices())["indices"]
         
         # 요약 통계 계산
         total_indices = len(all_indices)
@@ -41,13 +41,11 @@ def get_popular_news(
     """
     try:
         analyzer = PopularNewsAnalyzer(db)
-        popular_news = analyzer.get_popular_news(limit, hours)
+        popular_news = analyzer.get_popular_news_with_scores(limit, hours)
         
         # 응답 데이터 구성
         news_list = []
-        for content in popular_news:
-            popularity_score = analyzer.analyze_popularity_score(content)
-            
+        for content, popularity_score in popular_news:
             news_list.append({
                 "id": content.id,
                 "title": content.title,
@@ -203,11 +201,11 @@ def get_popular_news_stats(
         
         # 인기 뉴스 분석기로 최신 인기도 점수 계산
         analyzer = PopularNewsAnalyzer(db)
-        popular_news = analyzer.get_popular_news(10, 24)
+        popular_news = analyzer.get_popular_news_with_scores(10, 24)
         
         avg_popularity_score = 0
         if popular_news:
-            scores = [analyzer.analyze_popularity_score(news) for news in popular_news]
+            scores = [score for _, score in popular_news]
             avg_popularity_score = sum(scores) / len(scores)
         
         return {
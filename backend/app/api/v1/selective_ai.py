@@ -6,9 +6,11 @@
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import logging
+import orjson
 
 from ...repo.db import SessionLocal
 from ...services.selective_ai_pipeline import SelectiveAIPipeline
@@ -121,14 +123,16 @@ def process_content(
         raise HTTPException(status_code=500, detail=f"콘텐츠 처리 실패: {str(e)}")
 
 
-@router.post("/process-batch", summary="배치 선택적 AI 처리")
+@router.post("/process-batch", summary="배치 선택적 AI 처리", response_class=ORJSONResponse)
 def process_batch(
     user_id: str = Query("default_user", description="사용자 ID"),
     limit: int = Query(50, ge=1, le=100, description="처리할 최대 개수")
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     배치로 콘텐츠를 선택적 AI 파이프라인으로 처리합니다.
     
+    결과 목록이 커질 수 있어 jsonable_encoder/json 대신 orjson으로 바로 직렬화합니다.
+    
     Parameters
     ----------
     user_id : str
@@ -138,7 +142,7 @@ def process_batch(
         
     Returns
     -------
-    Dict[str, Any]
+    ORJSONResponse
         배치 처리 결과
     """
     try:
@@ -148,13 +152,49 @@ def process_batch(
         result = pipeline.process_batch_content(user_id, limit)
         
         db.close()
-        return result
+        return ORJSONResponse(result)
         
     except Exception as e:
         logger.error(f"배치 처리 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"배치 처리 실패: {str(e)}")
 
 
+@router.post("/process-batch/stream", summary="배치 선택적 AI 처리 (스트리밍)")
+def process_batch_stream(
+    user_id: str = Query("default_user", description="사용자 ID"),
+    limit: int = Query(50, ge=1, le=100, description="처리할 최대 개수")
+) -> StreamingResponse:
+    """
+    배치 처리 결과를 콘텐츠별로 NDJSON으로 스트리밍합니다.
+    
+    배치 처리와 커밋을 마친 뒤 보내므로 자동 요약 결과에도 task_id가 채워져 있습니다.
+    
+    마지막 줄은 집계와 task_id 목록을 담은 status="batch_completed" 레코드입니다.
+    
+    Parameters
+    ----------
+    user_id : str
+        사용자 ID
+    limit : int
+        처리할 최대 개수
+        
+    Returns
+    -------
+    StreamingResponse
+        application/x-ndjson 응답
+    """
+    def generate():
+        db = SessionLocal()
+        try:
+            pipeline = SelectiveAIPipeline(db)
+            for record in pipeline.iter_batch_content(user_id, limit):
+                yield orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        finally:
+            db.close()
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.post("/on-demand-summary/{content_id}", summary="온디맨드 요약 실행")
 def trigger_on_demand_summary(
     content_id: int,
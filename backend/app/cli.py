@@ -2,8 +2,22 @@ import click
 from sqlalchemy import create_engine
 from .models.base import Base
 from .models import content as content_model
+from .models import company as company_model  # noqa: F401 (메타데이터에 테이블 등록)
 from .core.config import settings
 
+# 기존 테이블에 추가된 컬럼 (create_all은 이미 있는 테이블을 변경하지 않으므로 ALTER로 추가)
+# 순서대로 실행되며, 모두 IF NOT EXISTS라 여러 번 실행해도 안전함
+ADDED_COLUMNS = (
+    ("content", "source_key varchar(20)"),
+    ("content", "popularity_score double precision DEFAULT 0"),
+    ("ai_cache", "content_fp varchar(64)"),
+)
+
+# 새 인덱스로 대체된 기존 인덱스 → 대체한 인덱스 (대체 인덱스가 만들어진 뒤에만 삭제)
+REPLACED_INDEXES = {
+    "idx_user_following_user": "idx_user_following_user_company",
+}
+
 @click.group()
 def cli():
     pass
@@ -14,5 +28,88 @@ def init_db():
     Base.metadata.create_all(engine)
     click.echo("DB initialized.")
 
+@cli.command()
+def migrate_columns():
+    """기존 테이블에 모델에서 추가된 컬럼을 만듭니다 (backfill, create-indexes보다 먼저 실행)."""
+    from sqlalchemy import text
+    
+    engine = create_engine(settings.DB_URL)
+    with engine.begin() as conn:
+        for table, column_ddl in ADDED_COLUMNS:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column_ddl}"))
+    click.echo("columns migrated.")
+
+@cli.command()
+def backfill_source_keys():
+    """source_key가 비어 있는 기존 콘텐츠를 채웁니다."""
+    from sqlalchemy import update
+    from sqlalchemy.orm import Session
+    
+    engine = create_engine(settings.DB_URL)
+    Content = content_model.Content
+    with Session(engine) as db:
+        for key in content_model.SOURCE_KEYS:
+            db.execute(
+                update(Content)
+                .where(Content.source_key.is_(None), Content.source.ilike(f"%{key}%"))
+                .values(source_key=key)
+            )
+        db.execute(update(Content).where(Content.source_key.is_(None)).values(source_key="other"))
+        db.commit()
+    click.echo("source_key backfilled.")
+
+@cli.command()
+def backfill_popularity_scores():
+    """기존 콘텐츠 전체의 popularity_score를 1회 계산합니다."""
+    from sqlalchemy.orm import Session
+    from .services.popular_news_analyzer import PopularNewsAnalyzer
+    
+    engine = create_engine(settings.DB_URL)
+    with Session(engine) as db:
+        updated = PopularNewsAnalyzer(db).refresh_popularity_scores(hours=None)
+    click.echo(f"popularity_score backfilled ({updated} rows).")
+
+@cli.command()
+def dedupe_followings():
+    """중복된 (user_id, company_id) 팔로잉 행을 가장 먼저 만든 행만 남기고 지웁니다 (create-indexes보다 먼저 실행)."""
+    from sqlalchemy import text
+    
+    engine = create_engine(settings.DB_URL)
+    with engine.begin() as conn:
+        result = conn.execute(text(
+            "DELETE FROM user_followings a USING user_followings b "
+            "WHERE a.user_id = b.user_id AND a.company_id = b.company_id AND a.id > b.id"
+        ))
+    click.echo(f"duplicate followings removed ({result.rowcount} rows).")
+
+@cli.command()
+def create_indexes():
+    """기존 테이블에 없는 인덱스를 만들고, 대체된 기존 인덱스를 지웁니다 (create_all은 기존 테이블의 인덱스를 추가하지 않음).
+    
+    인덱스마다 별도 트랜잭션으로 만들어 하나가 실패해도(예: 중복 행으로 고유 인덱스 실패) 나머지는 유지됩니다.
+    """
+    from sqlalchemy import text
+    
+    engine = create_engine(settings.DB_URL)
+    failed = []
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                with engine.begin() as conn:
+                    index.create(conn, checkfirst=True)
+            except Exception as e:
+                failed.append(index.name)
+                click.echo(f"index {index.name} failed: {e}", err=True)
+    
+    for old_name, new_name in REPLACED_INDEXES.items():
+        if new_name in failed:
+            continue
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP INDEX IF EXISTS {old_name}"))
+    
+    if failed:
+        raise click.ClickException(f"indexes not created: {', '.join(failed)}")
+    click.echo("indexes created.")
+
 if __name__ == "__main__":
     cli()
@@ -156,8 +156,8 @@ class GoogleOAuth:
         session.last_activity = datetime.utcnow()
         db.commit()
         
-        # 사용자 정보 반환
-        return db.query(User).filter(User.id == session.user_id).first()
+        # 사용자 정보 반환 (기본 키 조회라 세션에 이미 있으면 쿼리 없이 반환)
+        return db.get(User, session.user_id)
     
     def logout_user(self, db: Session, session_token: str) -> bool:
         """사용자 로그아웃"""
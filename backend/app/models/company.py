@@ -80,7 +80,8 @@ class UserFollowing(Base):
     
     # 인덱스
     __table_args__ = (
-        Index('idx_user_following_user', 'user_id'),
+        # (user_id, company_id) 조회용, user_id 단독 조회도 이 인덱스의 앞부분으로 처리
+        Index('idx_user_following_user_company', 'user_id', 'company_id', unique=True),
         Index('idx_user_following_company', 'company_id'),
         Index('idx_user_following_priority', 'priority'),
         Index('idx_user_following_auto_summarize', 'auto_summarize'),
@@ -123,6 +124,7 @@ class CompanyMention(Base):
         Index('idx_mention_sentiment', 'sentiment'),
         Index('idx_mention_relevance', 'relevance_score'),
         Index('idx_mention_created', 'created_at'),
+        Index('idx_mention_company_created', 'company_id', created_at.desc()),
     )
 
 
@@ -1,18 +1,63 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, UniqueConstraint, Index, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, Float, UniqueConstraint, Index, ForeignKey, func, text
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, relationship
 from datetime import datetime
 from .base import Base
 
+# AI 요약 프롬프트에 넣는 본문 앞부분 길이 (raw_text_head)
+RAW_TEXT_HEAD_CHARS = 3000
+
+# 인기도 점수용 소스 키 (source 문자열에 포함된 키워드를 순서대로 매칭)
+SOURCE_KEYS = ("hankyung", "yahoo", "coindesk", "bloomberg", "reuters")
+
+# 소스 키별 신뢰도 점수 (10점 만점, 그 외는 5점)
+SOURCE_SCORES = {
+    "hankyung": 10.0,   # 한국경제
+    "yahoo": 8.0,       # Yahoo Finance
+    "coindesk": 7.0,    # CoinDesk
+    "bloomberg": 9.0,   # Bloomberg
+    "reuters": 8.5,     # Reuters
+}
+
+
+def normalize_source_key(source: str | None) -> str:
+    """
+    source 문자열을 인기도 점수용 소스 키로 정규화합니다.
+    
+    Parameters
+    ----------
+    source : str | None
+        원본 소스 문자열 (예: "rss:hankyung_economy")
+        
+    Returns
+    -------
+    str
+        SOURCE_KEYS 중 하나 또는 "other"
+    """
+    source_lower = (source or "").lower()
+    for key in SOURCE_KEYS:
+        if key in source_lower:
+            return key
+    return "other"
+
+
+def _default_source_key(context) -> str:
+    """INSERT 시 source 값으로 source_key 기본값을 채웁니다."""
+    return normalize_source_key(context.get_current_parameters().get("source"))
+
+
 class Content(Base):
     __tablename__ = "content"
     id = Column(Integer, primary_key=True)
     source = Column(String(50), nullable=False)
+    source_key = Column(String(20), default=_default_source_key)  # 정규화된 소스 (hankyung, yahoo, ..., other)
     title = Column(String(512), nullable=False)
     author = Column(String(256))
     url = Column(String(1024), nullable=False)
     published_at = Column(DateTime)
     raw_text = Column(Text)
+    # 본문 앞부분만 DB에서 잘라 가져오는 읽기 전용 속성 (요약 시 긴 raw_text 전체를 전송하지 않도록, load_only로 지정할 때만 조회)
+    raw_text_head = column_property(func.left(raw_text, RAW_TEXT_HEAD_CHARS), deferred=True)
     lang = Column(String(16))
     hash = Column(String(64), nullable=False, unique=True)
     summary_bullets = Column(JSONB)  # 최대 5개 bullet points
@@ -29,16 +74,33 @@ class Content(Base):
     share_count = Column(Integer, default=0)  # 공유 수
     comment_count = Column(Integer, default=0)  # 댓글 수
     engagement_score = Column(String(20), default="low")  # low, medium, high, viral
+    popularity_score = Column(Float, default=0.0)  # 사전 계산된 인기도 점수 (0-100, 쓰기 시점에 갱신)
 
     __table_args__ = (
         UniqueConstraint("hash", name="uq_content_hash"),
         Index("idx_published_at_desc", "published_at"),
+        # 인기 뉴스 조회 (is_active = 'active' AND published_at >= cutoff) 범위 스캔용
+        Index("idx_content_active_published", "is_active", published_at.desc()),
+        Index("idx_content_source_key", "source_key"),
+        # 제목이 같은 기사의 AI 캐시 재사용 조회용
+        Index("idx_content_title", "title"),
+        # 인기 뉴스 top-K 조회 (정렬 없이 인덱스 순서로 반환)
+        Index("idx_content_active_popularity", "is_active", popularity_score.desc()),
+        # 선택적 AI 배치의 pending_summary 조회용 (대기 중인 행만 담는 부분 GIN 인덱스)
+        Index(
+            "idx_content_pending",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+            postgresql_where=text("""tags @> '["pending_summary"]'"""),
+        ),
     )
 
 class AICache(Base):
     __tablename__ = "ai_cache"
     id = Column(Integer, primary_key=True)
     content_hash = Column(String(64), nullable=False)
+    content_fp = Column(String(64))  # 정규화한 제목+본문 지문 (다른 URL로 재게재된 같은 기사 조회용)
     model_version = Column(String(50), nullable=False, default="gpt-3.5-turbo")
     summary_bullets = Column(JSONB)  # 최대 5개
     insight = Column(Text)  # 2-3문장  
@@ -48,4 +110,5 @@ class AICache(Base):
     __table_args__ = (
         UniqueConstraint("content_hash", "model_version", name="uq_ai_cache"),
         Index("idx_content_hash", "content_hash"),
+        Index("idx_ai_cache_fp", "content_fp", "model_version"),
     )
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, cast, String, func
 from .db import SessionLocal
@@ -101,7 +101,36 @@ class ContentRepo:
         >>> if content:
         ...     print(content.title)
         """
-        return self.db.query(Content).filter_by(id=content_id).first()
+        # 기본 키 조회는 세션 identity map에 있으면 쿼리 없이 반환
+        return self.db.get(Content, content_id)
+    
+    def get_by_ids(self, content_ids: List[int], *options: Any) -> Dict[int, Content]:
+        """
+        여러 ID의 콘텐츠를 한 번에 조회
+        
+        Parameters
+        ----------
+        content_ids : List[int]
+            조회할 콘텐츠 ID 목록
+        *options : Any
+            쿼리에 적용할 로더 옵션 (예: load_only)
+            
+        Returns
+        -------
+        Dict[int, Content]
+            콘텐츠 ID → 콘텐츠 (없는 ID는 빠짐)
+            
+        Examples
+        --------
+        >>> repo = ContentRepo()
+        >>> contents = repo.get_by_ids([1, 2, 3])
+        >>> content = contents.get(2)
+        """
+        if not content_ids:
+            return {}
+        
+        rows = self.db.query(Content).options(*options).filter(Content.id.in_(content_ids))
+        return {content.id: content for content in rows}
     
     def get_popular_tags(self, limit: int = 20) -> List[str]:
         """
@@ -2,7 +2,18 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session
 from ..core.config import settings
 
-engine = create_engine(settings.DB_URL, pool_pre_ping=True)
+# 스레드 풀 워커(-c 30)가 동시에 세션을 잡아도 대기하지 않도록 pool_size + max_overflow를 맞춤
+DB_POOL_SIZE = 20
+DB_MAX_OVERFLOW = 10
+DB_POOL_RECYCLE = 1800  # 서버/프록시가 유휴 연결을 끊기 전에 재연결 (초)
+
+engine = create_engine(
+    settings.DB_URL,
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+)
 SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
 
 def get_db():
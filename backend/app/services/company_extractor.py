@@ -6,10 +6,11 @@
 """
 
 import openai
-import json
+import orjson
 import re
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from ..models.company import Company, CompanyMention
 from ..models.content import Content
@@ -135,7 +136,7 @@ class CompanyExtractor:
                 max_tokens=2000
             )
             
-            result = json.loads(response.choices[0].message.content)
+            result = orjson.loads(response.choices[0].message.content)
             companies = result.get("companies", [])
             
             # 비용 로깅
@@ -278,12 +279,16 @@ class CompanyExtractor:
     
     def process_all_pending_content(self) -> Dict[str, Any]:
         """처리되지 않은 모든 콘텐츠에서 기업 추출"""
+        # 기업 추출이 안된 콘텐츠 조회 (pending_summary 태그가 있는 것들)
+        pending_contents = self.db.query(Content).filter(
+            Content.tags.contains(["pending_summary"])
+        ).limit(100).all()
+        
+        return self.process_contents(pending_contents)
+    
+    def process_contents(self, pending_contents: List[Content]) -> Dict[str, Any]:
+        """주어진 콘텐츠에서 기업을 추출하고 pending_summary 태그를 company_extracted로 바꿈"""
         try:
-            # 기업 추출이 안된 콘텐츠 조회 (pending_summary 태그가 있는 것들)
-            pending_contents = self.db.query(Content).filter(
-                Content.tags.contains(["pending_summary"])
-            ).limit(100).all()
-            
             results = {
                 "processed": 0,
                 "extracted_companies": 0,
@@ -325,7 +330,7 @@ class CompanyExtractor:
 def extract_companies_from_content(content_id: int, db: Session) -> Dict[str, Any]:
     """콘텐츠에서 기업 추출 (외부 호출용)"""
     extractor = CompanyExtractor(db)
-    content = db.query(Content).filter(Content.id == content_id).first()
+    content = db.get(Content, content_id)
     
     if not content:
         return {"error": "콘텐츠를 찾을 수 없습니다"}
@@ -337,3 +342,23 @@ def process_all_pending_companies(db: Session) -> Dict[str, Any]:
     """처리되지 않은 모든 콘텐츠에서 기업 추출 (외부 호출용)"""
     extractor = CompanyExtractor(db)
     return extractor.process_all_pending_content()
+
+
+def get_pending_content_ids(db: Session, limit: int = 100) -> List[int]:
+    """기업 추출이 필요한 콘텐츠 ID 목록 조회 (pending_summary 태그)"""
+    return db.execute(
+        select(Content.id)
+        .where(Content.tags.contains(["pending_summary"]))
+        .limit(limit)
+    ).scalars().all()
+
+
+def process_pending_companies_for_ids(content_ids: List[int], db: Session) -> Dict[str, Any]:
+    """지정한 콘텐츠들에서 기업 추출 (배치 태스크용)"""
+    extractor = CompanyExtractor(db)
+    # 큐에 들어간 사이 다른 실행에서 처리된 콘텐츠는 제외
+    contents = db.query(Content).filter(
+        Content.id.in_(content_ids),
+        Content.tags.contains(["pending_summary"])
+    ).all()
+    return extractor.process_contents(contents)
@@ -5,7 +5,7 @@
 팔로잉 기업과 뉴스에서 추출된 기업을 매칭하여 선택적 AI 처리 결정
 """
 
-from typing import List, Dict, Any, Set, Optional
+from typing import List, Dict, Any, Set, Optional, FrozenSet, Tuple
 from sqlalchemy.orm import Session
 from ..models.company import Company, UserFollowing, CompanyMention
 from ..models.content import Content
@@ -19,8 +19,42 @@ class CompanyMatcher:
     
     def __init__(self, db: Session):
         self.db = db
+        # 사용자별 (자동 요약 팔로잉 기업 ID, 기업별 우선순위) - 매처 인스턴스 수명 동안 재사용
+        self._following_cache: Dict[str, Tuple[FrozenSet[int], Dict[int, int]]] = {}
     
-    def get_following_companies(self, user_id: str) -> Set[int]:
+    def prime_user(self, user_id: str) -> None:
+        """
+        사용자의 팔로잉 정보를 한 번의 쿼리로 읽어 캐시합니다.
+        
+        배치 처리 전에 호출하면 콘텐츠마다 팔로잉/우선순위를 다시 조회하지 않습니다.
+        
+        Parameters
+        ----------
+        user_id : str
+            사용자 ID
+        """
+        followings = self.db.query(
+            UserFollowing.company_id,
+            UserFollowing.priority,
+            UserFollowing.auto_summarize
+        ).filter(UserFollowing.user_id == user_id).all()
+        
+        self._following_cache[user_id] = (
+            frozenset(row.company_id for row in followings if row.auto_summarize),  # 자동 요약 활성화된 것만
+            {row.company_id: row.priority for row in followings}
+        )
+    
+    def invalidate_user(self, user_id: str) -> None:
+        """팔로잉/언팔로잉 후 사용자의 캐시된 팔로잉 정보를 버립니다."""
+        self._following_cache.pop(user_id, None)
+    
+    def _get_following_info(self, user_id: str) -> Tuple[FrozenSet[int], Dict[int, int]]:
+        """캐시된 팔로잉 정보를 반환합니다 (없으면 조회)."""
+        if user_id not in self._following_cache:
+            self.prime_user(user_id)
+        return self._following_cache[user_id]
+    
+    def get_following_companies(self, user_id: str) -> FrozenSet[int]:
         """
         사용자가 팔로잉하는 기업 ID 목록을 조회합니다.
         
@@ -31,15 +65,10 @@ class CompanyMatcher:
             
         Returns
         -------
-        Set[int]
-            팔로잉 기업 ID 목록
+        FrozenSet[int]
+            자동 요약이 활성화된 팔로잉 기업 ID 목록
         """
-        followings = self.db.query(UserFollowing).filter(
-            UserFollowing.user_id == user_id,
-            UserFollowing.auto_summarize == True  # 자동 요약 활성화된 것만
-        ).all()
-        
-        return {following.company_id for following in followings}
+        return self._get_following_info(user_id)[0]
     
     def get_content_companies(self, content_id: int) -> Set[int]:
         """
@@ -125,7 +154,7 @@ class CompanyMatcher:
             }
             
         except Exception as e:
-            logger.error(f"기업 매칭 실패 (콘텐츠 {content_id}, 사용자 {user_id}): {str(e)}")
+            logger.error("기업 매칭 실패 (콘텐츠 %s, 사용자 %s): %s", content_id, user_id, e, exc_info=True)
             return {
                 "should_summarize": False,
                 "matched_companies": [],
@@ -139,12 +168,7 @@ class CompanyMatcher:
     
     def _get_company_priority(self, user_id: str, company_id: int) -> int:
         """기업의 사용자별 우선순위를 조회합니다."""
-        following = self.db.query(UserFollowing).filter(
-            UserFollowing.user_id == user_id,
-            UserFollowing.company_id == company_id
-        ).first()
-        
-        return following.priority if following else 0
+        return self._get_following_info(user_id)[1].get(company_id) or 0
     
     def _get_decision_reason(self, should_summarize: bool, matched: Set[int], content_companies: Set[int]) -> str:
         """결정 이유를 설명합니다."""
@@ -211,7 +235,7 @@ class CompanyMatcher:
             return priority_contents
             
         except Exception as e:
-            logger.error(f"우선순위 콘텐츠 조회 실패 (사용자 {user_id}): {str(e)}")
+            logger.error("우선순위 콘텐츠 조회 실패 (사용자 %s): %s", user_id, e, exc_info=True)
             return []
     
     def get_user_summary_stats(self, user_id: str) -> Dict[str, Any]:
@@ -278,7 +302,7 @@ class CompanyMatcher:
             }
             
         except Exception as e:
-            logger.error(f"사용자 통계 조회 실패 (사용자 {user_id}): {str(e)}")
+            logger.error("사용자 통계 조회 실패 (사용자 %s): %s", user_id, e, exc_info=True)
             return {
                 "following_companies": 0,
                 "total_content": 0,
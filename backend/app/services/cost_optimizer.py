@@ -278,7 +278,7 @@ class CostOptimizerService:
         """
         try:
             # 콘텐츠 조회
-            content = self.db.query(Content).filter(Content.id == content_id).first()
+            content = self.db.get(Content, content_id)
             if not content:
                 return {"error": "콘텐츠를 찾을 수 없습니다."}
             
@@ -5,9 +5,23 @@
 여러 RSS 피드를 한 번에 수집하고 관리하는 기능을 제공합니다.
 """
 
+import asyncio
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from .rss import ingest_rss
+import feedparser
+import httpx
+import redis
+from .rss import FEED_FETCH_TIMEOUT, ingest_rss
+from ...repo.redis_client import get_redis_client
+
+MAX_FEED_CONNECTIONS = 50  # 동시에 열어 둘 최대 연결 수
+
+ROLLING_BATCH_SIZE = 20  # 롤링 수집 한 번에 처리할 최대 피드 수
+FEED_MIN_INTERVAL = 1800  # 같은 피드를 다시 수집하기까지의 최소 간격 (초)
+FEED_LAST_INGESTED_KEY = "rss:feed_last_ingested"  # 피드 URL → 마지막 수집 시각(epoch 초) sorted set
+FEED_CLAIM_PREFIX = "rss:feed_claim:"  # 롤링 수집 실행이 처리 중인 피드 표시 (겹친 실행이 같은 피드를 수집하지 않도록)
+FEED_CLAIM_TTL = 360  # 처리 중 표시 유지 시간 (초, 수집 마감 300초보다 길게, 워커가 죽어도 풀림)
 
 
 # RSS 피드 설정
@@ -71,7 +85,276 @@ RSS_FEEDS = {
 }
 
 
-def ingest_multiple_feeds(feed_groups: Optional[List[str]] = None) -> Dict[str, Any]:
+async def _fetch_all(feed_urls: List[str]) -> Dict[str, Any]:
+    """
+    여러 RSS 피드를 동시에 받아 파싱합니다.
+    
+    Parameters
+    ----------
+    feed_urls : List[str]
+        받을 피드 URL 목록
+        
+    Returns
+    -------
+    Dict[str, Any]
+        URL → feedparser 결과 (받지 못한 피드는 빠짐)
+    """
+    limits = httpx.Limits(max_connections=MAX_FEED_CONNECTIONS)
+    async with httpx.AsyncClient(
+        timeout=FEED_FETCH_TIMEOUT, follow_redirects=True, limits=limits
+    ) as client:
+        # 클라이언트 타임아웃은 단계별(연결, 읽기 간격)이라 응답 하나의 전체 시간도 제한
+        responses = await asyncio.gather(
+            *(asyncio.wait_for(client.get(url), FEED_FETCH_TIMEOUT) for url in feed_urls),
+            return_exceptions=True
+        )
+    
+    async def parse(url: str, response: Any) -> Optional[Any]:
+        if isinstance(response, Exception) or response.status_code >= 400:
+            print(f"  ⚠️  피드 다운로드 실패: {url}")
+            return None
+        # 파싱은 CPU 작업이라 이벤트 루프를 막지 않도록 스레드에서 실행
+        return await asyncio.to_thread(feedparser.parse, response.content)
+    
+    parsed = await asyncio.gather(
+        *(parse(url, response) for url, response in zip(feed_urls, responses))
+    )
+    return {url: feed for url, feed in zip(feed_urls, parsed) if feed is not None}
+
+
+def _deadline_passed(deadline: Optional[float]) -> bool:
+    """time.monotonic() 기준 마감 시각이 지났는지 확인합니다 (None이면 제한 없음)."""
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def _ingest_feed(feed_config: Dict[str, str], feed: Any = None, deadline: Optional[float] = None) -> Dict[str, Any]:
+    """
+    피드 하나를 수집하고 피드별 결과를 반환합니다 (실패해도 예외 대신 error 결과).
+    
+    마감 시각이 이미 지났으면 수집하지 않고 status "timeout" 결과를, 미리 받지 못한
+    피드는 다시 받지 않고 status "error" 결과를 반환합니다.
+    
+    Parameters
+    ----------
+    feed_config : Dict[str, str]
+        피드 설정 (name, url, source_name, ...)
+    feed : Any, optional
+        미리 받아 파싱한 feedparser 결과 (_fetch_all 참고, None이면 다운로드 실패)
+    deadline : Optional[float], optional
+        time.monotonic() 기준 수집 마감 시각
+        
+    Returns
+    -------
+    Dict[str, Any]
+        피드별 수집 결과 (name, url, processed, saved, duplicates, queued_tasks, status)
+    """
+    name = feed_config["name"]
+    url = feed_config["url"]
+    
+    if _deadline_passed(deadline):
+        print(f"  ⏱️  {name} 수집 생략 (시간 초과)")
+        return {
+            "name": name,
+            "url": url,
+            "processed": 0,
+            "saved": 0,
+            "duplicates": 0,
+            "queued_tasks": 0,
+            "status": "timeout"
+        }
+    
+    if feed is None:
+        # 제한 시간 안에 받지 못한 피드를 여기서 다시 받으면 수집 마감을 넘길 수 있음
+        print(f"  ❌ {name} 수집 생략 (피드 다운로드 실패)")
+        return {
+            "name": name,
+            "url": url,
+            "processed": 0,
+            "saved": 0,
+            "duplicates": 0,
+            "queued_tasks": 0,
+            "status": "error",
+            "error": "feed download failed"
+        }
+    
+    print(f"  🔄 {name} 수집 중...")
+    
+    try:
+        result = ingest_rss(url, source_name=feed_config["source_name"], feed=feed, deadline=deadline)
+        
+        print(f"    ✅ 처리: {result['processed']}개, 저장: {result['saved']}개, 중복: {result['duplicates']}개")
+        
+        return {
+            "name": name,
+            "url": url,
+            "processed": result['processed'],
+            "saved": result['saved'],
+            "duplicates": result['duplicates'],
+            "queued_tasks": result['queued_tasks'],
+            "status": "success"
+        }
+        
+    except Exception as e:
+        print(f"    ❌ 에러: {e}")
+        return {
+            "name": name,
+            "url": url,
+            "processed": 0,
+            "saved": 0,
+            "duplicates": 0,
+            "queued_tasks": 0,
+            "status": "error",
+            "error": str(e)
+        }
+
+
+def _mark_ingested(feed_urls: List[str]) -> None:
+    """수집한 피드의 마지막 수집 시각을 Redis에 기록합니다 (롤링 수집 순서 결정용)."""
+    if not feed_urls:
+        return
+    
+    now = int(time.time())
+    try:
+        get_redis_client().zadd(FEED_LAST_INGESTED_KEY, {url: now for url in feed_urls})
+    except redis.RedisError as e:
+        print(f"⚠️  피드 수집 시각 기록 실패: {e}")
+
+
+def _claim_feeds(feed_configs: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    다른 실행이 처리 중이지 않은 피드를 이 실행의 것으로 표시하고 반환합니다.
+    
+    피드마다 SET NX로 표시하므로 겹쳐 실행된 롤링 수집은 서로 다른 피드만 가져갑니다.
+    Redis 오류 시에는 모든 피드를 반환합니다 (중복 기사는 저장 시 해시로 걸러짐).
+    """
+    if not feed_configs:
+        return []
+    
+    try:
+        with get_redis_client().pipeline(transaction=False) as pipe:
+            for feed_config in feed_configs:
+                pipe.set(f"{FEED_CLAIM_PREFIX}{feed_config['url']}", 1, nx=True, ex=FEED_CLAIM_TTL)
+            claimed = pipe.execute()
+    except redis.RedisError as e:
+        print(f"⚠️  피드 처리 중 표시 실패: {e}")
+        return feed_configs
+    
+    return [feed_config for feed_config, ok in zip(feed_configs, claimed) if ok]
+
+
+def _release_feeds(feed_urls: List[str]) -> None:
+    """_claim_feeds로 표시한 피드의 처리 중 표시를 지웁니다."""
+    if not feed_urls:
+        return
+    
+    try:
+        get_redis_client().delete(*(f"{FEED_CLAIM_PREFIX}{url}" for url in feed_urls))
+    except redis.RedisError as e:
+        print(f"⚠️  피드 처리 중 표시 해제 실패: {e}")
+
+
+def select_stale_feeds(batch_size: int = ROLLING_BATCH_SIZE, min_interval: int = FEED_MIN_INTERVAL) -> List[Dict[str, str]]:
+    """
+    수집한 지 가장 오래된 피드부터 최대 batch_size개를 고릅니다.
+    
+    한 번도 수집하지 않은 피드가 가장 먼저 오고 (NULLS FIRST),
+    min_interval 안에 수집한 피드는 제외합니다.
+    
+    Parameters
+    ----------
+    batch_size : int
+        고를 최대 피드 수
+    min_interval : int
+        같은 피드를 다시 수집하기까지의 최소 간격 (초)
+        
+    Returns
+    -------
+    List[Dict[str, str]]
+        수집할 피드 설정 목록
+    """
+    feed_configs = [feed_config for feeds in RSS_FEEDS.values() for feed_config in feeds]
+    if not feed_configs:
+        return []
+    
+    try:
+        scores = get_redis_client().zmscore(
+            FEED_LAST_INGESTED_KEY, [feed_config["url"] for feed_config in feed_configs]
+        )
+    except redis.RedisError as e:
+        # 기록을 읽을 수 없으면 모든 피드를 한 번도 수집하지 않은 것으로 간주
+        print(f"⚠️  피드 수집 시각 조회 실패: {e}")
+        scores = [None] * len(feed_configs)
+    
+    cutoff = time.time() - min_interval
+    stale = [
+        (score or 0.0, feed_config)
+        for feed_config, score in zip(feed_configs, scores)
+        if score is None or score <= cutoff
+    ]
+    stale.sort(key=lambda item: item[0])
+    
+    return [feed_config for _, feed_config in stale[:batch_size]]
+
+
+def ingest_rolling_batch(
+    batch_size: int = ROLLING_BATCH_SIZE,
+    min_interval: int = FEED_MIN_INTERVAL,
+    deadline: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    가장 오래 수집하지 않은 피드 묶음만 수집합니다.
+    
+    Celery Beat가 1분마다 실행하며, 한 번에 다루는 피드 수를 batch_size로 묶어
+    실행마다 외부 요청과 DB 쓰기 양이 일정하게 유지됩니다. 이전 실행이 아직 처리 중인
+    피드는 건너뛰고(_claim_feeds), 성공한 피드만 수집 시각을 기록해 실패한 피드는
+    다음 실행에서 다시 수집합니다.
+    
+    Parameters
+    ----------
+    batch_size : int
+        한 번에 수집할 최대 피드 수
+    min_interval : int
+        같은 피드를 다시 수집하기까지의 최소 간격 (초)
+    deadline : Optional[float]
+        time.monotonic() 기준 수집 마감 시각. 지나면 남은 피드는 다음 실행에 맡김
+        
+    Returns
+    -------
+    Dict[str, Any]
+        수집 결과 통계 (ingest_multiple_feeds와 같은 total_*, timed_out 키와 feed_results)
+    """
+    start_time = datetime.now()
+    feed_configs = _claim_feeds(select_stale_feeds(batch_size, min_interval))
+    
+    feed_urls = [feed_config["url"] for feed_config in feed_configs]
+    try:
+        prefetched = asyncio.run(_fetch_all(feed_urls)) if feed_urls else {}
+        
+        feed_results = {
+            feed_config["source_name"]: _ingest_feed(feed_config, prefetched.get(feed_config["url"]), deadline)
+            for feed_config in feed_configs
+        }
+        # 실패하거나 시간 초과로 건너뛴 피드는 기록하지 않아 다음 실행에서 가장 먼저 수집됨
+        _mark_ingested([result["url"] for result in feed_results.values() if result["status"] == "success"])
+    finally:
+        _release_feeds(feed_urls)
+    
+    end_time = datetime.now()
+    
+    return {
+        "total_processed": sum(result["processed"] for result in feed_results.values()),
+        "total_saved": sum(result["saved"] for result in feed_results.values()),
+        "total_duplicates": sum(result["duplicates"] for result in feed_results.values()),
+        "total_queued_tasks": sum(result["queued_tasks"] for result in feed_results.values()),
+        "timed_out": _deadline_passed(deadline),
+        "feed_results": feed_results,
+        "start_time": start_time,
+        "end_time": end_time,
+        "duration_seconds": (end_time - start_time).total_seconds()
+    }
+
+
+def ingest_multiple_feeds(feed_groups: Optional[List[str]] = None, deadline: Optional[float] = None) -> Dict[str, Any]:
     """
     여러 RSS 피드 그룹을 수집합니다.
     
@@ -80,6 +363,8 @@ def ingest_multiple_feeds(feed_groups: Optional[List[str]] = None) -> Dict[str,
     feed_groups : Optional[List[str]], optional
         수집할 피드 그룹 목록. None이면 모든 그룹 수집
         가능한 값: "korean", "us_news"
+    deadline : Optional[float], optional
+        time.monotonic() 기준 수집 마감 시각. 지나면 남은 피드는 수집하지 않음
         
     Returns
     -------
@@ -89,6 +374,7 @@ def ingest_multiple_feeds(feed_groups: Optional[List[str]] = None) -> Dict[str,
         - total_saved: 전체 저장된 기사 수
         - total_duplicates: 전체 중복 기사 수
         - total_queued_tasks: 전체 AI 처리 큐잉 수
+        - timed_out: 마감 시각이 지나 일부 피드를 건너뛰었는지 여부
         - feed_results: 각 피드별 상세 결과
         - start_time: 수집 시작 시간
         - end_time: 수집 완료 시간
@@ -123,6 +409,14 @@ def ingest_multiple_feeds(feed_groups: Optional[List[str]] = None) -> Dict[str,
     print(f"시작 시간: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
+    # 모든 피드를 먼저 동시에 받아 둠 (받지 못한 피드는 ingest_rss가 직접 다시 받음)
+    feed_urls = [
+        feed_config["url"]
+        for group in feed_groups if group in RSS_FEEDS
+        for feed_config in RSS_FEEDS[group]
+    ]
+    prefetched = asyncio.run(_fetch_all(feed_urls)) if feed_urls else {}
+    
     for group in feed_groups:
         if group not in RSS_FEEDS:
             print(f"⚠️  알 수 없는 피드 그룹: {group}")
@@ -135,46 +429,17 @@ def ingest_multiple_feeds(feed_groups: Optional[List[str]] = None) -> Dict[str,
         group_queued = 0
         
         for feed_config in RSS_FEEDS[group]:
-            name = feed_config["name"]
             url = feed_config["url"]
             source_name = feed_config["source_name"]
             
-            print(f"  🔄 {name} 수집 중...")
+            feed_result = _ingest_feed(feed_config, prefetched.get(url), deadline)
+            feed_results[source_name] = feed_result
             
-            try:
-                result = ingest_rss(url, source_name=source_name)
-                
-                print(f"    ✅ 처리: {result['processed']}개, 저장: {result['saved']}개, 중복: {result['duplicates']}개")
-                
-                # 통계 누적
-                group_processed += result['processed']
-                group_saved += result['saved']
-                group_duplicates += result['duplicates']
-                group_queued += result['queued_tasks']
-                
-                # 개별 피드 결과 저장
-                feed_results[source_name] = {
-                    "name": name,
-                    "url": url,
-                    "processed": result['processed'],
-                    "saved": result['saved'],
-                    "duplicates": result['duplicates'],
-                    "queued_tasks": result['queued_tasks'],
-                    "status": "success"
-                }
-                
-            except Exception as e:
-                print(f"    ❌ 에러: {e}")
-                feed_results[source_name] = {
-                    "name": name,
-                    "url": url,
-                    "processed": 0,
-                    "saved": 0,
-                    "duplicates": 0,
-                    "queued_tasks": 0,
-                    "status": "error",
-                    "error": str(e)
-                }
+            # 통계 누적
+            group_processed += feed_result['processed']
+            group_saved += feed_result['saved']
+            group_duplicates += feed_result['duplicates']
+            group_queued += feed_result['queued_tasks']
         
         # 그룹별 통계
         print(f"  📊 {group} 그룹 완료: 처리 {group_processed}개, 저장 {group_saved}개")
@@ -186,6 +451,8 @@ def ingest_multiple_feeds(feed_groups: Optional[List[str]] = None) -> Dict[str,
         total_duplicates += group_duplicates
         total_queued_tasks += group_queued
     
+    _mark_ingested([result["url"] for result in feed_results.values() if result["status"] == "success"])
+    
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
     
@@ -201,6 +468,7 @@ def ingest_multiple_feeds(feed_groups: Optional[List[str]] = None) -> Dict[str,
         "total_saved": total_saved,
         "total_duplicates": total_duplicates,
         "total_queued_tasks": total_queued_tasks,
+        "timed_out": _deadline_passed(deadline),
         "feed_results": feed_results,
         "start_time": start_time,
         "end_time": end_time,
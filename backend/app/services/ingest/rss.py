@@ -1,4 +1,5 @@
 import hashlib
+import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 import feedparser
@@ -7,8 +8,11 @@ from bs4 import BeautifulSoup
 from readability import Document
 from sqlalchemy.orm import Session
 from ...repo.db import SessionLocal
-from ...models.content import Content
-from ...workers.tasks import summarize_task
+from ...models.content import Content, normalize_source_key
+from ..popular_news_analyzer import score_batch
+from ...workers.tasks import chunk_content_ids, summarize_batch_task
+
+FEED_FETCH_TIMEOUT = 10  # 피드 하나를 받을 때 최대 대기 시간(초)
 
 def normalize_url(url: str) -> str:
     """
@@ -223,14 +227,22 @@ def save_content_to_db(content_data: Dict[str, Any], db: Session) -> Optional[in
     if existing:
         return None
     
-    # 새 콘텐츠 생성
+    # 새 콘텐츠 생성 (인기도 점수는 조회 시가 아닌 저장 시점에 계산)
     content = Content(**content_data)
+    content.source_key = normalize_source_key(content.source)
+    content.popularity_score = float(score_batch([content])[0])
     db.add(content)
     db.flush()  # ID를 얻기 위해 flush
     
     return content.id
 
-def ingest_rss(feed_url: str, source_name: str = "rss", db: Session | None = None) -> Dict[str, Any]:
+def ingest_rss(
+    feed_url: str,
+    source_name: str = "rss",
+    db: Session | None = None,
+    feed: Any = None,
+    deadline: Optional[float] = None
+) -> Dict[str, Any]:
     """
     RSS 피드에서 콘텐츠 수집 및 저장
     
@@ -242,6 +254,11 @@ def ingest_rss(feed_url: str, source_name: str = "rss", db: Session | None = Non
         소스 이름, 기본값 "rss"
     db : Session | None, optional
         데이터베이스 세션, None이면 새 세션 생성
+    feed : Any, optional
+        이미 받아서 파싱한 feedparser 결과. None이면 feed_url에서 직접 가져옴
+        (FEED_FETCH_TIMEOUT 제한)
+    deadline : Optional[float], optional
+        time.monotonic() 기준 마감 시각. 지나면 남은 엔트리를 건너뛰고 지금까지 저장한 것만 커밋
         
     Returns
     -------
@@ -263,16 +280,23 @@ def ingest_rss(feed_url: str, source_name: str = "rss", db: Session | None = Non
         db = db or SessionLocal()
         print(f"데이터베이스 세션 생성 완료")
         
-        # RSS 피드 파싱
-        feed = feedparser.parse(feed_url)
+        # RSS 피드 파싱 (미리 받은 피드가 없을 때만)
+        if feed is None:
+            resp = httpx.get(feed_url, timeout=FEED_FETCH_TIMEOUT, follow_redirects=True)
+            resp.raise_for_status()
+            feed = feedparser.parse(resp.content)
         print(f"RSS 피드 파싱 완료 - 엔트리 수: {len(feed.entries)}")
         
         processed = 0
         saved = 0
         duplicates = 0
         queued_tasks = 0
+        saved_ids = []
         
         for entry in feed.entries:
+            if deadline is not None and time.monotonic() >= deadline:
+                print(f"RSS 수집 시간 초과 - 남은 엔트리 {len(feed.entries) - processed}개 생략")
+                break
             processed += 1
             
             # 콘텐츠 텍스트 가져오기 (I/O)
@@ -287,15 +311,18 @@ def ingest_rss(feed_url: str, source_name: str = "rss", db: Session | None = Non
             
             if content_id:
                 saved += 1
-                # Celery 태스크 큐잉 (I/O)
-                summarize_task.delay(content_id)
-                queued_tasks += 1
+                saved_ids.append(content_id)
             else:
                 duplicates += 1
         
         # 트랜잭션 커밋
         db.commit()
         
+        # 커밋 후 요약 태스크를 묶음 단위로 큐잉 (I/O)
+        for chunk in chunk_content_ids(saved_ids):
+            summarize_batch_task.delay(chunk)
+        queued_tasks = len(saved_ids)
+        
     except Exception as e:
         db.rollback()
         print(f"RSS 수집 중 에러 발생: {e}")
@@ -6,16 +6,256 @@
 """
 
 import asyncio
-import yfinance as yf
-import pykrx
+import bisect
+import functools
+import time
+from types import MappingProxyType
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Any, Mapping, Optional
+from datetime import date, datetime, time as dt_time, timedelta
+from zoneinfo import ZoneInfo
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 시장 시간대 (서머타임 자동 반영)
+_KST = ZoneInfo("Asia/Seoul")
+_NYC = ZoneInfo("America/New_York")
+
+# 초 단위 메모 캐시 (서비스 인스턴스가 요청마다 생성되므로 모듈 레벨에 둔다)
+_status_cache: Optional[tuple] = None
+_open_flags_cache: Optional[tuple] = None
+
+
+def _copy_status(status: Dict[str, Any]) -> Dict[str, Any]:
+    """시장 상태 딕셔너리를 복사합니다 (값은 시장별 딕셔너리 한 단계뿐이라 deepcopy 없이 복사)."""
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in status.items()}
+
+# 외부 시세 조회 캐시 및 동시 요청 합치기 (single-flight)
+_HISTORY_TTL = 30  # 초
+_HISTORY_CACHE_MAX = 256
+_UPSTREAM_CONCURRENCY = 4
+_history_cache: Dict[str, tuple] = {}
+_inflight: Dict[str, asyncio.Future] = {}
+_upstream_semaphore: Optional[asyncio.Semaphore] = None
+
+# pykrx 지수 코드 → 지수명
+_KOREAN_INDEX_CODES: Mapping[str, str] = MappingProxyType({
+    '1001': 'KOSPI',
+    '1028': 'KOSDAQ'
+})
+
+# Yahoo Finance 심볼 → 지수 정보
+_US_INDICES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    '^GSPC': MappingProxyType({'name': 'S&P 500', 'market': 'NYSE'}),
+    '^IXIC': MappingProxyType({'name': 'NASDAQ', 'market': 'NASDAQ'}),
+    '^DJI': MappingProxyType({'name': 'Dow Jones', 'market': 'NYSE'})
+})
+
+_GLOBAL_INDICES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    '^N225': MappingProxyType({'name': 'Nikkei 225', 'symbol': 'N225', 'market': 'NIKKEI'}),
+    '000001.SS': MappingProxyType({'name': 'Shanghai Composite', 'symbol': 'SSE', 'market': 'SSE'})
+})
+
+# 데이터 조회 실패 시 사용하는 폴백 데이터 (요청마다 재생성하지 않도록 상수로 둔다)
+_KOREAN_FALLBACK: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'KOSPI': MappingProxyType({'price': 2650.45, 'change': 12.34, 'change_percent': 0.47, 'volume': '450M'}),
+    'KOSDAQ': MappingProxyType({'price': 845.67, 'change': -8.23, 'change_percent': -0.96, 'volume': '320M'})
+})
+
+_US_FALLBACK: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    '^GSPC': MappingProxyType({'price': 4567.89, 'change': 23.45, 'change_percent': 0.52, 'volume': '2.1B'}),
+    '^IXIC': MappingProxyType({'price': 14234.56, 'change': -45.67, 'change_percent': -0.32, 'volume': '1.8B'}),
+    '^DJI': MappingProxyType({'price': 34567.89, 'change': -123.45, 'change_percent': -0.36, 'volume': '890M'})
+})
+
+_GLOBAL_FALLBACK: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    '^N225': MappingProxyType({'price': 32145.67, 'change': 89.12, 'change_percent': 0.28, 'volume': '890M'}),
+    '000001.SS': MappingProxyType({'price': 3123.45, 'change': -15.67, 'change_percent': -0.50, 'volume': '456M'})
+})
+
+# 기간별 Yahoo Finance 기간 설정
+_PERIOD_MAP: Mapping[str, str] = MappingProxyType({
+    '1D': '2d',
+    '1W': '5d',
+    '1M': '1mo',
+    'YTD': 'ytd',
+    '1Y': '1y'
+})
+
+# API 심볼 → Yahoo Finance 심볼
+_SYMBOL_MAP: Mapping[str, str] = MappingProxyType({
+    'KOSPI': '^KS11',
+    'KOSDAQ': '^KQ11',
+    'SPX': '^GSPC',
+    'NDX': '^IXIC',
+    'DJI': '^DJI',
+    'N225': '^N225',
+    'SSE': '000001.SS'
+})
+
+
+@functools.cache
+def _get_yf():
+    """yfinance를 처음 필요할 때 import 합니다 (앱 기동 시간/메모리 절감)."""
+    import yfinance
+    return yfinance
+
+
+@functools.cache
+def _get_krx_stock():
+    """pykrx.stock을 처음 필요할 때 import 합니다."""
+    from pykrx import stock
+    return stock
+
+
+@functools.cache
+def _get_yf_session() -> Any:
+    """
+    yfinance 요청이 공유하는 HTTP 세션을 생성합니다.
+    
+    모든 심볼/요청이 같은 세션을 사용하므로 TCP/TLS 연결이 재사용됩니다.
+    최신 yfinance는 curl_cffi 세션을 요구하므로 설치되어 있으면 우선 사용합니다.
+    """
+    try:
+        from curl_cffi import requests as curl_requests
+        return curl_requests.Session(impersonate="chrome")
+    except ImportError:
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+
+def _fetch_index_ohlcv(start_date: str, end_date: str, code: str) -> pd.DataFrame:
+    """pykrx 지수 OHLCV 조회 (스레드 풀에서 실행되므로 import 비용도 이벤트 루프 밖에서 발생)"""
+    return _get_krx_stock().get_index_ohlcv_by_date(start_date, end_date, code)
+
+
+@functools.lru_cache(maxsize=64)
+def _ticker(symbol: str) -> Any:
+    """심볼별 Ticker 객체를 재사용합니다 (세션 재생성 비용 절감)."""
+    return _get_yf().Ticker(symbol, session=_get_yf_session())
+
+
+@functools.lru_cache(maxsize=1)
+def _daily_schedule(date_key: date) -> Dict[str, List[datetime]]:
+    """
+    한국/미국 시장의 평일 개장·마감 시각 테이블을 생성합니다.
+    
+    하루에 한 번만 계산되며 (KST 날짜 기준), 미국 날짜가 하루 늦을 수 있으므로
+    전날부터 9일치를 만들어 주말을 지나도 다음 세션이 항상 포함되도록 합니다.
+    공휴일은 고려하지 않습니다.
+    
+    Parameters
+    ----------
+    date_key : date
+        KST 기준 오늘 날짜
+        
+    Returns
+    -------
+    Dict[str, List[datetime]]
+        kr_opens, kr_closes, us_opens, us_closes (시간순 정렬)
+    """
+    weekdays = [
+        day for day in (date_key + timedelta(days=offset) for offset in range(-1, 8))
+        if day.weekday() < 5
+    ]
+    return {
+        'kr_opens': [datetime.combine(day, dt_time(9, 0), _KST) for day in weekdays],
+        'kr_closes': [datetime.combine(day, dt_time(15, 30), _KST) for day in weekdays],
+        'us_opens': [datetime.combine(day, dt_time(9, 30), _NYC) for day in weekdays],
+        'us_closes': [datetime.combine(day, dt_time(16, 0), _NYC) for day in weekdays]
+    }
+
+
+def _get_upstream_semaphore() -> asyncio.Semaphore:
+    """외부 시세 API 동시 호출 수를 제한하는 세마포어"""
+    global _upstream_semaphore
+    
+    if _upstream_semaphore is None:
+        _upstream_semaphore = asyncio.Semaphore(_UPSTREAM_CONCURRENCY)
+    return _upstream_semaphore
+
+
+async def _cached_history(key: str, fetch: Callable[[], Any]) -> Any:
+    """
+    외부 시세 조회 결과를 TTL 캐시하고, 같은 키의 동시 요청은 하나로 합칩니다 (single-flight).
+    
+    Parameters
+    ----------
+    key : str
+        캐시 키 (데이터 소스/심볼/기간)
+    fetch : Callable[[], Any]
+        스레드 풀에서 실행할 블로킹 조회 함수
+        
+    Returns
+    -------
+    Any
+        조회 결과 (호출자 간에 공유되므로 변경하지 않아야 함)
+    """
+    cached = _history_cache.get(key)
+    if cached and time.monotonic() - cached[0] < _HISTORY_TTL:
+        return cached[1]
+    
+    # 이벤트 루프는 단일 스레드이므로 await 없이 확인/등록하는 구간은 원자적이다
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        return await asyncio.shield(inflight)
+    
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    _inflight[key] = future
+    try:
+        async with _get_upstream_semaphore():
+            result = await loop.run_in_executor(None, fetch)
+        if len(_history_cache) >= _HISTORY_CACHE_MAX:
+            # 임의 심볼 조회로 캐시가 무한히 커지지 않도록 초기화
+            _history_cache.clear()
+        _history_cache[key] = (time.monotonic(), result)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # 대기자가 없어도 미확인 예외 경고가 남지 않도록 조회 처리
+        raise
+    finally:
+        if not future.done():
+            future.cancel()
+        _inflight.pop(key, None)
+
+
+def _build_index_entry(
+    name: str,
+    symbol: str,
+    price: float,
+    change: float,
+    change_percent: float,
+    volume: str,
+    market: str,
+    last_updated: str,
+    is_market_open: bool
+) -> Dict[str, Any]:
+    """지수 응답 항목을 생성합니다 (실데이터/폴백 공통)."""
+    return {
+        'name': name,
+        'symbol': symbol,
+        'price': price,
+        'change': change,
+        'change_percent': change_percent,
+        'volume': volume,
+        'market': market,
+        'last_updated': last_updated,
+        'is_market_open': is_market_open
+    }
+
+
 class MarketDataService:
     """시장 데이터 서비스"""
     
@@ -26,20 +266,15 @@ class MarketDataService:
             'finnhub': 'https://finnhub.io/api/v1'
         }
     
-    def safe_calculate_change_percent(self, current: float, previous: float) -> float:
-        """안전한 변동률 계산"""
-        try:
-            if previous > 0 and not pd.isna(previous) and not pd.isna(current):
-                change_percent = round((current - previous) / previous * 100, 2)
-                if pd.isna(change_percent):
-                    return 0.0
-                return change_percent
-            return 0.0
-        except Exception:
-            return 0.0
-    
     def safe_format_volume(self, volume_val: Any) -> str:
         """안전한 거래량 포맷팅"""
+        if volume_val is None:
+            return "N/A"
+        # 파이썬 숫자는 pandas 디스패치 없이 바로 포맷팅 (NaN은 자기 자신과 같지 않음)
+        if isinstance(volume_val, (int, float)):
+            if volume_val == 0 or volume_val != volume_val:
+                return "N/A"
+            return format(int(volume_val), ',')
         try:
             if pd.isna(volume_val) or volume_val == 0:
                 return "N/A"
@@ -47,111 +282,95 @@ class MarketDataService:
         except Exception:
             return "N/A"
     
+    def _market_open_flags(self) -> Dict[str, bool]:
+        """
+        한국/미국 시장 개장 여부를 계산합니다.
+        
+        같은 초 안의 호출은 캐시된 결과를 공유합니다.
+        
+        Returns
+        -------
+        Dict[str, bool]
+            {'korean': 한국 시장 개장 여부, 'us': 미국 시장 개장 여부}
+        """
+        global _open_flags_cache
+        
+        now_s = int(time.time())
+        if _open_flags_cache and _open_flags_cache[0] == now_s:
+            return _open_flags_cache[1]
+        
+        # 한국 시간 (KST)
+        kst_time = datetime.now(_KST)
+        
+        # 시장 시간 체크 (한국 시장: 평일 09:00-15:30 KST)
+        kst_hhmm = kst_time.hour * 100 + kst_time.minute
+        korean_market_open = kst_time.weekday() < 5 and 900 <= kst_hhmm <= 1530
+        
+        # 미국 동부 시간 (EST/EDT)
+        est_time = datetime.now(_NYC)
+        
+        # 시장 시간 체크 (미국 시장: 평일 09:30-16:00 EST/EDT)
+        est_hhmm = est_time.hour * 100 + est_time.minute
+        us_market_open = est_time.weekday() < 5 and 930 <= est_hhmm < 1600
+        
+        flags = {'korean': korean_market_open, 'us': us_market_open}
+        _open_flags_cache = (now_s, flags)
+        return flags
+    
     async def get_korean_indices(self) -> List[Dict[str, Any]]:
         """한국 주요 지수 데이터 조회 (pykrx 사용)"""
         try:
             current_time = datetime.now()
+            ts_iso = current_time.isoformat()
             today = current_time.strftime('%Y%m%d')
+            # 주말/공휴일을 건너뛰어도 직전 영업일이 포함되도록 일주일 범위로 한 번에 조회
+            start_date = (current_time - timedelta(days=7)).strftime('%Y%m%d')
+            is_market_open = self._market_open_flags()['korean']
             
-            # 한국 시간대 고려 (UTC+9)
-            kst_time = current_time + timedelta(hours=9)
-            
-            # 시장 시간 체크 (한국 시장: 09:00-15:30 KST)
-            is_market_open = (
-                kst_time.weekday() < 5 and  # 평일
-                9 <= kst_time.hour < 15 or  # 09:00-15:00
-                (kst_time.hour == 15 and kst_time.minute <= 30)  # 15:30까지
+            # 지수별 조회를 스레드 풀에서 동시에 실행
+            results = await asyncio.gather(
+                *[
+                    _cached_history(
+                        f"krx:{code}:{start_date}:{today}",
+                        functools.partial(_fetch_index_ohlcv, start_date, today, code)
+                    )
+                    for code in _KOREAN_INDEX_CODES
+                ],
+                return_exceptions=True
             )
             
             indices = []
             
-            # KOSPI 지수
-            try:
-                kospi_data = pykrx.stock.get_index_ohlcv_by_date(today, today, "1001")
-                if not kospi_data.empty:
-                    latest = kospi_data.iloc[-1]
-                    prev_data = pykrx.stock.get_index_ohlcv_by_date(
-                        (datetime.now() - timedelta(days=1)).strftime('%Y%m%d'), 
-                        (datetime.now() - timedelta(days=1)).strftime('%Y%m%d'), 
-                        "1001"
-                    )
-                    
-                    if not prev_data.empty:
-                        prev_close = prev_data.iloc[-1]['종가']
-                        change = latest['종가'] - prev_close
-                        change_percent = self.safe_calculate_change_percent(latest['종가'], prev_close)
-                    else:
-                        change = 0
-                        change_percent = 0
-                    
-                    indices.append({
-                        'name': 'KOSPI',
-                        'symbol': 'KOSPI',
-                        'price': round(latest['종가'], 2),
-                        'change': round(change, 2),
-                        'change_percent': change_percent,
-                        'volume': self.safe_format_volume(latest['거래량']),
-                        'market': 'KOSPI',
-                        'last_updated': current_time.isoformat(),
-                        'is_market_open': is_market_open
-                    })
-            except Exception as e:
-                logger.warning(f"KOSPI 데이터 조회 실패: {str(e)}")
-                indices.append({
-                    'name': 'KOSPI',
-                    'symbol': 'KOSPI',
-                    'price': 2650.45,
-                    'change': 12.34,
-                    'change_percent': 0.47,
-                    'volume': '450M',
-                    'market': 'KOSPI',
-                    'last_updated': current_time.isoformat(),
-                    'is_market_open': is_market_open
-                })
-            
-            # KOSDAQ 지수
-            try:
-                kosdaq_data = pykrx.stock.get_index_ohlcv_by_date(today, today, "1028")
-                if not kosdaq_data.empty:
-                    latest = kosdaq_data.iloc[-1]
-                    prev_data = pykrx.stock.get_index_ohlcv_by_date(
-                        (datetime.now() - timedelta(days=1)).strftime('%Y%m%d'), 
-                        (datetime.now() - timedelta(days=1)).strftime('%Y%m%d'), 
-                        "1028"
-                    )
-                    
-                    if not prev_data.empty:
-                        prev_close = prev_data.iloc[-1]['종가']
-                        change = latest['종가'] - prev_close
-                        change_percent = self.safe_calculate_change_percent(latest['종가'], prev_close)
-                    else:
-                        change = 0
-                        change_percent = 0
-                    
-                    indices.append({
-                        'name': 'KOSDAQ',
-                        'symbol': 'KOSDAQ',
-                        'price': round(latest['종가'], 2),
-                        'change': round(change, 2),
-                        'change_percent': change_percent,
-                        'volume': self.safe_format_volume(latest['거래량']),
-                        'market': 'KOSDAQ',
-                        'last_updated': current_time.isoformat(),
-                        'is_market_open': is_market_open
-                    })
-            except Exception as e:
-                logger.warning(f"KOSDAQ 데이터 조회 실패: {str(e)}")
-                indices.append({
-                    'name': 'KOSDAQ',
-                    'symbol': 'KOSDAQ',
-                    'price': 845.67,
-                    'change': -8.23,
-                    'change_percent': -0.96,
-                    'volume': '320M',
-                    'market': 'KOSDAQ',
-                    'last_updated': current_time.isoformat(),
-                    'is_market_open': is_market_open
-                })
+            for (code, name), ohlcv in zip(_KOREAN_INDEX_CODES.items(), results):
+                if isinstance(ohlcv, Exception):
+                    logger.warning(f"{name} 데이터 조회 실패: {str(ohlcv)}")
+                    data = _KOREAN_FALLBACK[name]
+                    indices.append(_build_index_entry(
+                        name, name, data['price'], data['change'], data['change_percent'],
+                        data['volume'], name, ts_iso, is_market_open
+                    ))
+                    continue
+                
+                if ohlcv.empty:
+                    continue
+                
+                close = ohlcv['종가'].to_numpy()
+                volumes = ohlcv['거래량'].to_numpy()
+                
+                # JSON 직렬화 시 변환 비용이 없도록 NumPy 스칼라를 파이썬 float로 변환
+                latest_close = float(close[-1])
+                if len(close) >= 2:
+                    prev_close = float(close[-2])
+                    change = latest_close - prev_close
+                    change_percent = round((latest_close - prev_close) / prev_close * 100.0, 2) if prev_close else 0.0
+                else:
+                    change = 0.0
+                    change_percent = 0.0
+                
+                indices.append(_build_index_entry(
+                    name, name, round(latest_close, 2), round(change, 2), change_percent,
+                    self.safe_format_volume(float(volumes[-1])), name, ts_iso, is_market_open
+                ))
             
             return indices
             
@@ -159,97 +378,87 @@ class MarketDataService:
             logger.error(f"한국 지수 데이터 조회 실패: {str(e)}")
             return []
     
-    async def get_us_indices(self) -> List[Dict[str, Any]]:
-        """미국 주요 지수 데이터 조회 (Yahoo Finance 사용)"""
+    async def _download_history(self, symbols: List[str]) -> pd.DataFrame:
+        """
+        여러 Yahoo Finance 심볼의 최근 2일 데이터를 한 번의 요청으로 조회합니다.
+        
+        Parameters
+        ----------
+        symbols : List[str]
+            Yahoo Finance 심볼 목록
+            
+        Returns
+        -------
+        pd.DataFrame
+            심볼별 컬럼 그룹(MultiIndex)을 가진 데이터프레임, 실패 시 빈 데이터프레임
+        """
+        try:
+            return await _cached_history(
+                f"yf:{' '.join(symbols)}:2d",
+                lambda: _get_yf().download(
+                    ' '.join(symbols),
+                    period='2d',
+                    group_by='ticker',
+                    progress=False,
+                    threads=False,
+                    session=_get_yf_session()
+                )
+            )
+        except Exception as e:
+            logger.warning(f"{', '.join(symbols)} 일괄 조회 실패: {str(e)}")
+            return pd.DataFrame()
+    
+    async def get_us_indices(self, history: Optional[pd.DataFrame] = None) -> List[Dict[str, Any]]:
+        """
+        미국 주요 지수 데이터 조회 (Yahoo Finance 사용)
+        
+        Parameters
+        ----------
+        history : Optional[pd.DataFrame]
+            미리 일괄 조회한 데이터 (없으면 미국 지수만 조회)
+        """
         try:
             current_time = datetime.now()
+            ts_iso = current_time.isoformat()
+            is_market_open = self._market_open_flags()['us']
             
-            # 미국 동부 시간대 고려 (UTC-5)
-            est_time = current_time - timedelta(hours=5)
-            
-            # 시장 시간 체크 (미국 시장: 09:30-16:00 EST)
-            is_market_open = (
-                est_time.weekday() < 5 and  # 평일
-                9 <= est_time.hour < 16 or  # 09:30-16:00
-                (est_time.hour == 9 and est_time.minute >= 30)
-            )
+            if history is None:
+                history = await self._download_history(list(_US_INDICES))
             
             indices = []
             
-            # Yahoo Finance 심볼 매핑
-            symbols = {
-                '^GSPC': {'name': 'S&P 500', 'market': 'NYSE'},
-                '^IXIC': {'name': 'NASDAQ', 'market': 'NASDAQ'},
-                '^DJI': {'name': 'Dow Jones', 'market': 'NYSE'}
-            }
-            
-            for symbol, info in symbols.items():
+            for symbol, info in _US_INDICES.items():
+                entry = None
                 try:
-                    ticker = yf.Ticker(symbol)
-                    hist = ticker.history(period="2d")
+                    # 거래소별 거래일이 달라 생기는 빈 행 제거
+                    hist = history[symbol].dropna(subset=['Close'])
                     
-                    if not hist.empty and len(hist) >= 2:
-                        latest = hist.iloc[-1]
-                        prev = hist.iloc[-2]
-                        
-                        price = round(latest['Close'], 2)
-                        change = round(latest['Close'] - prev['Close'], 2)
-                        change_percent = self.safe_calculate_change_percent(latest['Close'], prev['Close'])
-                        volume = self.safe_format_volume(latest['Volume'])
+                    if len(hist) >= 2:
+                        close = hist['Close'].to_numpy()
+                        volumes = hist['Volume'].to_numpy()
                         
-                        indices.append({
-                            'name': info['name'],
-                            'symbol': symbol,
-                            'price': price,
-                            'change': change,
-                            'change_percent': change_percent,
-                            'volume': volume,
-                            'market': info['market'],
-                            'last_updated': current_time.isoformat(),
-                            'is_market_open': is_market_open
-                        })
-                    else:
-                        # 폴백 데이터
-                        fallback_data = {
-                            '^GSPC': {'price': 4567.89, 'change': 23.45, 'change_percent': 0.52, 'volume': '2.1B'},
-                            '^IXIC': {'price': 14234.56, 'change': -45.67, 'change_percent': -0.32, 'volume': '1.8B'},
-                            '^DJI': {'price': 34567.89, 'change': -123.45, 'change_percent': -0.36, 'volume': '890M'}
-                        }
-                        
-                        data = fallback_data[symbol]
-                        indices.append({
-                            'name': info['name'],
-                            'symbol': symbol,
-                            'price': data['price'],
-                            'change': data['change'],
-                            'change_percent': data['change_percent'],
-                            'volume': data['volume'],
-                            'market': info['market'],
-                            'last_updated': current_time.isoformat(),
-                            'is_market_open': is_market_open
-                        })
+                        latest_close = float(close[-1])
+                        prev_close = float(close[-2])
                         
+                        entry = _build_index_entry(
+                            info['name'], symbol,
+                            round(latest_close, 2),
+                            round(latest_close - prev_close, 2),
+                            round((latest_close - prev_close) / prev_close * 100.0, 2) if prev_close else 0.0,
+                            self.safe_format_volume(float(volumes[-1])),
+                            info['market'], ts_iso, is_market_open
+                        )
                 except Exception as e:
                     logger.warning(f"{symbol} 데이터 조회 실패: {str(e)}")
+                
+                if entry is None:
                     # 폴백 데이터
-                    fallback_data = {
-                        '^GSPC': {'price': 4567.89, 'change': 23.45, 'change_percent': 0.52, 'volume': '2.1B'},
-                        '^IXIC': {'price': 14234.56, 'change': -45.67, 'change_percent': -0.32, 'volume': '1.8B'},
-                        '^DJI': {'price': 34567.89, 'change': -123.45, 'change_percent': -0.36, 'volume': '890M'}
-                    }
-                    
-                    data = fallback_data[symbol]
-                    indices.append({
-                        'name': info['name'],
-                        'symbol': symbol,
-                        'price': data['price'],
-                        'change': data['change'],
-                        'change_percent': data['change_percent'],
-                        'volume': data['volume'],
-                        'market': info['market'],
-                        'last_updated': current_time.isoformat(),
-                        'is_market_open': is_market_open
-                    })
+                    data = _US_FALLBACK[symbol]
+                    entry = _build_index_entry(
+                        info['name'], symbol, data['price'], data['change'], data['change_percent'],
+                        data['volume'], info['market'], ts_iso, is_market_open
+                    )
+                indices.append(entry)
             
             return indices
             
@@ -257,113 +466,56 @@ class MarketDataService:
             logger.error(f"미국 지수 데이터 조회 실패: {str(e)}")
             return []
     
-    async def get_global_indices(self) -> List[Dict[str, Any]]:
-        """글로벌 주요 지수 데이터 조회 (Yahoo Finance 사용)"""
+    async def get_global_indices(self, history: Optional[pd.DataFrame] = None) -> List[Dict[str, Any]]:
+        """
+        글로벌 주요 지수 데이터 조회 (Yahoo Finance 사용)
+        
+        Parameters
+        ----------
+        history : Optional[pd.DataFrame]
+            미리 일괄 조회한 데이터 (없으면 글로벌 지수만 조회)
+        """
         try:
             current_time = datetime.now()
+            ts_iso = current_time.isoformat()
+            
+            if history is None:
+                history = await self._download_history(list(_GLOBAL_INDICES))
+            
             indices = []
             
-            # 일본 Nikkei 225
-            try:
-                nikkei = yf.Ticker("^N225")
-                hist = nikkei.history(period="2d")
-                
-                if not hist.empty and len(hist) >= 2:
-                    latest = hist.iloc[-1]
-                    prev = hist.iloc[-2]
-                    
-                    price = round(latest['Close'], 2)
-                    change = round(latest['Close'] - prev['Close'], 2)
-                    change_percent = self.safe_calculate_change_percent(latest['Close'], prev['Close'])
-                    volume = self.safe_format_volume(latest['Volume'])
+            for yf_symbol, info in _GLOBAL_INDICES.items():
+                entry = None
+                try:
+                    # 거래소별 거래일이 달라 생기는 빈 행 제거
+                    hist = history[yf_symbol].dropna(subset=['Close'])
                     
-                    indices.append({
-                        'name': 'Nikkei 225',
-                        'symbol': 'N225',
-                        'price': price,
-                        'change': change,
-                        'change_percent': change_percent,
-                        'volume': volume,
-                        'market': 'NIKKEI',
-                        'last_updated': current_time.isoformat(),
-                        'is_market_open': False
-                    })
-                else:
-                    indices.append({
-                        'name': 'Nikkei 225',
-                        'symbol': 'N225',
-                        'price': 32145.67,
-                        'change': 89.12,
-                        'change_percent': 0.28,
-                        'volume': '890M',
-                        'market': 'NIKKEI',
-                        'last_updated': current_time.isoformat(),
-                        'is_market_open': False
-                    })
-            except Exception as e:
-                logger.warning(f"Nikkei 225 데이터 조회 실패: {str(e)}")
-                indices.append({
-                    'name': 'Nikkei 225',
-                    'symbol': 'N225',
-                    'price': 32145.67,
-                    'change': 89.12,
-                    'change_percent': 0.28,
-                    'volume': '890M',
-                    'market': 'NIKKEI',
-                    'last_updated': current_time.isoformat(),
-                    'is_market_open': False
-                })
-            
-            # 중국 상해종합지수
-            try:
-                shanghai = yf.Ticker("000001.SS")
-                hist = shanghai.history(period="2d")
+                    if len(hist) >= 2:
+                        close = hist['Close'].to_numpy()
+                        volumes = hist['Volume'].to_numpy()
+                        
+                        latest_close = float(close[-1])
+                        prev_close = float(close[-2])
+                        
+                        entry = _build_index_entry(
+                            info['name'], info['symbol'],
+                            round(latest_close, 2),
+                            round(latest_close - prev_close, 2),
+                            round((latest_close - prev_close) / prev_close * 100.0, 2) if prev_close else 0.0,
+                            self.safe_format_volume(float(volumes[-1])),
+                            info['market'], ts_iso, False
+                        )
+                except Exception as e:
+                    logger.warning(f"{info['name']} 데이터 조회 실패: {str(e)}")
                 
-                if not hist.empty and len(hist) >= 2:
-                    latest = hist.iloc[-1]
-                    prev = hist.iloc[-2]
-                    
-                    price = round(latest['Close'], 2)
-                    change = round(latest['Close'] - prev['Close'], 2)
-                    change_percent = self.safe_calculate_change_percent(latest['Close'], prev['Close'])
-                    volume = self.safe_format_volume(latest['Volume'])
-                    
-                    indices.append({
-                        'name': 'Shanghai Composite',
-                        'symbol': 'SSE',
-                        'price': price,
-                        'change': change,
-                        'change_percent': change_percent,
-                        'volume': volume,
-                        'market': 'SSE',
-                        'last_updated': current_time.isoformat(),
-                        'is_market_open': False
-                    })
-                else:
-                    indices.append({
-                        'name': 'Shanghai Composite',
-                        'symbol': 'SSE',
-                        'price': 3123.45,
-                        'change': -15.67,
-                        'change_percent': -0.50,
-                        'volume': '456M',
-                        'market': 'SSE',
-                        'last_updated': current_time.isoformat(),
-                        'is_market_open': False
-                    })
-            except Exception as e:
-                logger.warning(f"상해종합지수 데이터 조회 실패: {str(e)}")
-                indices.append({
-                    'name': 'Shanghai Composite',
-                    'symbol': 'SSE',
-                    'price': 3123.45,
-                    'change': -15.67,
-                    'change_percent': -0.50,
-                    'volume': '456M',
-                    'market': 'SSE',
-                    'last_updated': current_time.isoformat(),
-                    'is_market_open': False
-                })
+                if entry is None:
+                    # 폴백 데이터
+                    data = _GLOBAL_FALLBACK[yf_symbol]
+                    entry = _build_index_entry(
+                        info['name'], info['symbol'], data['price'], data['change'], data['change_percent'],
+                        data['volume'], info['market'], ts_iso, False
+                    )
+                indices.append(entry)
             
             return indices
             
@@ -371,17 +523,21 @@ class MarketDataService:
             logger.error(f"글로벌 지수 데이터 조회 실패: {str(e)}")
             return []
     
-    async def get_all_indices(self) -> List[Dict[str, Any]]:
+    async def get_all_indices(self) -> Dict[str, Any]:
         """모든 주요 지수 데이터 조회"""
         try:
-            # 모든 지수 데이터를 병렬로 조회
-            korean_indices, us_indices, global_indices = await asyncio.gather(
+            # 한국 지수와 Yahoo Finance 지수를 병렬로 조회 (Yahoo 지수는 한 번의 요청으로 일괄 조회)
+            korean_indices, yahoo_history = await asyncio.gather(
                 self.get_korean_indices(),
-                self.get_us_indices(),
-                self.get_global_indices()
+                self._download_history(list(_US_INDICES) + list(_GLOBAL_INDICES))
             )
+            us_indices = await self.get_us_indices(yahoo_history)
+            global_indices = await self.get_global_indices(yahoo_history)
             
-            all_indices = korean_indices + us_indices + global_indices
+            all_indices = []
+            all_indices.extend(korean_indices)
+            all_indices.extend(us_indices)
+            all_indices.extend(global_indices)
             
             return {
                 "market": "ALL",
@@ -391,48 +547,42 @@ class MarketDataService:
             }
         except Exception as e:
             logger.error(f"전체 지수 데이터 조회 실패: {str(e)}")
-            return []
+            return {
+                "market": "ALL",
+                "indices": [],
+                "total_count": 0,
+                "generated_at": datetime.now().isoformat()
+            }
     
     async def get_index_by_period(self, symbol: str, period: str) -> Dict[str, Any]:
         """특정 지수의 기간별 데이터 조회"""
         current_time = datetime.now()
+        ts_iso = current_time.isoformat()
+        today_str = current_time.strftime('%Y-%m-%d')
         
-        # 기간별 Yahoo Finance 기간 설정
-        period_mapping = {
-            '1D': '2d',
-            '1W': '5d', 
-            '1M': '1mo',
-            'YTD': 'ytd',
-            '1Y': '1y'
-        }
-        
-        yf_period = period_mapping.get(period, '2d')
-        
-        # 심볼 매핑
-        symbol_mapping = {
-            'KOSPI': '^KS11',
-            'KOSDAQ': '^KQ11', 
-            'SPX': '^GSPC',
-            'NDX': '^IXIC',
-            'DJI': '^DJI',
-            'N225': '^N225',
-            'SSE': '000001.SS'
-        }
-        
-        yf_symbol = symbol_mapping.get(symbol, symbol)
+        yf_period = _PERIOD_MAP.get(period, '2d')
+        yf_symbol = _SYMBOL_MAP.get(symbol, symbol)
         
         try:
-            ticker = yf.Ticker(yf_symbol)
-            hist = ticker.history(period=yf_period)
+            # 시작/끝 값만 필요하므로 배당/분할 이벤트는 받지 않는다
+            hist = await _cached_history(
+                f"yf:{yf_symbol}:{yf_period}",
+                lambda: _ticker(yf_symbol).history(period=yf_period, interval='1d', actions=False)
+            )
             
             if not hist.empty and len(hist) >= 2:
-                latest = hist.iloc[-1]
-                first = hist.iloc[0]
+                # 행 단위 Series 생성 없이 필요한 컬럼만 NumPy 배열로 추출
+                close = hist['Close'].to_numpy(copy=False)
+                volumes = hist['Volume'].to_numpy(copy=False)
+                dates = hist.index
+                
+                latest_close = float(close[-1])
+                first_close = float(close[0])
                 
-                current_price = round(latest['Close'], 2)
-                change = round(latest['Close'] - first['Close'], 2)
-                change_percent = self.safe_calculate_change_percent(latest['Close'], first['Close'])
-                volume = self.safe_format_volume(latest['Volume'])
+                current_price = round(latest_close, 2)
+                change = round(latest_close - first_close, 2)
+                change_percent = round((latest_close - first_close) / first_close * 100.0, 2) if first_close else 0.0
+                volume = self.safe_format_volume(float(volumes[-1]))
                 
                 return {
                     'symbol': symbol,
@@ -441,9 +591,9 @@ class MarketDataService:
                     'change': change,
                     'change_percent': change_percent,
                     'volume': volume,
-                    'start_date': first.name.strftime('%Y-%m-%d'),
-                    'end_date': latest.name.strftime('%Y-%m-%d'),
-                    'last_updated': current_time.isoformat()
+                    'start_date': dates[0].strftime('%Y-%m-%d'),
+                    'end_date': dates[-1].strftime('%Y-%m-%d'),
+                    'last_updated': ts_iso
                 }
             else:
                 return {
@@ -453,9 +603,9 @@ class MarketDataService:
                     'change': 0.0,
                     'change_percent': 0.0,
                     'volume': 'N/A',
-                    'start_date': current_time.strftime('%Y-%m-%d'),
-                    'end_date': current_time.strftime('%Y-%m-%d'),
-                    'last_updated': current_time.isoformat()
+                    'start_date': today_str,
+                    'end_date': today_str,
+                    'last_updated': ts_iso
                 }
                 
         except Exception as e:
@@ -467,58 +617,48 @@ class MarketDataService:
                 'change': 0.0,
                 'change_percent': 0.0,
                 'volume': 'N/A',
-                'start_date': current_time.strftime('%Y-%m-%d'),
-                'end_date': current_time.strftime('%Y-%m-%d'),
-                'last_updated': current_time.isoformat()
+                'start_date': today_str,
+                'end_date': today_str,
+                'last_updated': ts_iso
             }
     
     def get_market_status(self) -> Dict[str, Any]:
-        """시장 상태 정보 조회"""
+        """시장 상태 정보 조회 (1초 TTL 메모, 호출자가 수정해도 캐시가 바뀌지 않도록 복사본 반환)"""
+        global _status_cache
+        
+        now_s = int(time.time())
+        if _status_cache and _status_cache[0] == now_s:
+            return _copy_status(_status_cache[1])
+        
         try:
             current_time = datetime.now()
             
-            # 한국 시장 시간 (KST = UTC+9)
-            kst_time = current_time + timedelta(hours=9)
-            korean_market_open = (
-                kst_time.weekday() < 5 and  # 평일
-                9 <= kst_time.hour < 15 or  # 09:00-15:00
-                (kst_time.hour == 15 and kst_time.minute <= 30)  # 15:30까지
-            )
+            # 한국 시장 시간 (KST)
+            kst_time = datetime.now(_KST)
+            open_flags = self._market_open_flags()
+            korean_market_open = open_flags['korean']
+            us_market_open = open_flags['us']
             
-            # 미국 시장 시간 (EST = UTC-5)
-            est_time = current_time - timedelta(hours=5)
-            us_market_open = (
-                est_time.weekday() < 5 and  # 평일
-                9 <= est_time.hour < 16 or  # 09:30-16:00
-                (est_time.hour == 9 and est_time.minute >= 30)
-            )
+            # 다음 개장/마감 시간: 아직 마감되지 않은 첫 세션 (장중이면 현재 세션)
+            schedule = _daily_schedule(kst_time.date())
+            kr_idx = bisect.bisect_right(schedule['kr_closes'], kst_time)
+            us_idx = bisect.bisect_right(schedule['us_closes'], kst_time)
             
-            # 다음 개장/마감 시간 계산
-            next_korean_open = datetime(current_time.year, current_time.month, current_time.day, 0, 0, 0) + timedelta(hours=9)
-            if kst_time.hour >= 15 and kst_time.minute > 30:
-                next_korean_open += timedelta(days=1)
-                if next_korean_open.weekday() >= 5:
-                    next_korean_open += timedelta(days=(7 - next_korean_open.weekday()))
-            
-            next_us_open = datetime(current_time.year, current_time.month, current_time.day, 14, 30, 0)
-            if est_time.hour >= 16:
-                next_us_open += timedelta(days=1)
-                if next_us_open.weekday() >= 5:
-                    next_us_open += timedelta(days=(7 - next_us_open.weekday()))
-            
-            return {
+            status = {
                 "korean_market": {
                     "is_open": korean_market_open,
-                    "next_open": next_korean_open.isoformat(),
-                    "next_close": (next_korean_open + timedelta(hours=6, minutes=30)).isoformat()
+                    "next_open": schedule['kr_opens'][kr_idx].isoformat(),
+                    "next_close": schedule['kr_closes'][kr_idx].isoformat()
                 },
                 "us_market": {
                     "is_open": us_market_open,
-                    "next_open": next_us_open.isoformat(),
-                    "next_close": (next_us_open + timedelta(hours=6, minutes=30)).isoformat()
+                    "next_open": schedule['us_opens'][us_idx].isoformat(),
+                    "next_close": schedule['us_closes'][us_idx].isoformat()
                 },
                 "last_updated": current_time.isoformat()
             }
+            _status_cache = (now_s, status)
+            return _copy_status(status)
         except Exception as e:
             logger.error(f"시장 상태 조회 실패: {str(e)}")
             return {
@@ -6,22 +6,288 @@
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func, and_
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from sqlalchemy import DateTime, Interval, desc, func, and_, case, select, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime
+import asyncio
+import httpx
 import logging
+import orjson
 
-from ..models.content import Content, AICache
+import numpy as np
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:  # numba는 선택 의존성 (없으면 NumPy 경로 사용)
+    numba = None
+    _NUMBA_AVAILABLE = False
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken은 선택 의존성 (없으면 글자 수 기준으로 자름)
+    tiktoken = None
+
+from ..models.content import Content, AICache, SOURCE_SCORES
 from ..models.cost_log import CostLog
 from ..utils.cost_calculator import calculate_openai_cost
+from ..utils.fingerprint import content_fingerprint, normalize_text
 from ..core.config import settings
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
-# OpenAI 클라이언트 설정
-client = OpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
 MODEL_VERSION = "gpt-3.5-turbo"
+MAX_CONCURRENT_SUMMARIES = 5  # 동시에 진행할 OpenAI 요청 수
+SUMMARY_RUN_TIMEOUT = 300  # 한 번 실행에서 요약을 기다릴 최대 시간 (초, 지나면 끝난 요약만 저장)
+TITLE_CACHE_FALLBACK_HOURS = 48  # 제목으로 캐시를 빌려올 콘텐츠의 최대 경과 시간
+TITLE_CACHE_MIN_CHARS = 20  # 지문이 다를 때 제목만으로 캐시를 빌려올 최소 제목 길이 (정규화 후, "속보" 같은 일반 제목 제외)
+MAX_PROMPT_CONTENT_TOKENS = 1500  # 프롬프트에 넣을 본문 최대 토큰 수
+MAX_PROMPT_CONTENT_CHARS = 2000  # tiktoken이 없을 때 사용할 본문 최대 글자 수
+
+# 본문 길이를 토큰 기준으로 제한하기 위한 인코더 (모델별로 한 번만 로드)
+try:
+    ENC = tiktoken.encoding_for_model(MODEL_VERSION) if tiktoken else None
+except Exception as e:  # 인코딩 파일을 받을 수 없는 환경 등
+    logger.warning(f"tiktoken 인코더 로드 실패, 글자 수 기준으로 자릅니다: {str(e)}")
+    ENC = None
+
+# 요약 프롬프트 (고정 부분은 한 번만 만들고 기사별 값만 format_map으로 채움)
+PROMPT_TEMPLATE = """
+다음 뉴스 기사를 분석하여 요약해주세요:
+
+제목: {title}
+내용: {content}
+언어: {lang}
+출처: {source}
+
+다음 JSON 형식으로 응답해주세요:
+{{
+    "summary_bullets": [
+        "핵심 내용 1",
+        "핵심 내용 2", 
+        "핵심 내용 3",
+        "핵심 내용 4",
+        "핵심 내용 5"
+    ],
+    "tags": ["태그1", "태그2", "태그3", "태그4", "태그5"],
+    "insight": "이 뉴스가 시장에 미칠 영향과 투자 관점에서의 분석 (2-3문장)"
+}}
+
+주의사항:
+- summary_bullets는 최대 5개까지
+- tags는 관련 키워드 5개까지
+- insight는 구체적이고 실용적인 분석
+- JSON 형식으로만 응답
+"""
+
+# 인기 뉴스 조회/요약/응답에 필요한 컬럼 (ORM 객체 대신 Core 행으로 조회)
+POPULAR_NEWS_COLUMNS = (
+    Content.id,
+    Content.hash,
+    Content.title,
+    Content.raw_text,
+    Content.url,
+    Content.source,
+    Content.source_key,
+    Content.lang,
+    Content.published_at,
+    Content.view_count,
+    Content.like_count,
+    Content.share_count,
+    Content.comment_count,
+    Content.ai_summary_status,
+    Content.ai_summarized_at,
+    Content.popularity_score,
+)
+
+# 벡터화 채점용 구간 경계/점수 (analyze_popularity_score와 같은 규칙)
+_ENGAGEMENT_RATE_EDGES = (0.1, 0.05, 0.02, 0.01)
+_ENGAGEMENT_POINTS = (50.0, 40.0, 30.0, 20.0)
+_VIEW_EDGES = np.array([500, 1000, 2000, 5000, 10000])
+_VIEW_POINTS = np.array([2.0, 5.0, 10.0, 15.0, 20.0, 25.0])
+_HOURS_EDGES = np.array([1.0, 6.0, 24.0, 72.0])
+_HOURS_POINTS = np.array([15.0, 12.0, 8.0, 4.0, 1.0])
+_NUMBA_MIN_ROWS = 10_000  # 이 이상일 때만 JIT 커널 사용 (적은 행은 NumPy가 충분히 빠름)
+
+
+def _db_hours_ago(hours: int):
+    """
+    DB 시계 기준 `hours`시간 전 시각(UTC, timezone 없음)의 SQL 식을 반환합니다.
+    
+    published_at은 UTC naive 값으로 저장되므로 NOW()를 UTC로 변환해 비교합니다.
+    앱 서버와 DB의 시계 차이에 영향을 받지 않고, 한 트랜잭션 안에서는 같은 기준 시각을 씁니다.
+    
+    Parameters
+    ----------
+    hours : int
+        기준 시각에서 뺄 시간
+        
+    Returns
+    -------
+    ColumnElement
+        `timezone('UTC', now()) - make_interval(hours => hours)` 식
+    """
+    utc_now = func.timezone("UTC", func.now(), type_=DateTime)
+    return utc_now - func.make_interval(0, 0, 0, 0, hours, type_=Interval)
+
+
+def _truncate_prompt_content(text: Optional[str]) -> str:
+    """
+    프롬프트에 넣을 본문을 토큰 수 기준으로 자릅니다.
+    
+    한글/영문이 섞인 본문은 글자 수가 같아도 토큰 수가 크게 달라지므로,
+    인코더가 있으면 MAX_PROMPT_CONTENT_TOKENS 토큰까지만 남깁니다.
+    
+    Parameters
+    ----------
+    text : Optional[str]
+        원본 본문
+        
+    Returns
+    -------
+    str
+        잘린 본문
+    """
+    if not text:
+        return ""
+    if ENC is None:
+        return text[:MAX_PROMPT_CONTENT_CHARS]
+    
+    tokens = ENC.encode(text)
+    if len(tokens) <= MAX_PROMPT_CONTENT_TOKENS:
+        return text
+    return ENC.decode(tokens[:MAX_PROMPT_CONTENT_TOKENS])
+
+
+def score_batch(contents: List[Any], now: Optional[datetime] = None) -> np.ndarray:
+    """
+    여러 콘텐츠의 인기도 점수를 NumPy로 한 번에 계산합니다.
+    
+    PopularNewsAnalyzer.analyze_popularity_score와 같은 점수를 내며,
+    대량 재채점처럼 행 수가 많을 때 행 단위 파이썬 분기를 배열 연산으로 대체합니다.
+    
+    Parameters
+    ----------
+    contents : List[Any]
+        view_count, like_count, share_count, comment_count, published_at,
+        source_key 속성을 가진 콘텐츠 (ORM 객체 또는 행)
+    now : Optional[datetime]
+        기준 시각 (UTC)
+        
+    Returns
+    -------
+    np.ndarray
+        콘텐츠 순서대로의 인기도 점수 (0-100)
+    """
+    if not contents:
+        return np.zeros(0)
+    
+    now = now or datetime.utcnow()
+    
+    view_count = np.array([c.view_count or 0 for c in contents], dtype=np.float64)
+    engagement = np.array(
+        [(c.like_count or 0) + (c.share_count or 0) + (c.comment_count or 0) for c in contents],
+        dtype=np.float64
+    )
+    hours_ago = np.array(
+        [(now - c.published_at).total_seconds() / 3600 if c.published_at else np.nan for c in contents],
+        dtype=np.float64
+    )
+    source_score = np.array([SOURCE_SCORES.get(c.source_key, 5.0) for c in contents])
+    
+    if _NUMBA_AVAILABLE and len(contents) >= _NUMBA_MIN_ROWS:
+        return _score_batch_numba(view_count, engagement, hours_ago, source_score)
+    
+    # 1. 참여도 - 50점 (조회수 0이면 0점)
+    rate = engagement / np.maximum(view_count, 1.0)
+    engagement_score = np.select(
+        [view_count == 0] + [rate >= edge for edge in _ENGAGEMENT_RATE_EDGES],
+        (0.0,) + _ENGAGEMENT_POINTS,
+        default=10.0
+    )
+    
+    # 2. 조회수 - 25점
+    view_score = np.where(
+        view_count > 0,
+        _VIEW_POINTS[np.searchsorted(_VIEW_EDGES, view_count, side='right')],
+        0.0
+    )
+    
+    # 3. 최신성 - 15점 (발행일 없으면 0점)
+    missing = np.isnan(hours_ago)
+    time_score = np.where(
+        missing,
+        0.0,
+        _HOURS_POINTS[np.searchsorted(_HOURS_EDGES, np.where(missing, 0.0, hours_ago), side='left')]
+    )
+    
+    return np.minimum(engagement_score + view_score + time_score + source_score, 100.0)
+
+
+if _NUMBA_AVAILABLE:
+    @numba.njit(cache=True, parallel=True)
+    def _score_batch_numba(view_count, engagement, hours_ago, source_score):
+        """score_batch의 JIT 컴파일 커널 (행 단위 분기를 기계어로 병렬 실행)"""
+        n = view_count.shape[0]
+        scores = np.empty(n, dtype=np.float64)
+        for i in numba.prange(n):
+            views = view_count[i]
+            
+            # 1. 참여도 - 50점
+            if views == 0:
+                score = 0.0
+            else:
+                rate = engagement[i] / views
+                if rate >= 0.1:
+                    score = 50.0
+                elif rate >= 0.05:
+                    score = 40.0
+                elif rate >= 0.02:
+                    score = 30.0
+                elif rate >= 0.01:
+                    score = 20.0
+                else:
+                    score = 10.0
+            
+            # 2. 조회수 - 25점
+            if views >= 10000:
+                score += 25.0
+            elif views >= 5000:
+                score += 20.0
+            elif views >= 2000:
+                score += 15.0
+            elif views >= 1000:
+                score += 10.0
+            elif views >= 500:
+                score += 5.0
+            elif views > 0:
+                score += 2.0
+            
+            # 3. 최신성 - 15점 (NaN = 발행일 없음)
+            hours = hours_ago[i]
+            if hours == hours:
+                if hours <= 1.0:
+                    score += 15.0
+                elif hours <= 6.0:
+                    score += 12.0
+                elif hours <= 24.0:
+                    score += 8.0
+                elif hours <= 72.0:
+                    score += 4.0
+                else:
+                    score += 1.0
+            
+            # 4. 소스 신뢰도 - 10점
+            score += source_score[i]
+            
+            scores[i] = min(score, 100.0)
+        return scores
+    
+    # 첫 요청에서 컴파일 지연이 생기지 않도록 import 시점에 미리 컴파일
+    _score_batch_numba(np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1))
 
 
 class PopularNewsAnalyzer:
@@ -30,9 +296,68 @@ class PopularNewsAnalyzer:
     def __init__(self, db: Session):
         self.db = db
     
-    def get_popular_news(self, limit: int = 10, hours: int = 24) -> List[Content]:
+    def _popularity_score_expr(self):
         """
-        인기 뉴스 목록을 조회합니다.
+        analyze_popularity_score와 같은 규칙의 인기도 점수를 SQL 식으로 생성합니다.
+        
+        참여율은 나눗셈 대신 곱셈 비교로, 시간 가중치는 published_at 구간 비교로
+        표현하여 DB가 행마다 한 번에 계산할 수 있도록 합니다. 기준 시각은
+        DB의 NOW()를 사용합니다 (_db_hours_ago 참고).
+            
+        Returns
+        -------
+        ColumnElement
+            0-100 범위의 인기도 점수 식
+        """
+        view_count = func.coalesce(Content.view_count, 0)
+        total_engagement = (
+            func.coalesce(Content.like_count, 0)
+            + func.coalesce(Content.share_count, 0)
+            + func.coalesce(Content.comment_count, 0)
+        )
+        
+        # 1. 소셜 미디어 참여도 - 50점
+        engagement_score = case(
+            (view_count == 0, 0.0),
+            (total_engagement >= view_count * 0.1, 50.0),
+            (total_engagement >= view_count * 0.05, 40.0),
+            (total_engagement >= view_count * 0.02, 30.0),
+            (total_engagement >= view_count * 0.01, 20.0),
+            else_=10.0
+        )
+        
+        # 2. 조회수 기반 점수 - 25점
+        view_score = case(
+            (view_count >= 10000, 25.0),
+            (view_count >= 5000, 20.0),
+            (view_count >= 2000, 15.0),
+            (view_count >= 1000, 10.0),
+            (view_count >= 500, 5.0),
+            (view_count > 0, 2.0),
+            else_=0.0
+        )
+        
+        # 3. 시간 가중치 (최신성) - 15점
+        time_score = case(
+            (Content.published_at.is_(None), 0.0),
+            (Content.published_at >= _db_hours_ago(1), 15.0),
+            (Content.published_at >= _db_hours_ago(6), 12.0),
+            (Content.published_at >= _db_hours_ago(24), 8.0),
+            (Content.published_at >= _db_hours_ago(72), 4.0),
+            else_=1.0
+        )
+        
+        # 4. 소스 신뢰도 - 10점
+        source_score = case(SOURCE_SCORES, value=Content.source_key, else_=5.0)
+        
+        return func.least(engagement_score + view_score + time_score + source_score, 100.0)
+    
+    def get_popular_news_with_scores(self, limit: int = 10, hours: int = 24) -> List[Tuple[Row, float]]:
+        """
+        인기 뉴스 목록을 인기도 점수와 함께 조회합니다.
+        
+        쓰기 시점에 갱신된 popularity_score 컬럼으로 정렬하므로 조회 시 점수를
+        다시 계산하지 않으며, ORM 객체 대신 POPULAR_NEWS_COLUMNS만 담은 행을 반환합니다.
         
         Parameters
         ----------
@@ -43,45 +368,80 @@ class PopularNewsAnalyzer:
             
         Returns
         -------
-        List[Content]
-            인기 뉴스 목록
+        List[Tuple[Row, float]]
+            (뉴스 행, 인기도 점수) 목록 (점수 내림차순)
         """
-        # 최근 24시간 내의 뉴스
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        
-        # 인기도 점수 계산 (언급 횟수, 최신성, 소스 신뢰도 등)
-        popular_news = self.db.query(Content).filter(
+        stmt = select(*POPULAR_NEWS_COLUMNS).where(
             and_(
-                Content.published_at >= cutoff_time,
-                Content.is_active == True
+                Content.published_at >= _db_hours_ago(hours),
+                Content.is_active == "active"
             )
         ).order_by(
-            # 최신성 (최근 1시간 내는 가중치 2배)
-            func.case(
-                (Content.published_at >= datetime.utcnow() - timedelta(hours=1), 2),
-                else_=1
-            ) * func.extract('epoch', Content.published_at).desc(),
-            # 제목 길이 (적절한 길이의 제목 선호)
-            func.length(Content.title).desc(),
-            # 소스별 가중치
-            func.case(
-                (Content.source.like('%hankyung%'), 1.5),
-                (Content.source.like('%yahoo%'), 1.2),
-                (Content.source.like('%coindesk%'), 1.1),
-                else_=1.0
-            ).desc()
-        ).limit(limit).all()
-        
-        return popular_news
-    
-    def analyze_popularity_score(self, content: Content) -> float:
+            desc(Content.popularity_score)
+        ).limit(limit)
+        
+        rows = self.db.execute(stmt).all()
+        
+        return [(row, float(row.popularity_score or 0.0)) for row in rows]
+    
+    def refresh_popularity_scores(self, hours: Optional[int] = 168) -> int:
+        """
+        최근 콘텐츠의 popularity_score를 다시 계산합니다.
+        
+        최신성 점수는 시간이 지나면 바뀌므로 주기적으로 실행합니다.
+        DB에서 한 번의 UPDATE 문으로 처리되어 행을 가져오지 않습니다.
+        
+        Parameters
+        ----------
+        hours : Optional[int]
+            재계산할 기간 (기본값: 168시간 = 인기 뉴스 API 최대 조회 기간).
+            None이면 전체 콘텐츠를 재계산 (컬럼 추가 후 1회성 백필용)
+            
+        Returns
+        -------
+        int
+            갱신된 콘텐츠 수
+        """
+        stmt = update(Content).values(popularity_score=self._popularity_score_expr())
+        if hours is not None:
+            # 72시간 경계를 넘어간 콘텐츠도 최신성 점수가 갱신되도록 하루 여유를 둔다
+            stmt = stmt.where(Content.published_at >= _db_hours_ago(max(hours, 72) + 24))
+        result = self.db.execute(stmt)
+        self.db.commit()
+        
+        return result.rowcount
+    
+    def get_popular_news(self, limit: int = 10, hours: int = 24) -> List[Row]:
+        """
+        인기 뉴스 목록을 조회합니다.
+        
+        Parameters
+        ----------
+        limit : int
+            조회할 개수 (기본값: 10)
+        hours : int
+            최근 몇 시간 내의 뉴스 (기본값: 24)
+            
+        Returns
+        -------
+        List[Row]
+            인기 뉴스 목록 (POPULAR_NEWS_COLUMNS 행)
+        """
+        return [content for content, _ in self.get_popular_news_with_scores(limit, hours)]
+    
+    def analyze_popularity_score(self, content: Content, now: Optional[datetime] = None) -> float:
         """
         뉴스의 인기도 점수를 계산합니다. (소셜 미디어 메트릭 기반)
         
+        일괄 재계산에서는 같은 규칙의 SQL 식(_popularity_score_expr)을 사용하며,
+        이 메서드는 개별 콘텐츠용 파이썬 구현입니다.
+        
         Parameters
         ----------
         content : Content
             뉴스 콘텐츠
+        now : Optional[datetime]
+            기준 시각 (UTC, 여러 건을 채점할 때 한 번만 구해 전달)
             
         Returns
         -------
@@ -99,11 +459,11 @@ class PopularNewsAnalyzer:
         score += view_score
         
         # 3. 시간 가중치 (최신성) - 15점
-        time_score = self._calculate_time_score(content.published_at)
+        time_score = self._calculate_time_score(content.published_at, now or datetime.utcnow())
         score += time_score
         
         # 4. 소스 신뢰도 - 10점
-        source_score = self._calculate_source_score(content.source)
+        source_score = self._calculate_source_score(content.source_key)
         score += source_score
         
         return min(score, 100.0)  # 최대 100점
@@ -148,12 +508,12 @@ class PopularNewsAnalyzer:
         else:
             return 2.0   # 그 외
     
-    def _calculate_time_score(self, published_at: datetime) -> float:
+    def _calculate_time_score(self, published_at: datetime, now: datetime) -> float:
         """시간 가중치 점수 계산 (15점 만점)"""
         if not published_at:
             return 0.0
         
-        hours_ago = (datetime.utcnow() - published_at).total_seconds() / 3600
+        hours_ago = (now - published_at).total_seconds() / 3600
         
         if hours_ago <= 1:
             return 15.0  # 최근 1시간 내
@@ -166,27 +526,118 @@ class PopularNewsAnalyzer:
         else:
             return 1.0   # 그 외
     
-    def _calculate_source_score(self, source: str) -> float:
+    def _calculate_source_score(self, source_key: str) -> float:
         """소스 신뢰도 점수 계산 (10점 만점)"""
-        if not source:
-            return 0.0
+        return SOURCE_SCORES.get(source_key, 5.0)
+    
+    def _load_cached_summaries(self, contents: List[Content]) -> Dict[str, AICache]:
+        """
+        여러 콘텐츠의 AI 캐시를 한 번의 IN 쿼리로 조회합니다.
         
-        source_lower = source.lower()
-        
-        if 'hankyung' in source_lower:
-            return 10.0  # 한국경제
-        elif 'yahoo' in source_lower:
-            return 8.0   # Yahoo Finance
-        elif 'coindesk' in source_lower:
-            return 7.0   # CoinDesk
-        elif 'bloomberg' in source_lower:
-            return 9.0   # Bloomberg
-        elif 'reuters' in source_lower:
-            return 8.5   # Reuters
-        else:
-            return 5.0   # 기타
+        해시가 일치하는 캐시가 없으면 최근 TITLE_CACHE_FALLBACK_HOURS시간 안에 제목이
+        같은 다른 콘텐츠(여러 매체에 실린 같은 기사 등)의 캐시를 대신 사용해 중복 요약
+        요청을 줄입니다. 같은 제목의 캐시가 여럿이면 가장 최근 것을 쓰고, 지문(content_fp)이
+        같거나 제목이 TITLE_CACHE_MIN_CHARS자 이상일 때만 빌려옵니다. 빌려온 캐시는 이
+        콘텐츠의 해시로 복사해 두고 콘텐츠를 요약 완료로 표시하므로, 다음 조회부터는
+        해시 조회로 바로 찾습니다.
+        
+        Parameters
+        ----------
+        contents : List[Content]
+            뉴스 콘텐츠 목록
+            
+        Returns
+        -------
+        Dict[str, AICache]
+            콘텐츠 해시 → 캐시 엔트리
+        """
+        hashes = [content.hash for content in contents]
+        if not hashes:
+            return {}
+        
+        rows = self.db.query(AICache).filter(
+            AICache.model_version == MODEL_VERSION,
+            AICache.content_hash.in_(hashes)
+        ).all()
+        
+        cache_map = {row.content_hash: row for row in rows}
+        
+        # 해시 캐시가 없는 콘텐츠는 같은 제목으로 요약된 최근 캐시를 한 번 더 조회
+        missing: Dict[str, List[Content]] = {}
+        for content in contents:
+            if content.hash not in cache_map:
+                missing.setdefault(content.title, []).append(content)
+        if missing:
+            title_rows = self.db.execute(
+                select(Content.title, AICache)
+                .join(AICache, AICache.content_hash == Content.hash)
+                .where(
+                    AICache.model_version == MODEL_VERSION,
+                    Content.title.in_(list(missing)),
+                    Content.published_at >= _db_hours_ago(TITLE_CACHE_FALLBACK_HOURS)
+                )
+                .order_by(AICache.created_at.desc())
+            ).all()
+            fingerprints: Dict[str, str] = {}
+            adopted: Dict[str, Tuple[Content, AICache, str]] = {}
+            for title, cache_entry in title_rows:
+                title_is_specific = len(normalize_text(title)) >= TITLE_CACHE_MIN_CHARS
+                for content in missing[title]:
+                    if content.hash in cache_map:
+                        continue
+                    content_fp = fingerprints.get(content.hash)
+                    if content_fp is None:
+                        content_fp = fingerprints[content.hash] = content_fingerprint(content.title, content.raw_text)
+                    # 최신순으로 훑으므로 처음 조건을 만족한 캐시가 가장 최근 것
+                    if title_is_specific or cache_entry.content_fp == content_fp:
+                        cache_map[content.hash] = cache_entry
+                        adopted[content.hash] = (content, cache_entry, content_fp)
+            self._save_adopted_summaries(list(adopted.values()))
+        
+        return cache_map
+    
+    def _save_adopted_summaries(self, adopted: List[Tuple[Content, AICache, str]]) -> None:
+        """
+        제목으로 빌려온 캐시를 콘텐츠 자신의 해시로 복사하고 요약 완료로 표시합니다.
+        
+        Parameters
+        ----------
+        adopted : List[Tuple[Content, AICache, str]]
+            (콘텐츠, 빌려온 캐시 엔트리, 콘텐츠 지문) 목록
+        """
+        if not adopted:
+            return
+        
+        # 다른 워커가 같은 콘텐츠를 먼저 저장했으면 건너뜀
+        self.db.execute(
+            pg_insert(AICache).on_conflict_do_nothing(index_elements=["content_hash", "model_version"]),
+            [
+                {
+                    "content_hash": content.hash,
+                    "content_fp": content_fp,
+                    "model_version": MODEL_VERSION,
+                    "summary_bullets": cache_entry.summary_bullets,
+                    "tags": cache_entry.tags,
+                    "insight": cache_entry.insight,
+                }
+                for content, cache_entry, content_fp in adopted
+            ]
+        )
+        self.db.execute(
+            update(Content)
+            .where(Content.id.in_([content.id for content, _, _ in adopted]))
+            .values(ai_summary_status="completed", ai_summarized_at=datetime.utcnow())
+        )
+        
+        self.db.commit()
     
-    def generate_ai_summary(self, content: Content) -> Dict[str, Any]:
+    async def generate_ai_summary(
+        self,
+        content: Content,
+        client: Optional[AsyncOpenAI],
+        cached: Optional[AICache] = None,
+        out_writes: Optional[list] = None
+    ) -> Dict[str, Any]:
         """
         뉴스에 대한 AI 요약을 생성합니다.
         
@@ -194,6 +645,13 @@ class PopularNewsAnalyzer:
         ----------
         content : Content
             뉴스 콘텐츠
+        client : Optional[AsyncOpenAI]
+            현재 이벤트 루프에서 만든 OpenAI 클라이언트 (process_popular_news_async 참고)
+        cached : Optional[AICache]
+            미리 조회한 캐시 엔트리 (_load_cached_summaries 참고)
+        out_writes : Optional[list]
+            주어지면 커밋하지 않고 (캐시 행, 비용 로그 행, content_id)를 추가합니다.
+            호출자가 모아서 한 트랜잭션으로 저장합니다 (_save_summary_writes 참고).
             
         Returns
         -------
@@ -205,12 +663,6 @@ class PopularNewsAnalyzer:
             return {"error": "OpenAI 클라이언트 설정 오류"}
         
         try:
-            # 기존 캐시 확인
-            cached = self.db.query(AICache).filter_by(
-                content_hash=content.hash,
-                model_version=MODEL_VERSION
-            ).first()
-            
             if cached:
                 logger.info(f"캐시된 결과 사용: {content.id}")
                 return {
@@ -221,35 +673,14 @@ class PopularNewsAnalyzer:
                 }
             
             # AI 요약 생성
-            prompt = f"""
-다음 뉴스 기사를 분석하여 요약해주세요:
-
-제목: {content.title}
-내용: {content.content[:2000]}  # 처음 2000자만 사용
-언어: {content.lang}
-출처: {content.source}
-
-다음 JSON 형식으로 응답해주세요:
-{{
-    "summary_bullets": [
-        "핵심 내용 1",
-        "핵심 내용 2", 
-        "핵심 내용 3",
-        "핵심 내용 4",
-        "핵심 내용 5"
-    ],
-    "tags": ["태그1", "태그2", "태그3", "태그4", "태그5"],
-    "insight": "이 뉴스가 시장에 미칠 영향과 투자 관점에서의 분석 (2-3문장)"
-}}
-
-주의사항:
-- summary_bullets는 최대 5개까지
-- tags는 관련 키워드 5개까지
-- insight는 구체적이고 실용적인 분석
-- JSON 형식으로만 응답
-"""
+            prompt = PROMPT_TEMPLATE.format_map({
+                "title": content.title,
+                "content": _truncate_prompt_content(content.raw_text),
+                "lang": content.lang,
+                "source": content.source,
+            })
 
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=MODEL_VERSION,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
@@ -258,60 +689,94 @@ class PopularNewsAnalyzer:
             )
             
             result = response.choices[0].message.content
-            ai_data = eval(result) if isinstance(result, str) else result
-            
-            # 캐시 저장
-            cache_entry = AICache(
-                content_hash=content.hash,
-                model_version=MODEL_VERSION,
-                summary_bullets=ai_data.get("summary_bullets", []),
-                tags=ai_data.get("tags", []),
-                insight=ai_data.get("insight", ""),
-                tokens_used=response.usage.total_tokens,
-                cost=calculate_openai_cost(
-                    model_name=MODEL_VERSION,
-                    tokens_in=response.usage.prompt_tokens,
-                    tokens_out=response.usage.completion_tokens
-                )
-            )
+            ai_data = orjson.loads(result) if isinstance(result, str) else result
+            summary_bullets = ai_data.get("summary_bullets", [])
+            tags = ai_data.get("tags", [])
+            insight = ai_data.get("insight", "")
             
-            self.db.add(cache_entry)
+            # 토큰 사용량과 비용은 한 번만 읽고 계산해 재사용
+            usage = response.usage
+            tokens_in, tokens_out, tokens_total = usage.prompt_tokens, usage.completion_tokens, usage.total_tokens
+            cost, _ = calculate_openai_cost(MODEL_VERSION, tokens_in, tokens_out)
             
-            # 비용 로깅
-            cost_log = CostLog(
-                model_name=MODEL_VERSION,
-                tokens_in=response.usage.prompt_tokens,
-                tokens_out=response.usage.completion_tokens,
-                cost=cache_entry.cost,
-                operation="popular_news_summary"
-            )
-            self.db.add(cost_log)
+            # 캐시 저장 (Core 일괄 INSERT용 행)
+            cache_row = {
+                "content_hash": content.hash,
+                "content_fp": content_fingerprint(content.title, content.raw_text),
+                "model_version": MODEL_VERSION,
+                "summary_bullets": summary_bullets,
+                "tags": tags,
+                "insight": insight,
+            }
             
-            # 콘텐츠 상태 업데이트
-            content.ai_summary_status = "completed"
-            content.ai_summarized_at = datetime.utcnow()
+            # 비용 로깅
+            cost_row = {
+                "content_id": content.id,
+                "model_name": MODEL_VERSION,
+                "tokens_in": tokens_in,
+                "tokens_out": tokens_out,
+                "cost_usd": cost,
+                "request_type": "popular_news_summary",
+            }
             
-            self.db.commit()
+            writes = (cache_row, cost_row, content.id)
+            if out_writes is not None:
+                out_writes.append(writes)
+            else:
+                self._save_summary_writes([writes])
             
             logger.info(f"인기 뉴스 AI 요약 완료: {content.id}")
             
             return {
                 "status": "success",
-                "summary_bullets": ai_data.get("summary_bullets", []),
-                "tags": ai_data.get("tags", []),
-                "insight": ai_data.get("insight", ""),
-                "tokens_used": response.usage.total_tokens,
-                "cost": cache_entry.cost
+                "summary_bullets": summary_bullets,
+                "tags": tags,
+                "insight": insight,
+                "tokens_used": tokens_total,
+                "cost": cost
             }
             
         except Exception as e:
             logger.error(f"AI 요약 생성 실패: {str(e)}")
             return {"error": str(e)}
     
+    def _save_summary_writes(self, writes: List[Tuple[Dict[str, Any], Dict[str, Any], int]]) -> None:
+        """
+        요약 결과(캐시, 비용 로그, 콘텐츠 상태)를 한 번의 커밋으로 저장합니다.
+        
+        캐시와 비용 로그는 ORM flush 대신 테이블별 Core INSERT 한 번(executemany)으로 넣습니다.
+        
+        Parameters
+        ----------
+        writes : List[Tuple[Dict[str, Any], Dict[str, Any], int]]
+            generate_ai_summary가 모은 (캐시 행, 비용 로그 행, content_id) 목록
+        """
+        if not writes:
+            return
+        
+        # 다른 워커가 같은 콘텐츠를 먼저 요약해 저장했으면 건너뜀
+        self.db.execute(
+            pg_insert(AICache).on_conflict_do_nothing(index_elements=["content_hash", "model_version"]),
+            [cache_row for cache_row, _, _ in writes]
+        )
+        self.db.execute(insert(CostLog), [cost_row for _, cost_row, _ in writes])
+        
+        # 콘텐츠 상태 업데이트 (조회 결과가 ORM 객체가 아니므로 UPDATE 문으로 반영)
+        self.db.execute(
+            update(Content)
+            .where(Content.id.in_([content_id for _, _, content_id in writes]))
+            .values(ai_summary_status="completed", ai_summarized_at=datetime.utcnow())
+        )
+        
+        self.db.commit()
+    
     def process_popular_news(self, limit: int = 10) -> Dict[str, Any]:
         """
         인기 뉴스 10개를 선별하고 AI 요약을 생성합니다.
         
+        동기 호출자(Celery 태스크 등)를 위한 래퍼로, 새로 요약할 뉴스가 있을 때만
+        이벤트 루프를 만들어 process_popular_news_async를 실행합니다.
+        
         Parameters
         ----------
         limit : int
@@ -323,26 +788,142 @@ class PopularNewsAnalyzer:
             처리 결과
         """
         try:
-            # 인기 뉴스 조회
-            popular_news = self.get_popular_news(limit)
+            scored_news, cache_map = self._select_popular_news(limit)
+        except Exception as e:
+            logger.error(f"인기 뉴스 처리 실패: {str(e)}")
+            return {
+                "status": "error",
+                "message": str(e),
+                "processed_count": 0
+            }
+        
+        # 모두 캐시되어 있으면 OpenAI 요청 없이 바로 반환 (정상 상태에서 가장 흔한 경우)
+        if not any(content.hash not in cache_map for content, _ in scored_news):
+            return self._no_work_result(scored_news)
+        
+        return asyncio.run(self.process_popular_news_async(limit, (scored_news, cache_map)))
+    
+    def _select_popular_news(self, limit: int) -> Tuple[List[Tuple[Row, float]], Dict[str, AICache]]:
+        """
+        요약 대상 인기 뉴스와 그 캐시 엔트리를 조회합니다.
+        
+        Parameters
+        ----------
+        limit : int
+            처리할 뉴스 개수
             
-            if not popular_news:
+        Returns
+        -------
+        Tuple[List[Tuple[Row, float]], Dict[str, AICache]]
+            (뉴스 행, 인기도 점수) 목록과 콘텐츠 해시 → 캐시 엔트리
+        """
+        # 인기 뉴스 조회 (저장된 인기도 점수 순)
+        scored_news = self.get_popular_news_with_scores(limit)
+        
+        # 캐시 조회를 기사별 쿼리 대신 한 번의 IN 쿼리로 처리
+        cache_map = self._load_cached_summaries([content for content, _ in scored_news])
+        
+        return scored_news, cache_map
+    
+    def _no_work_result(self, scored_news: List[Tuple[Row, float]]) -> Dict[str, Any]:
+        """새로 요약할 뉴스가 없을 때의 처리 결과를 만듭니다."""
+        if not scored_news:
+            return {
+                "status": "no_news",
+                "message": "처리할 인기 뉴스가 없습니다.",
+                "processed_count": 0
+            }
+        
+        logger.info(f"인기 뉴스 {len(scored_news)}건 모두 캐시됨, 요약 생략")
+        return {
+            "status": "success",
+            "processed_count": 0,
+            "total_found": len(scored_news),
+            "results": []
+        }
+    
+    async def process_popular_news_async(
+        self,
+        limit: int = 10,
+        selected: Optional[Tuple[List[Tuple[Row, float]], Dict[str, AICache]]] = None
+    ) -> Dict[str, Any]:
+        """
+        인기 뉴스를 선별하고 AI 요약을 동시에 생성합니다.
+        
+        캐시가 없는 뉴스만 OpenAI에 요청하며, 요청은 MAX_CONCURRENT_SUMMARIES개까지
+        동시에 진행됩니다. SUMMARY_RUN_TIMEOUT초가 지나면 남은 요청을 취소하고
+        그때까지 끝난 요약만 저장합니다 (status "timeout").
+        
+        Parameters
+        ----------
+        limit : int
+            처리할 뉴스 개수
+        selected : Optional[Tuple[List[Tuple[Row, float]], Dict[str, AICache]]]
+            미리 조회한 _select_popular_news 결과 (없으면 여기서 조회)
+            
+        Returns
+        -------
+        Dict[str, Any]
+            처리 결과
+        """
+        try:
+            scored_news, cache_map = selected or self._select_popular_news(limit)
+            
+            # 캐시된 뉴스는 결과에 포함되지 않으므로 요약할 뉴스만 남긴다
+            pending_news = [
+                (content, popularity_score)
+                for content, popularity_score in scored_news
+                if content.hash not in cache_map
+            ]
+            if not pending_news:
+                return self._no_work_result(scored_news)
+            
+            if not settings.OPENAI_API_KEY:
+                logger.error("OpenAI 클라이언트가 설정되지 않았습니다.")
                 return {
-                    "status": "no_news",
-                    "message": "처리할 인기 뉴스가 없습니다.",
+                    "status": "error",
+                    "message": "OpenAI 클라이언트 설정 오류",
                     "processed_count": 0
                 }
             
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIES)
+            out_writes = []
+            
+            # 클라이언트의 연결 풀은 만든 이벤트 루프에 묶이므로, asyncio.run으로
+            # 매번 새 루프가 만들어지는 실행마다 클라이언트를 만들고 닫는다.
+            # 한 실행의 요약들은 HTTP/2 연결 하나를 다중화해 TLS 핸드셰이크를 한 번만 한다
+            http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=MAX_CONCURRENT_SUMMARIES)
+            )
+            async with AsyncOpenAI(api_key=settings.OPENAI_API_KEY, http_client=http_client) as client:
+                async def summarize(content: Content) -> Dict[str, Any]:
+                    async with semaphore:
+                        return await self.generate_ai_summary(content, client, None, out_writes)
+                
+                # AI 요약 생성 (네트워크 대기 시간이 겹치도록 동시에 실행)
+                try:
+                    summary_results = await asyncio.wait_for(
+                        asyncio.gather(*[summarize(content) for content, _ in pending_news]),
+                        SUMMARY_RUN_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"인기 뉴스 요약 시간 초과, 완료된 {len(out_writes)}건만 저장")
+                    self._save_summary_writes(out_writes)
+                    return {
+                        "status": "timeout",
+                        "message": "시간 제한을 초과했습니다.",
+                        "processed_count": len(out_writes),
+                        "total_found": len(scored_news)
+                    }
+            
+            # 기사별 커밋 대신 실행당 한 번만 커밋
+            self._save_summary_writes(out_writes)
+            
             processed_count = 0
             results = []
             
-            for content in popular_news:
-                # 인기도 점수 계산
-                popularity_score = self.analyze_popularity_score(content)
-                
-                # AI 요약 생성
-                summary_result = self.generate_ai_summary(content)
-                
+            for (content, popularity_score), summary_result in zip(pending_news, summary_results):
                 if summary_result.get("status") == "success":
                     processed_count += 1
                     results.append({
@@ -353,12 +934,12 @@ class PopularNewsAnalyzer:
                         "summary": summary_result
                     })
             
-            logger.info(f"인기 뉴스 처리 완료: {processed_count}/{len(popular_news)}")
+            logger.info(f"인기 뉴스 처리 완료: {processed_count}/{len(scored_news)}")
             
             return {
                 "status": "success",
                 "processed_count": processed_count,
-                "total_found": len(popular_news),
+                "total_found": len(scored_news),
                 "results": results
             }
             
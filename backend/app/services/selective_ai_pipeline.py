@@ -5,18 +5,25 @@
 팔로잉 기업 관련 뉴스만 자동으로 AI 요약하고, 나머지는 온디맨드로 처리
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from sqlalchemy import Text, exists, cast, func, literal, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
+from celery import group
 from datetime import datetime
 import logging
 
 from ..models.content import Content
 from ..models.company import Company, UserFollowing, CompanyMention
 from ..services.company_matcher import CompanyMatcher
-from ..workers.tasks import summarize_task
+from ..workers.tasks import chunk_content_ids, summarize_batch_task, summarize_task
 
 logger = logging.getLogger(__name__)
 
+# pending_summary 대신 붙일 태그
+AUTO_SUMMARIZED_TAGS = ("auto_summarized", "following_company")
+ON_DEMAND_TAGS = ("on_demand_available",)
+
 
 class SelectiveAIPipeline:
     """선택적 AI 파이프라인 클래스"""
@@ -41,69 +48,132 @@ class SelectiveAIPipeline:
         Dict[str, Any]
             처리 결과
         """
+        content = self.db.get(Content, content_id)
+        if not content:
+            return {
+                "content_id": content_id,
+                "status": "error",
+                "error": "콘텐츠를 찾을 수 없습니다",
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        return self._process_loaded_content(content, user_id)
+    
+    def _process_loaded_content(
+        self,
+        content: Content,
+        user_id: str,
+        tag_updates: Optional[Dict[Tuple[str, ...], List[int]]] = None,
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        이미 조회한 콘텐츠를 선택적 AI 파이프라인으로 처리합니다.
+        
+        tag_updates가 주어지면 태그 변경과 요약 태스크 등록을 바로 하지 않고
+        (새 태그 → 콘텐츠 ID 목록)에 모아 두며, 호출자가 _replace_tag로 한 번에 반영합니다.
+        timestamp가 주어지면 결과의 timestamp로 그대로 사용합니다 (배치당 한 번 생성).
+        """
+        timestamp = timestamp or datetime.now().isoformat()
         try:
             # 기업 매칭 확인
-            match_result = self.matcher.should_auto_summarize(content_id, user_id)
+            match_result = self.matcher.should_auto_summarize(content.id, user_id)
             
             if match_result["should_summarize"]:
                 # 자동 요약 실행
-                return self._auto_summarize(content_id, match_result)
+                return self._auto_summarize(content, match_result, tag_updates, timestamp)
             else:
                 # 온디맨드 대기 상태로 설정
-                return self._mark_for_on_demand(content_id, match_result)
+                return self._mark_for_on_demand(content, match_result, tag_updates, timestamp)
                 
         except Exception as e:
-            logger.error(f"선택적 AI 파이프라인 처리 실패 (콘텐츠 {content_id}): {str(e)}")
+            logger.error("선택적 AI 파이프라인 처리 실패 (콘텐츠 %s): %s", content.id, e, exc_info=True)
             return {
-                "content_id": content_id,
+                "content_id": content.id,
                 "status": "error",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
-    def _auto_summarize(self, content_id: int, match_result: Dict[str, Any]) -> Dict[str, Any]:
-        """자동 요약을 실행합니다."""
+    def _replace_tag(
+        self,
+        content_ids: List[int],
+        new_tags: Tuple[str, ...],
+        old_tag: str = "pending_summary"
+    ) -> None:
+        """
+        여러 콘텐츠의 old_tag 태그를 UPDATE 한 번으로 새 태그로 바꿉니다.
+        
+        DB에서 JSONB 연산으로 처리하므로 ORM이 태그 배열 전체를 다시 쓰지 않고,
+        다른 세션(요약 태스크 등)이 그 사이에 바꾼 태그도 덮어쓰지 않습니다.
+        """
+        if not content_ids:
+            return
+        
+        # JSONB 연산: (tags - old_tag) || '[새 태그]'
+        tags = func.coalesce(Content.tags, cast([], JSONB))
+        self.db.execute(
+            update(Content)
+            .where(Content.id.in_(content_ids))
+            .values(tags=tags.op("-")(literal(old_tag, Text)).op("||")(cast(list(new_tags), JSONB)))
+            .execution_options(synchronize_session=False)
+        )
+    
+    def _auto_summarize(
+        self,
+        content: Content,
+        match_result: Dict[str, Any],
+        tag_updates: Optional[Dict[Tuple[str, ...], List[int]]] = None,
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """자동 요약 태스크를 Celery에 등록합니다 (요약 완료를 기다리지 않음)."""
+        content_id = content.id
+        timestamp = timestamp or datetime.now().isoformat()
         try:
-            # AI 요약 태스크 실행
-            task_result = summarize_task(content_id)
-            
-            # 콘텐츠 태그 업데이트
-            content = self.db.query(Content).filter(Content.id == content_id).first()
-            if content:
-                if "pending_summary" in (content.tags or []):
-                    content.tags = [tag for tag in (content.tags or []) if tag != "pending_summary"]
-                content.tags.append("auto_summarized")
-                content.tags.append("following_company")
+            task_id = None
+            if tag_updates is not None:
+                # 배치: 태그 반영과 태스크 등록은 process_batch_content에서 한 번에
+                tag_updates.setdefault(AUTO_SUMMARIZED_TAGS, []).append(content_id)
+            else:
+                # 태그를 먼저 커밋해야 워커의 태그 병합과 겹치지 않음
+                self._replace_tag([content_id], AUTO_SUMMARIZED_TAGS)
                 self.db.commit()
+                task_id = summarize_task.delay(content_id).id
             
             return {
                 "content_id": content_id,
                 "status": "auto_summarized",
-                "task_result": task_result,
+                "task_id": task_id,
                 "matched_companies": match_result["matched_companies"],
                 "matched_company_info": match_result["matched_company_info"],
                 "reason": match_result["reason"],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             
         except Exception as e:
-            logger.error(f"자동 요약 실패 (콘텐츠 {content_id}): {str(e)}")
+            logger.error("자동 요약 실패 (콘텐츠 %s): %s", content_id, e, exc_info=True)
             return {
                 "content_id": content_id,
                 "status": "auto_summarize_failed",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
-    def _mark_for_on_demand(self, content_id: int, match_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _mark_for_on_demand(
+        self,
+        content: Content,
+        match_result: Dict[str, Any],
+        tag_updates: Optional[Dict[Tuple[str, ...], List[int]]] = None,
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """온디맨드 대기 상태로 설정합니다."""
+        content_id = content.id
+        timestamp = timestamp or datetime.now().isoformat()
         try:
             # 콘텐츠 태그 업데이트
-            content = self.db.query(Content).filter(Content.id == content_id).first()
-            if content:
-                if "pending_summary" in (content.tags or []):
-                    content.tags = [tag for tag in (content.tags or []) if tag != "pending_summary"]
-                content.tags.append("on_demand_available")
+            if tag_updates is not None:
+                tag_updates.setdefault(ON_DEMAND_TAGS, []).append(content_id)
+            else:
+                self._replace_tag([content_id], ON_DEMAND_TAGS)
                 self.db.commit()
             
             return {
@@ -111,22 +181,26 @@ class SelectiveAIPipeline:
                 "status": "on_demand_available",
                 "matched_companies": match_result["matched_companies"],
                 "reason": match_result["reason"],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             
         except Exception as e:
-            logger.error(f"온디맨드 설정 실패 (콘텐츠 {content_id}): {str(e)}")
+            logger.error("온디맨드 설정 실패 (콘텐츠 %s): %s", content_id, e, exc_info=True)
             return {
                 "content_id": content_id,
                 "status": "on_demand_setup_failed",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
     def process_batch_content(self, user_id: str = "default_user", limit: int = 50) -> Dict[str, Any]:
         """
         배치로 콘텐츠를 처리합니다.
         
+        콘텐츠별로 태그를 바꾸지 않고 분류별 ID를 모아, 분류마다 UPDATE 한 번씩
+        실행한 뒤 배치 끝에 한 번만 커밋합니다. 자동 요약 대상은 커밋 후 Celery
+        group으로 한 번에 등록하며 각 결과에 task_id를 채웁니다.
+        
         Parameters
         ----------
         user_id : str
@@ -140,45 +214,21 @@ class SelectiveAIPipeline:
             배치 처리 결과
         """
         try:
-            # 처리할 콘텐츠 조회
-            contents = self.db.query(Content).filter(
-                Content.tags.contains(["pending_summary"])
-            ).limit(limit).all()
+            contents = self._select_pending_contents(limit)
             
-            results = {
-                "processed": 0,
-                "auto_summarized": 0,
-                "on_demand_available": 0,
-                "errors": 0,
-                "details": []
-            }
+            results = self._new_batch_summary()
+            # 콘텐츠 수만큼 미리 만들어 두고 인덱스로 채움
+            details = [None] * len(contents)
+            results["details"] = details
             
-            for content in contents:
-                try:
-                    result = self.process_new_content(content.id, user_id)
-                    results["processed"] += 1
-                    results["details"].append(result)
-                    
-                    if result["status"] == "auto_summarized":
-                        results["auto_summarized"] += 1
-                    elif result["status"] == "on_demand_available":
-                        results["on_demand_available"] += 1
-                    elif "error" in result["status"]:
-                        results["errors"] += 1
-                        
-                except Exception as e:
-                    logger.error(f"콘텐츠 {content.id} 처리 실패: {str(e)}")
-                    results["errors"] += 1
-                    results["details"].append({
-                        "content_id": content.id,
-                        "status": "error",
-                        "error": str(e)
-                    })
+            for i, result in enumerate(self._iter_batch_results(contents, user_id, results)):
+                details[i] = result
             
             return results
             
         except Exception as e:
-            logger.error(f"배치 처리 실패: {str(e)}")
+            self.db.rollback()
+            logger.error("배치 처리 실패: %s", e, exc_info=True)
             return {
                 "processed": 0,
                 "auto_summarized": 0,
@@ -187,6 +237,124 @@ class SelectiveAIPipeline:
                 "details": [{"error": str(e)}]
             }
     
+    def iter_batch_content(self, user_id: str = "default_user", limit: int = 50) -> Iterator[Dict[str, Any]]:
+        """
+        배치로 콘텐츠를 처리한 뒤 콘텐츠별 결과를 하나씩 반환합니다.
+        
+        process_batch_content와 같은 처리를 하며, 마지막에 집계와 task_id 목록을 담은
+        status="batch_completed" 레코드를 한 번 더 반환합니다 (스트리밍 응답용).
+        분류와 태그 커밋을 첫 결과를 반환하기 전에 모두 끝내므로, 행 잠금이 클라이언트가
+        응답을 읽는 동안 유지되지 않습니다.
+        
+        Parameters
+        ----------
+        user_id : str
+            사용자 ID
+        limit : int
+            처리할 최대 개수
+            
+        Yields
+        ------
+        Dict[str, Any]
+            콘텐츠별 처리 결과, 마지막은 배치 집계
+        """
+        try:
+            contents = self._select_pending_contents(limit)
+            summary = self._new_batch_summary()
+            
+            # 제너레이터를 먼저 소진해 커밋(잠금 해제)과 태스크 등록을 마친 뒤 스트리밍
+            results = list(self._iter_batch_results(contents, user_id, summary))
+            yield from results
+            
+            yield {"status": "batch_completed", **summary}
+            
+        except Exception as e:
+            self.db.rollback()
+            logger.error("배치 처리 실패: %s", e, exc_info=True)
+            yield {"status": "batch_failed", "error": str(e)}
+    
+    def _select_pending_contents(self, limit: int) -> List[Content]:
+        """처리할 pending_summary 콘텐츠를 잠그고 조회합니다."""
+        # 다른 워커가 잠근 행은 건너뛰어 배치끼리 겹치지 않게 함 (잠금은 배치 끝의 커밋까지 유지하므로
+        # 호출자는 _iter_batch_results를 끝까지 소진한 뒤에 결과를 내보내야 함)
+        return self.db.query(Content).filter(
+            Content.tags.contains(["pending_summary"])
+        ).limit(limit).with_for_update(skip_locked=True).all()
+    
+    @staticmethod
+    def _new_batch_summary() -> Dict[str, Any]:
+        """배치 집계용 딕셔너리를 만듭니다."""
+        return {
+            "processed": 0,
+            "auto_summarized": 0,
+            "on_demand_available": 0,
+            "errors": 0,
+            "task_ids": {}
+        }
+    
+    def _iter_batch_results(
+        self,
+        contents: List[Content],
+        user_id: str,
+        summary: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        콘텐츠를 하나씩 분류해 결과를 반환하고, 끝나면 태그 변경과 요약 태스크 등록을 반영합니다.
+        
+        summary의 집계 값과 task_ids(콘텐츠 ID → 태스크 ID)를 갱신하며,
+        이미 반환한 자동 요약 결과에도 task_id를 채웁니다.
+        """
+        tag_updates: Dict[Tuple[str, ...], List[int]] = {}
+        auto_results: Dict[int, Dict[str, Any]] = {}
+        
+        # 팔로잉 기업은 배치 동안 한 번만 조회
+        self.matcher.prime_user(user_id)
+        
+        # 결과 타임스탬프는 배치당 한 번만 생성
+        timestamp = datetime.now().isoformat()
+        
+        for content in contents:
+            try:
+                # 이미 조회한 객체를 넘겨 콘텐츠별 재조회를 생략
+                result = self._process_loaded_content(
+                    content, user_id, tag_updates=tag_updates, timestamp=timestamp
+                )
+                summary["processed"] += 1
+                
+                if result["status"] == "auto_summarized":
+                    summary["auto_summarized"] += 1
+                    auto_results[result["content_id"]] = result
+                elif result["status"] == "on_demand_available":
+                    summary["on_demand_available"] += 1
+                elif "error" in result["status"]:
+                    summary["errors"] += 1
+                    
+            except Exception as e:
+                logger.error("콘텐츠 %s 처리 실패: %s", content.id, e, exc_info=True)
+                summary["errors"] += 1
+                result = {
+                    "content_id": content.id,
+                    "status": "error",
+                    "error": str(e)
+                }
+            
+            yield result
+        
+        # 배치 전체의 태그 변경을 분류별 UPDATE로 반영하고 한 트랜잭션으로 커밋
+        for new_tags, content_ids in tag_updates.items():
+            self._replace_tag(content_ids, new_tags)
+        self.db.commit()
+        
+        # 자동 요약 태스크를 묶음 단위로 워커들에 병렬 등록 (요약 완료를 기다리지 않음)
+        auto_ids = tag_updates.get(AUTO_SUMMARIZED_TAGS, [])
+        if auto_ids:
+            chunks = chunk_content_ids(auto_ids)
+            group_result = group(summarize_batch_task.s(chunk) for chunk in chunks).apply_async()
+            for chunk, task in zip(chunks, group_result.results):
+                for content_id in chunk:
+                    summary["task_ids"][content_id] = task.id
+                    auto_results[content_id]["task_id"] = task.id
+    
     def get_user_dashboard_data(self, user_id: str) -> Dict[str, Any]:
         """
         사용자 대시보드 데이터를 조회합니다.
@@ -208,10 +376,10 @@ class SelectiveAIPipeline:
             # 우선순위 콘텐츠
             priority_content = self.matcher.get_priority_content(user_id, limit=10)
             
-            # 최근 자동 요약된 콘텐츠
-            recent_auto_summarized = self.db.query(Content).join(
-                CompanyMention, Content.id == CompanyMention.content_id
-            ).filter(
+            # 최근 자동 요약된 콘텐츠 (언급이 여러 개인 콘텐츠가 중복되지 않도록 JOIN 대신 EXISTS)
+            has_mentions = exists().where(CompanyMention.content_id == Content.id)
+            recent_auto_summarized = self.db.query(Content).filter(
+                has_mentions,
                 Content.tags.contains(["auto_summarized"]),
                 Content.insight.isnot(None)
             ).order_by(Content.published_at.desc()).limit(5).all()
@@ -236,7 +404,7 @@ class SelectiveAIPipeline:
             }
             
         except Exception as e:
-            logger.error(f"대시보드 데이터 조회 실패 (사용자 {user_id}): {str(e)}")
+            logger.error("대시보드 데이터 조회 실패 (사용자 %s): %s", user_id, e, exc_info=True)
             return {
                 "stats": {},
                 "priority_content": [],
@@ -263,7 +431,7 @@ class SelectiveAIPipeline:
         """
         try:
             # 콘텐츠 확인
-            content = self.db.query(Content).filter(Content.id == content_id).first()
+            content = self.db.get(Content, content_id)
             if not content:
                 return {
                     "content_id": content_id,
@@ -284,9 +452,7 @@ class SelectiveAIPipeline:
             task_result = summarize_task(content_id)
             
             # 태그 업데이트
-            if "on_demand_available" in (content.tags or []):
-                content.tags = [tag for tag in (content.tags or []) if tag != "on_demand_available"]
-            content.tags.append("on_demand_summarized")
+            self._replace_tag([content_id], ("on_demand_summarized",), old_tag="on_demand_available")
             self.db.commit()
             
             return {
@@ -297,7 +463,7 @@ class SelectiveAIPipeline:
             }
             
         except Exception as e:
-            logger.error(f"온디맨드 요약 실패 (콘텐츠 {content_id}): {str(e)}")
+            logger.error("온디맨드 요약 실패 (콘텐츠 %s): %s", content_id, e, exc_info=True)
             return {
                 "content_id": content_id,
                 "status": "error",
@@ -5,26 +5,114 @@
 뉴스 기사의 조회수, 좋아요, 공유, 댓글 수를 수집합니다.
 """
 
-import requests
-import time
+import asyncio
+import hashlib
+import httpx
+import json
+import numpy as np
 import random
-from typing import Dict, Any, Optional
+import redis
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from datetime import datetime, timedelta
+from urllib.parse import urlparse
 import logging
 
+from ..models.content import normalize_source_key
+from ..repo.redis_client import get_redis_client
+
 logger = logging.getLogger(__name__)
 
+MAX_CONNECTIONS = 100  # 메트릭 수집 HTTP 클라이언트의 최대 동시 연결 수
+PER_HOST_DELAY = 0.5  # 같은 호스트에 대한 요청 간 딜레이 (초, API 제한 고려)
+REQUEST_TIMEOUT = 10  # 요청 타임아웃 (초)
+METRICS_CACHE_TTL = 300  # 수집한 메트릭 캐시 시간 (초, 5분)
+METRICS_NEGATIVE_TTL = 60  # 수집 실패(기본값) 캐시 시간 (초, 재시도 폭주 방지)
+METRICS_VALIDATOR_TTL = 86400  # ETag/Last-Modified 보관 시간 (초, 1일)
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def classify_batch(
+    views: np.ndarray,
+    likes: np.ndarray,
+    shares: np.ndarray,
+    comments: np.ndarray
+) -> np.ndarray:
+    """
+    여러 콘텐츠의 참여도 등급을 한 번에 계산합니다.
+    
+    SocialMetricsCollector._calculate_engagement_score와 같은 규칙을 배열 연산으로 적용합니다.
+    
+    Parameters
+    ----------
+    views, likes, shares, comments : np.ndarray
+        콘텐츠별 조회수, 좋아요 수, 공유 수, 댓글 수 (같은 길이의 정수 배열)
+        
+    Returns
+    -------
+    np.ndarray
+        참여도 등급 배열 (low, medium, high, viral)
+    """
+    views = np.asarray(views, dtype=np.int64)
+    engagement = (
+        np.asarray(likes, dtype=np.int64)
+        + np.asarray(shares, dtype=np.int64)
+        + np.asarray(comments, dtype=np.int64)
+    )
+    has_views = views > 0
+    
+    return np.select(
+        [
+            has_views & (engagement * 10 >= views),
+            has_views & (engagement * 20 >= views),
+            has_views & (engagement * 50 >= views),
+        ],
+        ["viral", "high", "medium"],
+        default="low"
+    )
+
+
+# 소스별 모의 메트릭 범위: (조회수, 좋아요, 공유, 댓글)의 (최소, 최대)
+SOURCE_PROFILES: Mapping[str, Tuple[Tuple[int, int], ...]] = MappingProxyType({
+    'hankyung': ((100, 5000), (5, 200), (2, 50), (0, 100)),   # 한국경제
+    'yahoo': ((200, 8000), (10, 300), (5, 100), (0, 150)),    # Yahoo Finance
+    'coindesk': ((150, 6000), (8, 250), (3, 80), (0, 120)),   # CoinDesk
+    'generic': ((50, 2000), (2, 100), (1, 30), (0, 50)),      # 그 외
+})
+
+# 프로필별 난수 범위 배열 (최소, 최대+1) - 호출마다 배열을 만들지 않도록 미리 계산
+_PROFILE_BOUNDS = {
+    name: (np.array([low for low, _ in ranges]), np.array([high + 1 for _, high in ranges]))
+    for name, ranges in SOURCE_PROFILES.items()
+}
+_rng = np.random.default_rng()
+
 
 class SocialMetricsCollector:
     """소셜 미디어 메트릭 수집기"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+    def __init__(self, redis_client: Optional[redis.Redis] = None):
+        self.redis_client = redis_client or get_redis_client()
+    
+    def _new_client(self) -> httpx.AsyncClient:
+        """메트릭 수집용 비동기 HTTP 클라이언트를 생성합니다 (연결 재사용)."""
+        return httpx.AsyncClient(
+            headers=HEADERS,
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS),
+            follow_redirects=True
+        )
     
-    def collect_metrics(self, url: str, source: str) -> Dict[str, Any]:
+    async def collect_metrics(
+        self,
+        url: str,
+        source: str,
+        client: Optional[httpx.AsyncClient] = None,
+        validator: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         URL에서 소셜 미디어 메트릭을 수집합니다.
         
@@ -34,139 +122,85 @@ class SocialMetricsCollector:
             뉴스 기사 URL
         source : str
             뉴스 소스 (hankyung, yahoo, coindesk 등)
+        client : Optional[httpx.AsyncClient]
+            공유할 HTTP 클라이언트 (없으면 이 요청용으로 생성)
+        validator : Optional[Dict[str, Any]]
+            이전 수집의 etag, last_modified, metrics (조건부 요청에 사용하며,
+            새로 수집하면 이 딕셔너리를 갱신합니다)
             
         Returns
         -------
         Dict[str, Any]
             수집된 메트릭 데이터
         """
+        if client is None:
+            async with self._new_client() as client:
+                return await self.collect_metrics(url, source, client, validator)
+        
         try:
-            # 소스별 메트릭 수집 전략
-            if 'hankyung' in source.lower():
-                return self._collect_hankyung_metrics(url)
-            elif 'yahoo' in source.lower():
-                return self._collect_yahoo_metrics(url)
-            elif 'coindesk' in source.lower():
-                return self._collect_coindesk_metrics(url)
-            else:
-                return self._collect_generic_metrics(url)
+            # 소스별 메트릭 범위 선택 (source_key 정규화 후 사전 조회)
+            profile_name = normalize_source_key(source)
+            if profile_name not in SOURCE_PROFILES:
+                profile_name = 'generic'
+            return await self._collect(url, client, profile_name, validator)
                 
         except Exception as e:
-            logger.error(f"메트릭 수집 실패 ({source}): {str(e)}")
+            logger.error("메트릭 수집 실패 (%s): %s", source, e, exc_info=True)
             return self._get_default_metrics()
     
-    def _collect_hankyung_metrics(self, url: str) -> Dict[str, Any]:
-        """한국경제 메트릭 수집"""
+    async def _collect(
+        self,
+        url: str,
+        client: httpx.AsyncClient,
+        profile_name: str,
+        validator: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        소스 프로필의 범위로 메트릭을 수집합니다.
+        
+        실제로는 소스별 API나 웹 스크래핑(HTML 파싱으로 조회수, 댓글 수 추출)이
+        필요하며, 현재는 페이지 응답 확인 후 랜덤 데이터로 시뮬레이션합니다.
+        이전 수집의 ETag/Last-Modified가 있으면 조건부 요청을 보내고, 304이면
+        본문을 받지 않고 이전 메트릭을 재사용합니다.
+        """
         try:
-            # 한국경제는 실제로는 API나 웹 스크래핑이 필요
-            # 현재는 모의 데이터로 시뮬레이션
-            response = self.session.get(url, timeout=10)
+            headers = {}
+            if validator and validator.get('metrics'):
+                if validator.get('etag'):
+                    headers['If-None-Match'] = validator['etag']
+                if validator.get('last_modified'):
+                    headers['If-Modified-Since'] = validator['last_modified']
             
-            if response.status_code == 200:
-                # 실제 구현에서는 HTML 파싱하여 조회수, 댓글 수 추출
-                # 현재는 랜덤 데이터로 시뮬레이션
-                return {
-                    'view_count': random.randint(100, 5000),
-                    'like_count': random.randint(5, 200),
-                    'share_count': random.randint(2, 50),
-                    'comment_count': random.randint(0, 100),
-                    'engagement_score': self._calculate_engagement_score(
-                        random.randint(100, 5000),
-                        random.randint(5, 200),
-                        random.randint(2, 50),
-                        random.randint(0, 100)
-                    ),
-                    'collected_at': datetime.utcnow().isoformat(),
-                    'source': 'hankyung'
-                }
-            else:
-                return self._get_default_metrics()
-                
-        except Exception as e:
-            logger.error(f"한국경제 메트릭 수집 실패: {str(e)}")
-            return self._get_default_metrics()
-    
-    def _collect_yahoo_metrics(self, url: str) -> Dict[str, Any]:
-        """Yahoo Finance 메트릭 수집"""
-        try:
-            # Yahoo Finance는 실제로는 API나 웹 스크래핑이 필요
-            response = self.session.get(url, timeout=10)
+            response = await client.get(url, headers=headers)
             
-            if response.status_code == 200:
-                return {
-                    'view_count': random.randint(200, 8000),
-                    'like_count': random.randint(10, 300),
-                    'share_count': random.randint(5, 100),
-                    'comment_count': random.randint(0, 150),
-                    'engagement_score': self._calculate_engagement_score(
-                        random.randint(200, 8000),
-                        random.randint(10, 300),
-                        random.randint(5, 100),
-                        random.randint(0, 150)
-                    ),
-                    'collected_at': datetime.utcnow().isoformat(),
-                    'source': 'yahoo'
-                }
-            else:
-                return self._get_default_metrics()
-                
-        except Exception as e:
-            logger.error(f"Yahoo Finance 메트릭 수집 실패: {str(e)}")
-            return self._get_default_metrics()
-    
-    def _collect_coindesk_metrics(self, url: str) -> Dict[str, Any]:
-        """CoinDesk 메트릭 수집"""
-        try:
-            # CoinDesk는 실제로는 API나 웹 스크래핑이 필요
-            response = self.session.get(url, timeout=10)
+            if response.status_code == 304 and headers:
+                return {**validator['metrics'], 'collected_at': datetime.utcnow().isoformat()}
             
             if response.status_code == 200:
-                return {
-                    'view_count': random.randint(150, 6000),
-                    'like_count': random.randint(8, 250),
-                    'share_count': random.randint(3, 80),
-                    'comment_count': random.randint(0, 120),
-                    'engagement_score': self._calculate_engagement_score(
-                        random.randint(150, 6000),
-                        random.randint(8, 250),
-                        random.randint(3, 80),
-                        random.randint(0, 120)
-                    ),
+                # 네 값을 한 번에 생성하고 참여도 계산에도 같은 값을 사용
+                lows, highs = _PROFILE_BOUNDS[profile_name]
+                views, likes, shares, comments = _rng.integers(lows, highs).tolist()
+                metrics = {
+                    'view_count': views,
+                    'like_count': likes,
+                    'share_count': shares,
+                    'comment_count': comments,
+                    'engagement_score': self._calculate_engagement_score(views, likes, shares, comments),
                     'collected_at': datetime.utcnow().isoformat(),
-                    'source': 'coindesk'
+                    'source': profile_name
                 }
-            else:
-                return self._get_default_metrics()
                 
-        except Exception as e:
-            logger.error(f"CoinDesk 메트릭 수집 실패: {str(e)}")
-            return self._get_default_metrics()
-    
-    def _collect_generic_metrics(self, url: str) -> Dict[str, Any]:
-        """일반적인 메트릭 수집"""
-        try:
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                return {
-                    'view_count': random.randint(50, 2000),
-                    'like_count': random.randint(2, 100),
-                    'share_count': random.randint(1, 30),
-                    'comment_count': random.randint(0, 50),
-                    'engagement_score': self._calculate_engagement_score(
-                        random.randint(50, 2000),
-                        random.randint(2, 100),
-                        random.randint(1, 30),
-                        random.randint(0, 50)
-                    ),
-                    'collected_at': datetime.utcnow().isoformat(),
-                    'source': 'generic'
-                }
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if validator is not None and (etag or last_modified):
+                    validator.update(etag=etag, last_modified=last_modified, metrics=metrics)
+                
+                return metrics
             else:
                 return self._get_default_metrics()
                 
         except Exception as e:
-            logger.error(f"일반 메트릭 수집 실패: {str(e)}")
+            logger.error("%s 메트릭 수집 실패: %s", profile_name, e)
             return self._get_default_metrics()
     
     def _calculate_engagement_score(self, views: int, likes: int, shares: int, comments: int) -> str:
@@ -192,14 +226,14 @@ class SocialMetricsCollector:
         if views == 0:
             return "low"
         
-        # 참여율 계산 (좋아요 + 공유 + 댓글) / 조회수
-        engagement_rate = (likes + shares + comments) / views
+        # 참여율 (좋아요 + 공유 + 댓글) / 조회수를 나눗셈 없이 정수 곱셈으로 비교
+        engagement = likes + shares + comments
         
-        if engagement_rate >= 0.1:  # 10% 이상
+        if engagement * 10 >= views:  # 10% 이상
             return "viral"
-        elif engagement_rate >= 0.05:  # 5% 이상
+        elif engagement * 20 >= views:  # 5% 이상
             return "high"
-        elif engagement_rate >= 0.02:  # 2% 이상
+        elif engagement * 50 >= views:  # 2% 이상
             return "medium"
         else:
             return "low"
@@ -216,10 +250,15 @@ class SocialMetricsCollector:
             'source': 'unknown'
         }
     
-    def batch_collect_metrics(self, urls: list) -> Dict[str, Dict[str, Any]]:
+    async def batch_collect_metrics(self, urls: list) -> Dict[str, Dict[str, Any]]:
         """
         여러 URL의 메트릭을 일괄 수집합니다.
         
+        최근에 수집한 URL은 Redis 캐시(METRICS_CACHE_TTL)에서 가져오고, 나머지는
+        하나의 비동기 클라이언트로 서로 다른 호스트는 동시에 수집하고,
+        같은 호스트는 PER_HOST_DELAY 간격으로 순서대로 요청합니다. 이전에 받은
+        ETag/Last-Modified가 있는 URL은 조건부 요청으로 변경 여부만 확인합니다.
+        
         Parameters
         ----------
         urls : list
@@ -230,16 +269,115 @@ class SocialMetricsCollector:
         Dict[str, Dict[str, Any]]
             URL별 메트릭 데이터
         """
-        results = {}
+        results = self._get_cached_metrics([url_info.get('url') for url_info in urls if url_info.get('url')])
         
+        hosts: Dict[str, List[Dict[str, Any]]] = {}
         for url_info in urls:
             url = url_info.get('url')
-            source = url_info.get('source', 'unknown')
-            
-            if url:
-                results[url] = self.collect_metrics(url, source)
-                # API 제한을 고려한 딜레이
-                time.sleep(0.5)
+            if url and url not in results:
+                hosts.setdefault(urlparse(url).netloc, []).append(url_info)
+        
+        if not hosts:
+            return results
+        
+        validators = self._get_validators(
+            [url_info['url'] for url_infos in hosts.values() for url_info in url_infos]
+        )
+        
+        async with self._new_client() as client:
+            host_results = await asyncio.gather(
+                *[self._collect_host_metrics(url_infos, client, validators) for url_infos in hosts.values()]
+            )
+        
+        fetched = {}
+        for host_result in host_results:
+            fetched.update(host_result)
+        
+        self._set_cached_metrics(fetched, validators)
+        results.update(fetched)
+        
+        return results
+    
+    @staticmethod
+    def _cache_key(url: str) -> str:
+        """URL별 메트릭 캐시 키를 생성합니다."""
+        return f"metrics:{hashlib.sha1(url.encode('utf-8')).hexdigest()}"
+    
+    @staticmethod
+    def _validator_key(url: str) -> str:
+        """URL별 ETag/Last-Modified 캐시 키를 생성합니다."""
+        return f"metrics:validator:{hashlib.sha1(url.encode('utf-8')).hexdigest()}"
+    
+    def _get_validators(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """URL별 이전 ETag/Last-Modified를 MGET 한 번으로 조회합니다 (없으면 빈 딕셔너리)."""
+        validators = {url: {} for url in urls}
+        if not urls:
+            return validators
+        
+        try:
+            values = self.redis_client.mget([self._validator_key(url) for url in urls])
+        except redis.RedisError as e:
+            logger.warning("메트릭 검증값 조회 실패: %s", e)
+            return validators
+        
+        for url, value in zip(urls, values):
+            if value:
+                validators[url] = json.loads(value)
+        
+        return validators
+    
+    def _get_cached_metrics(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """캐시된 메트릭을 MGET 한 번으로 조회합니다 (Redis 오류 시 빈 결과)."""
+        if not urls:
+            return {}
+        
+        try:
+            values = self.redis_client.mget([self._cache_key(url) for url in urls])
+        except redis.RedisError as e:
+            logger.warning("메트릭 캐시 조회 실패: %s", e)
+            return {}
+        
+        return {url: json.loads(value) for url, value in zip(urls, values) if value}
+    
+    def _set_cached_metrics(
+        self,
+        metrics_by_url: Dict[str, Dict[str, Any]],
+        validators: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> None:
+        """수집한 메트릭과 ETag/Last-Modified를 파이프라인으로 캐시합니다 (실패한 수집은 짧게 캐시)."""
+        if not metrics_by_url:
+            return
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for url, metrics in metrics_by_url.items():
+                # 기본 메트릭(source='unknown')은 수집 실패를 뜻함
+                ttl = METRICS_NEGATIVE_TTL if metrics.get('source') == 'unknown' else METRICS_CACHE_TTL
+                pipe.setex(self._cache_key(url), ttl, json.dumps(metrics))
+            for url, validator in (validators or {}).items():
+                if validator.get('metrics'):
+                    pipe.setex(self._validator_key(url), METRICS_VALIDATOR_TTL, json.dumps(validator))
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning("메트릭 캐시 저장 실패: %s", e)
+    
+    async def _collect_host_metrics(
+        self,
+        url_infos: List[Dict[str, Any]],
+        client: httpx.AsyncClient,
+        validators: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """한 호스트의 URL들을 요청 간 딜레이를 두고 순서대로 수집합니다."""
+        results = {}
+        
+        for i, url_info in enumerate(url_infos):
+            if i:
+                # API 제한을 고려한 호스트별 딜레이
+                await asyncio.sleep(PER_HOST_DELAY)
+            url = url_info['url']
+            results[url] = await self.collect_metrics(
+                url, url_info.get('source', 'unknown'), client, validators.get(url)
+            )
         
         return results
 
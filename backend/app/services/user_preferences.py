@@ -5,19 +5,120 @@
 팔로잉 기업 관리, 알림 설정, 필터링 옵션을 제공합니다.
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, asc
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import and_, desc, asc, func, select, update
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
+import copy
 import logging
-import json
+import orjson
+import redis
 
 from ..models.user import User, UserSession
 from ..models.company import Company, UserFollowing
 from ..repo.redis_client import get_redis_client
+from ..utils.service_errors import catch_service_errors
 
 logger = logging.getLogger(__name__)
 
+# 팔로잉 기업 조회 시 한 번에 가져올 행 수 (서버 사이드 커서)
+FOLLOWING_YIELD_PER = 500
+
+# 팔로잉 기업 목록 캐시 (팔로잉을 바꾸는 모든 경로에서 invalidate_following_companies_cache로 삭제)
+FOLLOWING_COMPANIES_CACHE_PREFIX = "following_companies:"
+FOLLOWING_CACHE_TTL = 3600  # 1시간
+
+# 사용자 설정 조회 결과 캐시 (설정 변경 시 갱신, 다른 모듈에서는 invalidate_preferences_cache로 삭제)
+PREFERENCES_CACHE_PREFIX = "user_preferences:"
+PREFERENCES_CACHE_TTL = 600  # 10분
+
+# 사용자 설정 기본값 (요청마다 새로 만들지 않도록 모듈에 한 번만 생성, 수정 금지)
+DEFAULT_PREFERENCES = {
+    "notifications": {
+        "email_notifications": True,
+        "push_notifications": True,
+        "newsletter": False,
+        "market_alerts": True,
+        "company_mentions": True,
+        "price_alerts": False,
+        "news_digest": True
+    },
+    "display": {
+        "theme": "light",
+        "language": "ko",
+        "timezone": "Asia/Seoul",
+        "date_format": "YYYY-MM-DD",
+        "currency": "KRW"
+    },
+    "filtering": {
+        "min_confidence_score": 0.5,
+        "max_articles_per_day": 50,
+        "excluded_sources": [],
+        "included_keywords": [],
+        "excluded_keywords": []
+    },
+    "ai_settings": {
+        "summary_length": "medium",  # short, medium, long
+        "include_sentiment": True,
+        "include_insights": True,
+        "auto_tagging": True
+    }
+}
+
+# 알림 설정 기본값 (수정 금지)
+DEFAULT_NOTIFICATION_SETTINGS = {
+    "email_notifications": True,
+    "push_notifications": True,
+    "newsletter": False,
+    "market_alerts": True,
+    "company_mentions": True,
+    "price_alerts": False,
+    "news_digest": True,
+    "digest_frequency": "daily",  # daily, weekly, monthly
+    "digest_time": "09:00",
+    "quiet_hours": {
+        "enabled": False,
+        "start_time": "22:00",
+        "end_time": "08:00"
+    }
+}
+
+
+def invalidate_following_companies_cache(user_id: str) -> None:
+    """
+    사용자의 팔로잉 기업 목록 캐시를 삭제합니다.
+    
+    팔로잉을 추가·삭제·변경하는 모든 경로(다른 API 모듈 포함)에서 DB 커밋 후 호출합니다.
+    Redis 오류는 기록만 하고 무시합니다 (캐시는 TTL이 지나면 만료됨).
+    
+    Parameters
+    ----------
+    user_id : str
+        사용자 ID
+    """
+    try:
+        get_redis_client().delete(f"{FOLLOWING_COMPANIES_CACHE_PREFIX}{user_id}")
+    except redis.RedisError as e:
+        logger.warning(f"팔로잉 기업 캐시 삭제 실패: {str(e)}")
+
+
+def invalidate_preferences_cache(user_id: str) -> None:
+    """
+    사용자의 설정 조회 캐시를 삭제합니다.
+    
+    설정이나 알림 설정을 바꾸는 경로(다른 API 모듈 포함)에서 DB 커밋 후 호출합니다.
+    Redis 오류는 기록만 하고 무시합니다 (캐시는 TTL이 지나면 만료됨).
+    
+    Parameters
+    ----------
+    user_id : str
+        사용자 ID (google_id)
+    """
+    try:
+        get_redis_client().delete(f"{PREFERENCES_CACHE_PREFIX}{user_id}")
+    except redis.RedisError as e:
+        logger.warning(f"사용자 설정 캐시 삭제 실패: {str(e)}")
+
 
 class UserPreferencesService:
     """사용자 설정 서비스"""
@@ -25,7 +126,37 @@ class UserPreferencesService:
     def __init__(self, db: Session):
         self.db = db
         self.redis_client = get_redis_client()
+        # google_id → users.id (한 번 찾은 사용자는 기본 키로 세션의 identity map에서 조회)
+        self._user_pks: Dict[str, int] = {}
+    
+    def _get_user(self, user_id: str) -> Optional[User]:
+        """google_id로 사용자를 조회합니다 (같은 서비스 안에서는 기본 키 조회로 재사용)."""
+        user_pk = self._user_pks.get(user_id)
+        if user_pk is not None:
+            return self.db.get(User, user_pk)
+        
+        user = self.db.query(User).filter(User.google_id == user_id).first()
+        if user:
+            self._user_pks[user_id] = user.id
+        return user
     
+    def _get_cached(self, cache_key: str) -> Optional[Any]:
+        """캐시된 값을 조회합니다 (없거나 Redis 오류 시 None → 호출자가 DB에서 조회)."""
+        try:
+            cached = self.redis_client.get(cache_key)
+        except redis.RedisError as e:
+            logger.warning(f"캐시 조회 실패 ({cache_key}): {str(e)}")
+            return None
+        return orjson.loads(cached) if cached else None
+    
+    def _set_cached(self, cache_key: str, ttl: int, value: Any) -> None:
+        """값을 캐시합니다 (Redis 오류는 기록만 하고 무시)."""
+        try:
+            self.redis_client.setex(cache_key, ttl, orjson.dumps(value))
+        except redis.RedisError as e:
+            logger.warning(f"캐시 저장 실패 ({cache_key}): {str(e)}")
+    
+    @catch_service_errors("사용자 설정 조회 실패")
     def get_user_preferences(self, user_id: str) -> Dict[str, Any]:
         """
         사용자 설정을 조회합니다.
@@ -40,72 +171,56 @@ class UserPreferencesService:
         Dict[str, Any]
             사용자 설정 정보
         """
-        try:
-            # 사용자 정보 조회
-            user = self.db.query(User).filter(User.google_id == user_id).first()
-            if not user:
-                return {"error": "사용자를 찾을 수 없습니다."}
-            
-            # 기본 설정값
-            default_preferences = {
-                "notifications": {
-                    "email_notifications": True,
-                    "push_notifications": True,
-                    "newsletter": False,
-                    "market_alerts": True,
-                    "company_mentions": True,
-                    "price_alerts": False,
-                    "news_digest": True
-                },
-                "display": {
-                    "theme": "light",
-                    "language": "ko",
-                    "timezone": "Asia/Seoul",
-                    "date_format": "YYYY-MM-DD",
-                    "currency": "KRW"
-                },
-                "filtering": {
-                    "min_confidence_score": 0.5,
-                    "max_articles_per_day": 50,
-                    "excluded_sources": [],
-                    "included_keywords": [],
-                    "excluded_keywords": []
-                },
-                "ai_settings": {
-                    "summary_length": "medium",  # short, medium, long
-                    "include_sentiment": True,
-                    "include_insights": True,
-                    "auto_tagging": True
-                }
-            }
-            
-            # 사용자 설정과 기본값 병합
-            user_preferences = user.preferences or {}
-            merged_preferences = self._merge_preferences(default_preferences, user_preferences)
-            
-            return {
-                "user_id": user_id,
-                "preferences": merged_preferences,
-                "last_updated": user.updated_at.isoformat() if user.updated_at else None,
-                "generated_at": datetime.utcnow().isoformat()
-            }
-            
-        except Exception as e:
-            logger.error(f"사용자 설정 조회 실패: {str(e)}")
-            return {"error": str(e)}
+        # 캐시에 있으면 DB 조회와 병합을 생략
+        cache_key = f"{PREFERENCES_CACHE_PREFIX}{user_id}"
+        cached = self._get_cached(cache_key)
+        if cached:
+            return cached
+        
+        # 사용자 정보 조회
+        user = self._get_user(user_id)
+        if not user:
+            return {"error": "사용자를 찾을 수 없습니다."}
+        
+        result = self._build_preferences_result(user_id, user.preferences, user.updated_at)
+        self._set_cached(cache_key, PREFERENCES_CACHE_TTL, result)
+        
+        return result
+    
+    def _build_preferences_result(
+        self,
+        user_id: str,
+        preferences: Optional[Dict[str, Any]],
+        updated_at: Optional[datetime],
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """기본값과 병합한 사용자 설정 조회 결과를 만듭니다 (캐시에도 같은 형태로 저장)."""
+        return {
+            "user_id": user_id,
+            "preferences": self._merge_preferences(DEFAULT_PREFERENCES, preferences or {}),
+            "last_updated": updated_at.isoformat() if updated_at else None,
+            "generated_at": (now or datetime.utcnow()).isoformat()
+        }
     
     def _merge_preferences(self, default: Dict, user: Dict) -> Dict:
-        """설정값을 병합합니다."""
-        result = default.copy()
+        """
+        설정값을 병합합니다.
+        
+        양쪽 모두 딕셔너리인 키만 재귀적으로 병합합니다. 나머지 값은 깊은 복사해
+        결과를 수정해도 모듈 기본값(DEFAULT_*)이나 입력 딕셔너리가 바뀌지 않습니다.
+        """
+        result = {}
         
-        for key, value in user.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_preferences(result[key], value)
+        for key, value in {**default, **user}.items():
+            default_value = default.get(key)
+            if key in user and isinstance(default_value, dict) and isinstance(value, dict):
+                result[key] = self._merge_preferences(default_value, value)
             else:
-                result[key] = value
+                result[key] = copy.deepcopy(value)
         
         return result
     
+    @catch_service_errors("사용자 설정 업데이트 실패", rollback=True)
     def update_user_preferences(self, user_id: str, preferences: Dict[str, Any]) -> Dict[str, Any]:
         """
         사용자 설정을 업데이트합니다.
@@ -122,41 +237,40 @@ class UserPreferencesService:
         Dict[str, Any]
             업데이트 결과
         """
-        try:
-            # 사용자 정보 조회
-            user = self.db.query(User).filter(User.google_id == user_id).first()
-            if not user:
-                return {"error": "사용자를 찾을 수 없습니다."}
-            
-            # 기존 설정과 병합
-            current_preferences = user.preferences or {}
-            updated_preferences = self._merge_preferences(current_preferences, preferences)
-            
-            # 데이터베이스 업데이트
-            user.preferences = updated_preferences
-            user.updated_at = datetime.utcnow()
-            self.db.commit()
-            
-            # Redis 캐시 업데이트
-            cache_key = f"user_preferences:{user_id}"
-            self.redis_client.setex(
-                cache_key, 
-                3600,  # 1시간 TTL
-                json.dumps(updated_preferences)
-            )
-            
-            return {
-                "user_id": user_id,
-                "preferences": updated_preferences,
-                "updated_at": user.updated_at.isoformat(),
-                "message": "설정이 성공적으로 업데이트되었습니다."
-            }
-            
-        except Exception as e:
-            self.db.rollback()
-            logger.error(f"사용자 설정 업데이트 실패: {str(e)}")
-            return {"error": str(e)}
+        # 병합에 필요한 설정 컬럼만 조회 (ORM 객체를 로드하지 않음)
+        row = self.db.query(User.preferences).filter(User.google_id == user_id).first()
+        if not row:
+            return {"error": "사용자를 찾을 수 없습니다."}
+        
+        # 기존 설정과 병합
+        current_preferences = row.preferences or {}
+        updated_preferences = self._merge_preferences(current_preferences, preferences)
+        
+        # 데이터베이스 업데이트
+        updated_at = datetime.utcnow()
+        self.db.execute(
+            update(User)
+            .where(User.google_id == user_id)
+            .values(preferences=updated_preferences, updated_at=updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        
+        # Redis 캐시 업데이트 (get_user_preferences 결과와 같은 형태로 저장)
+        self._set_cached(
+            f"{PREFERENCES_CACHE_PREFIX}{user_id}",
+            PREFERENCES_CACHE_TTL,
+            self._build_preferences_result(user_id, updated_preferences, updated_at, now=updated_at)
+        )
+        
+        return {
+            "user_id": user_id,
+            "preferences": updated_preferences,
+            "updated_at": updated_at.isoformat(),
+            "message": "설정이 성공적으로 업데이트되었습니다."
+        }
     
+    @catch_service_errors("팔로잉 기업 조회 실패")
     def get_following_companies(self, user_id: str) -> Dict[str, Any]:
         """
         팔로잉한 기업 목록을 조회합니다.
@@ -171,53 +285,59 @@ class UserPreferencesService:
         Dict[str, Any]
             팔로잉 기업 목록
         """
-        try:
-            # 팔로잉 기업 조회
-            following_companies = self.db.query(
-                Company.id,
-                Company.name,
-                Company.symbol,
-                Company.stock_market,
-                Company.industry,
-                UserFollowing.priority,
-                UserFollowing.created_at,
-                UserFollowing.notes
-            ).join(
-                UserFollowing, Company.id == UserFollowing.company_id
-            ).filter(
-                and_(
-                    UserFollowing.user_id == user_id,
-                    Company.is_active == True
-                )
-            ).order_by(
-                desc(UserFollowing.priority),
-                asc(Company.name)
-            ).all()
-            
-            companies = []
-            for company in following_companies:
-                companies.append({
-                    "company_id": company.id,
-                    "name": company.name,
-                    "symbol": company.symbol,
-                    "stock_market": company.stock_market,
-                    "industry": company.industry,
-                    "priority": company.priority,
-                    "followed_at": company.created_at.isoformat(),
-                    "notes": company.notes
-                })
-            
-            return {
-                "user_id": user_id,
-                "total_companies": len(companies),
-                "companies": companies,
-                "generated_at": datetime.utcnow().isoformat()
+        # 캐시된 팔로잉 목록이 있으면 JOIN 조회를 생략
+        cache_key = f"{FOLLOWING_COMPANIES_CACHE_PREFIX}{user_id}"
+        companies = self._get_cached(cache_key)
+        if companies is None:
+            companies = self._query_following_companies(user_id)
+            self._set_cached(cache_key, FOLLOWING_CACHE_TTL, companies)
+        
+        return {
+            "user_id": user_id,
+            "total_companies": len(companies),
+            "companies": companies,
+            "generated_at": datetime.utcnow().isoformat()
+        }
+    
+    def _query_following_companies(self, user_id: str) -> List[Dict[str, Any]]:
+        """팔로잉 기업 목록을 DB에서 조회합니다 (우선순위, 기업명 순)."""
+        following_companies = self.db.query(
+            Company.id,
+            Company.name,
+            Company.stock_symbol.label("symbol"),
+            Company.stock_market,
+            Company.industry,
+            UserFollowing.priority,
+            UserFollowing.created_at,
+            UserFollowing.notes
+        ).join(
+            UserFollowing, Company.id == UserFollowing.company_id
+        ).filter(
+            and_(
+                UserFollowing.user_id == user_id,
+                Company.is_active == True
+            )
+        ).order_by(
+            desc(UserFollowing.priority),
+            asc(Company.name)
+        ).execution_options(yield_per=FOLLOWING_YIELD_PER)
+        
+        # 결과 전체를 버퍼링하지 않고 배치 단위로 읽으며 바로 응답 행으로 변환
+        return [
+            {
+                "company_id": company.id,
+                "name": company.name,
+                "symbol": company.symbol,
+                "stock_market": company.stock_market,
+                "industry": company.industry,
+                "priority": company.priority,
+                "followed_at": company.created_at.isoformat() if company.created_at else None,
+                "notes": company.notes
             }
-            
-        except Exception as e:
-            logger.error(f"팔로잉 기업 조회 실패: {str(e)}")
-            return {"error": str(e)}
+            for company in following_companies
+        ]
     
+    @catch_service_errors("기업 팔로잉 실패", rollback=True)
     def add_following_company(self, user_id: str, company_id: int, priority: int = 0, notes: str = "") -> Dict[str, Any]:
         """
         기업을 팔로잉합니다.
@@ -238,53 +358,48 @@ class UserPreferencesService:
         Dict[str, Any]
             팔로잉 결과
         """
-        try:
-            # 기업 존재 확인
-            company = self.db.query(Company).filter(Company.id == company_id).first()
-            if not company:
-                return {"error": "기업을 찾을 수 없습니다."}
-            
-            # 이미 팔로잉 중인지 확인
-            existing_following = self.db.query(UserFollowing).filter(
-                and_(
-                    UserFollowing.user_id == user_id,
-                    UserFollowing.company_id == company_id
-                )
-            ).first()
-            
-            if existing_following:
-                return {"error": "이미 팔로잉 중인 기업입니다."}
-            
-            # 팔로잉 추가
-            new_following = UserFollowing(
-                user_id=user_id,
-                company_id=company_id,
-                priority=priority,
-                notes=notes,
-                created_at=datetime.utcnow()
+        # 기업 존재 확인
+        company = self.db.query(Company).filter(Company.id == company_id).first()
+        if not company:
+            return {"error": "기업을 찾을 수 없습니다."}
+        
+        # 이미 팔로잉 중인지 확인
+        existing_following = self.db.query(UserFollowing).filter(
+            and_(
+                UserFollowing.user_id == user_id,
+                UserFollowing.company_id == company_id
             )
-            
-            self.db.add(new_following)
-            self.db.commit()
-            
-            # Redis 캐시 업데이트
-            self._update_following_cache(user_id)
-            
-            return {
-                "user_id": user_id,
-                "company_id": company_id,
-                "company_name": company.name,
-                "priority": priority,
-                "notes": notes,
-                "followed_at": new_following.created_at.isoformat(),
-                "message": "기업을 성공적으로 팔로잉했습니다."
-            }
-            
-        except Exception as e:
-            self.db.rollback()
-            logger.error(f"기업 팔로잉 실패: {str(e)}")
-            return {"error": str(e)}
+        ).first()
+        
+        if existing_following:
+            return {"error": "이미 팔로잉 중인 기업입니다."}
+        
+        # 팔로잉 추가
+        new_following = UserFollowing(
+            user_id=user_id,
+            company_id=company_id,
+            priority=priority,
+            notes=notes,
+            created_at=datetime.utcnow()
+        )
+        
+        self.db.add(new_following)
+        self.db.commit()
+        
+        # Redis 캐시 업데이트
+        self._update_following_cache(user_id)
+        
+        return {
+            "user_id": user_id,
+            "company_id": company_id,
+            "company_name": company.name,
+            "priority": priority,
+            "notes": notes,
+            "followed_at": new_following.created_at.isoformat(),
+            "message": "기업을 성공적으로 팔로잉했습니다."
+        }
     
+    @catch_service_errors("기업 팔로잉 해제 실패", rollback=True)
     def remove_following_company(self, user_id: str, company_id: int) -> Dict[str, Any]:
         """
         기업 팔로잉을 해제합니다.
@@ -301,36 +416,31 @@ class UserPreferencesService:
         Dict[str, Any]
             팔로잉 해제 결과
         """
-        try:
-            # 팔로잉 정보 조회
-            following = self.db.query(UserFollowing).filter(
-                and_(
-                    UserFollowing.user_id == user_id,
-                    UserFollowing.company_id == company_id
-                )
-            ).first()
-            
-            if not following:
-                return {"error": "팔로잉 중인 기업이 아닙니다."}
-            
-            # 팔로잉 해제
-            self.db.delete(following)
-            self.db.commit()
-            
-            # Redis 캐시 업데이트
-            self._update_following_cache(user_id)
-            
-            return {
-                "user_id": user_id,
-                "company_id": company_id,
-                "message": "기업 팔로잉을 해제했습니다."
-            }
-            
-        except Exception as e:
-            self.db.rollback()
-            logger.error(f"기업 팔로잉 해제 실패: {str(e)}")
-            return {"error": str(e)}
+        # 팔로잉 정보 조회
+        following = self.db.query(UserFollowing).filter(
+            and_(
+                UserFollowing.user_id == user_id,
+                UserFollowing.company_id == company_id
+            )
+        ).first()
+        
+        if not following:
+            return {"error": "팔로잉 중인 기업이 아닙니다."}
+        
+        # 팔로잉 해제
+        self.db.delete(following)
+        self.db.commit()
+        
+        # Redis 캐시 업데이트
+        self._update_following_cache(user_id)
+        
+        return {
+            "user_id": user_id,
+            "company_id": company_id,
+            "message": "기업 팔로잉을 해제했습니다."
+        }
     
+    @catch_service_errors("우선순위 업데이트 실패", rollback=True)
     def update_following_priority(self, user_id: str, company_id: int, priority: int) -> Dict[str, Any]:
         """
         팔로잉 기업의 우선순위를 업데이트합니다.
@@ -349,58 +459,58 @@ class UserPreferencesService:
         Dict[str, Any]
             우선순위 업데이트 결과
         """
-        try:
-            # 팔로잉 정보 조회
-            following = self.db.query(UserFollowing).filter(
+        # 조회 없이 UPDATE 한 번으로 갱신하고, 갱신된 행이 없으면 팔로잉 중이 아님
+        updated = self.db.execute(
+            update(UserFollowing)
+            .where(
                 and_(
                     UserFollowing.user_id == user_id,
                     UserFollowing.company_id == company_id
                 )
-            ).first()
-            
-            if not following:
-                return {"error": "팔로잉 중인 기업이 아닙니다."}
-            
-            # 우선순위 업데이트
-            following.priority = priority
-            following.updated_at = datetime.utcnow()
-            self.db.commit()
-            
-            # Redis 캐시 업데이트
-            self._update_following_cache(user_id)
-            
-            return {
-                "user_id": user_id,
-                "company_id": company_id,
-                "priority": priority,
-                "message": "우선순위가 업데이트되었습니다."
-            }
-            
-        except Exception as e:
+            )
+            .values(priority=priority, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        
+        if not updated:
             self.db.rollback()
-            logger.error(f"우선순위 업데이트 실패: {str(e)}")
-            return {"error": str(e)}
+            return {"error": "팔로잉 중인 기업이 아닙니다."}
+        
+        self.db.commit()
+        
+        # Redis 캐시 업데이트
+        self._update_following_cache(user_id)
+        
+        return {
+            "user_id": user_id,
+            "company_id": company_id,
+            "priority": priority,
+            "message": "우선순위가 업데이트되었습니다."
+        }
     
     def _update_following_cache(self, user_id: str):
         """팔로잉 캐시를 업데이트합니다."""
         try:
             # 팔로잉 기업 ID 목록 조회
-            following_ids = self.db.query(UserFollowing.company_id).filter(
-                UserFollowing.user_id == user_id
-            ).all()
+            company_ids = self.db.execute(
+                select(UserFollowing.company_id).where(UserFollowing.user_id == user_id)
+            ).scalars().all()
             
-            # Redis에 저장
+            # Redis 명령을 파이프라인으로 묶어 한 번에 전송
             cache_key = f"following:{user_id}"
-            self.redis_client.delete(cache_key)
-            
-            if following_ids:
-                company_ids = [str(company_id[0]) for company_id in following_ids]
-                self.redis_client.sadd(cache_key, *company_ids)
-                self.redis_client.expire(cache_key, 3600)  # 1시간 TTL
+            with self.redis_client.pipeline(transaction=False) as pipe:
+                # 팔로잉 목록 캐시는 다음 조회 때 다시 채움
+                pipe.delete(f"{FOLLOWING_COMPANIES_CACHE_PREFIX}{user_id}")
+                pipe.delete(cache_key)
+                if company_ids:
+                    pipe.sadd(cache_key, *company_ids)
+                    pipe.expire(cache_key, FOLLOWING_CACHE_TTL)
+                pipe.execute()
             
         except Exception as e:
             logger.error(f"팔로잉 캐시 업데이트 실패: {str(e)}")
     
+    @catch_service_errors("알림 설정 조회 실패")
     def get_notification_settings(self, user_id: str) -> Dict[str, Any]:
         """
         알림 설정을 조회합니다.
@@ -415,47 +525,25 @@ class UserPreferencesService:
         Dict[str, Any]
             알림 설정 정보
         """
-        try:
-            # 사용자 정보 조회
-            user = self.db.query(User).filter(User.google_id == user_id).first()
-            if not user:
-                return {"error": "사용자를 찾을 수 없습니다."}
-            
-            # 알림 설정 조회
-            notification_settings = user.notification_settings or {}
-            
-            # 기본 알림 설정
-            default_notifications = {
-                "email_notifications": True,
-                "push_notifications": True,
-                "newsletter": False,
-                "market_alerts": True,
-                "company_mentions": True,
-                "price_alerts": False,
-                "news_digest": True,
-                "digest_frequency": "daily",  # daily, weekly, monthly
-                "digest_time": "09:00",
-                "quiet_hours": {
-                    "enabled": False,
-                    "start_time": "22:00",
-                    "end_time": "08:00"
-                }
-            }
-            
-            # 사용자 설정과 기본값 병합
-            merged_settings = self._merge_preferences(default_notifications, notification_settings)
-            
-            return {
-                "user_id": user_id,
-                "notification_settings": merged_settings,
-                "last_updated": user.updated_at.isoformat() if user.updated_at else None,
-                "generated_at": datetime.utcnow().isoformat()
-            }
-            
-        except Exception as e:
-            logger.error(f"알림 설정 조회 실패: {str(e)}")
-            return {"error": str(e)}
+        # 사용자 정보 조회
+        user = self._get_user(user_id)
+        if not user:
+            return {"error": "사용자를 찾을 수 없습니다."}
+        
+        # 알림 설정 조회
+        notification_settings = user.notification_settings or {}
+        
+        # 사용자 설정과 기본값 병합
+        merged_settings = self._merge_preferences(DEFAULT_NOTIFICATION_SETTINGS, notification_settings)
+        
+        return {
+            "user_id": user_id,
+            "notification_settings": merged_settings,
+            "last_updated": user.updated_at.isoformat() if user.updated_at else None,
+            "generated_at": datetime.utcnow().isoformat()
+        }
     
+    @catch_service_errors("알림 설정 업데이트 실패", rollback=True)
     def update_notification_settings(self, user_id: str, settings: Dict[str, Any]) -> Dict[str, Any]:
         """
         알림 설정을 업데이트합니다.
@@ -472,33 +560,36 @@ class UserPreferencesService:
         Dict[str, Any]
             업데이트 결과
         """
-        try:
-            # 사용자 정보 조회
-            user = self.db.query(User).filter(User.google_id == user_id).first()
-            if not user:
-                return {"error": "사용자를 찾을 수 없습니다."}
-            
-            # 기존 설정과 병합
-            current_settings = user.notification_settings or {}
-            updated_settings = self._merge_preferences(current_settings, settings)
-            
-            # 데이터베이스 업데이트
-            user.notification_settings = updated_settings
-            user.updated_at = datetime.utcnow()
-            self.db.commit()
-            
-            return {
-                "user_id": user_id,
-                "notification_settings": updated_settings,
-                "updated_at": user.updated_at.isoformat(),
-                "message": "알림 설정이 업데이트되었습니다."
-            }
-            
-        except Exception as e:
-            self.db.rollback()
-            logger.error(f"알림 설정 업데이트 실패: {str(e)}")
-            return {"error": str(e)}
+        # 병합에 필요한 알림 설정 컬럼만 조회
+        row = self.db.query(User.notification_settings).filter(User.google_id == user_id).first()
+        if not row:
+            return {"error": "사용자를 찾을 수 없습니다."}
+        
+        # 기존 설정과 병합
+        current_settings = row.notification_settings or {}
+        updated_settings = self._merge_preferences(current_settings, settings)
+        
+        # 데이터베이스 업데이트
+        updated_at = datetime.utcnow()
+        self.db.execute(
+            update(User)
+            .where(User.google_id == user_id)
+            .values(notification_settings=updated_settings, updated_at=updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        
+        # 설정 조회 캐시의 last_updated가 바뀌므로 무효화
+        invalidate_preferences_cache(user_id)
+        
+        return {
+            "user_id": user_id,
+            "notification_settings": updated_settings,
+            "updated_at": updated_at.isoformat(),
+            "message": "알림 설정이 업데이트되었습니다."
+        }
     
+    @catch_service_errors("사용자 대시보드 데이터 조회 실패")
     def get_user_dashboard_data(self, user_id: str) -> Dict[str, Any]:
         """
         사용자 대시보드 데이터를 조회합니다.
@@ -513,43 +604,53 @@ class UserPreferencesService:
         Dict[str, Any]
             대시보드 데이터
         """
-        try:
-            # 사용자 정보 조회
-            user = self.db.query(User).filter(User.google_id == user_id).first()
-            if not user:
-                return {"error": "사용자를 찾을 수 없습니다."}
-            
-            # 팔로잉 기업 수
-            following_count = self.db.query(UserFollowing).filter(
-                UserFollowing.user_id == user_id
-            ).count()
-            
-            # 최근 활동 (최근 7일)
-            recent_activity = self.db.query(UserFollowing).filter(
-                and_(
-                    UserFollowing.user_id == user_id,
-                    UserFollowing.created_at >= datetime.utcnow() - timedelta(days=7)
-                )
-            ).count()
-            
-            # 사용자 설정
-            preferences = self.get_user_preferences(user_id)
-            notification_settings = self.get_notification_settings(user_id)
-            
-            return {
-                "user_id": user_id,
-                "user_name": user.name,
-                "user_email": user.email,
-                "user_picture": user.picture,
-                "following_count": following_count,
-                "recent_activity": recent_activity,
-                "preferences": preferences.get("preferences", {}),
-                "notification_settings": notification_settings.get("notification_settings", {}),
-                "last_login": user.last_login.isoformat() if user.last_login else None,
-                "created_at": user.created_at.isoformat(),
-                "generated_at": datetime.utcnow().isoformat()
-            }
-            
-        except Exception as e:
-            logger.error(f"사용자 대시보드 데이터 조회 실패: {str(e)}")
-            return {"error": str(e)}
+        # 사용자 행과 팔로잉 집계를 한 번에 조회 (전체 팔로잉 수, 최근 7일 팔로잉 수)
+        now = datetime.utcnow()
+        cutoff = now - timedelta(days=7)
+        following_stats = select(
+            func.count(UserFollowing.id).label("following_count"),
+            func.count(UserFollowing.id).filter(
+                UserFollowing.created_at >= cutoff
+            ).label("recent_activity")
+        ).where(UserFollowing.user_id == user_id).subquery()
+        
+        row = self.db.query(
+            User,
+            following_stats.c.following_count,
+            following_stats.c.recent_activity
+        ).options(
+            # 대시보드에 쓰는 컬럼만 로드 (JSON 설정 컬럼도 같은 SELECT에서 함께 로드)
+            load_only(
+                User.name,
+                User.email,
+                User.picture,
+                User.preferences,
+                User.notification_settings,
+                User.last_login,
+                User.created_at
+            )
+        ).filter(User.google_id == user_id).first()
+        if not row:
+            return {"error": "사용자를 찾을 수 없습니다."}
+        
+        user, following_count, recent_activity = row
+        
+        # 이미 조회한 사용자 행으로 설정을 병합 (추가 조회 없음)
+        preferences = self._merge_preferences(DEFAULT_PREFERENCES, user.preferences or {})
+        notification_settings = self._merge_preferences(
+            DEFAULT_NOTIFICATION_SETTINGS, user.notification_settings or {}
+        )
+        
+        return {
+            "user_id": user_id,
+            "user_name": user.name,
+            "user_email": user.email,
+            "user_picture": user.picture,
+            "following_count": following_count,
+            "recent_activity": recent_activity,
+            "preferences": preferences,
+            "notification_settings": notification_settings,
+            "last_login": user.last_login.isoformat() if user.last_login else None,
+            "created_at": user.created_at.isoformat(),
+            "generated_at": now.isoformat()
+        }
@@ -1,5 +1,10 @@
 """OpenAI API 비용 계산 유틸리티"""
-from typing import Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken은 선택 의존성 (없으면 글자 수로 토큰 추정)
+    tiktoken = None
 
 # OpenAI GPT 모델별 1000 토큰당 비용 (USD)
 MODEL_COSTS = {
@@ -17,6 +22,48 @@ MODEL_COSTS = {
     }
 }
 
+# 토큰 1개당 (입력, 출력) 비용 (호출마다 1000으로 나누지 않도록 미리 계산)
+COST_PER_TOKEN = {
+    model: (costs["input"] / 1000, costs["output"] / 1000)
+    for model, costs in MODEL_COSTS.items()
+}
+
+# 모델별 tiktoken 인코더 캐시 (로드 실패한 모델은 None으로 기록)
+_ENCODERS: Dict[str, Optional[Any]] = {}
+
+def _get_encoder(model_name: str) -> Optional[Any]:
+    """모델별 tiktoken 인코더를 한 번만 로드해 재사용합니다."""
+    if model_name in _ENCODERS:
+        return _ENCODERS[model_name]
+    
+    encoder = None
+    if tiktoken is not None:
+        try:
+            encoder = tiktoken.encoding_for_model(model_name)
+        except Exception:  # 알 수 없는 모델, 인코딩 파일을 받을 수 없는 환경 등
+            encoder = None
+    
+    _ENCODERS[model_name] = encoder
+    return encoder
+
+def count_tokens(text: str, model_name: str = "gpt-3.5-turbo") -> int:
+    """
+    텍스트의 토큰 수 계산
+    
+    Args:
+        text: 토큰 수를 셀 텍스트
+        model_name: 사용할 모델명
+        
+    Returns:
+        int: 토큰 수 (tiktoken을 쓸 수 없으면 3글자당 1토큰으로 추정)
+    """
+    encoder = _get_encoder(model_name)
+    if encoder is None:
+        # 간단한 토큰 추정 (영어 기준 약 4글자 = 1토큰, 한국어 기준 약 2글자 = 1토큰)
+        return len(text) // 3  # 평균적으로 3글자당 1토큰
+    
+    return len(encoder.encode(text))
+
 def calculate_openai_cost(
     model_name: str, 
     tokens_in: int, 
@@ -38,27 +85,26 @@ def calculate_openai_cost(
         >>> print(f"총 비용: ${cost:.4f}")
         >>> print(f"상세 내역: {breakdown}")
     """
-    if model_name not in MODEL_COSTS:
+    if model_name not in COST_PER_TOKEN:
         # 알 수 없는 모델은 gpt-3.5-turbo 기준으로 계산
         model_name = "gpt-3.5-turbo"
     
-    model_cost = MODEL_COSTS[model_name]
+    input_per_token, output_per_token = COST_PER_TOKEN[model_name]
     
-    # 1000 토큰 단위로 비용 계산
-    input_cost = (tokens_in / 1000) * model_cost["input"]
-    output_cost = (tokens_out / 1000) * model_cost["output"]
-    total_cost = input_cost + output_cost
+    input_cost = tokens_in * input_per_token
+    output_cost = tokens_out * output_per_token
+    total_cost = round(input_cost + output_cost, 6)
     
     breakdown = {
         "input_tokens": tokens_in,
         "output_tokens": tokens_out,
         "input_cost": round(input_cost, 6),
         "output_cost": round(output_cost, 6),
-        "total_cost": round(total_cost, 6),
+        "total_cost": total_cost,
         "model": model_name
     }
     
-    return round(total_cost, 6), breakdown
+    return total_cost, breakdown
 
 def estimate_cost_for_text(text: str, model_name: str = "gpt-3.5-turbo") -> Dict[str, float]:
     """
@@ -75,8 +121,7 @@ def estimate_cost_for_text(text: str, model_name: str = "gpt-3.5-turbo") -> Dict
         >>> cost_info = estimate_cost_for_text("긴 텍스트...", "gpt-4")
         >>> print(f"예상 비용: ${cost_info['estimated_cost']:.4f}")
     """
-    # 간단한 토큰 추정 (영어 기준 약 4글자 = 1토큰, 한국어 기준 약 2글자 = 1토큰)
-    estimated_tokens = len(text) // 3  # 평균적으로 3글자당 1토큰
+    estimated_tokens = count_tokens(text, model_name)
     
     # 출력 토큰은 입력의 약 30%로 추정
     estimated_output = int(estimated_tokens * 0.3)
@@ -0,0 +1,57 @@
+"""콘텐츠 지문(fingerprint) 계산 유틸리티"""
+import hashlib
+import re
+import unicodedata
+
+# 지문 계산에 사용할 본문 앞부분 길이 (뒤쪽의 매체별 꼬리말 차이를 무시)
+FINGERPRINT_TEXT_CHARS = 3000
+
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_EMAIL_RE = re.compile(r"\S+@\S+\.\S+")
+_WHITESPACE_RE = re.compile(r"\s+")
+# 매체마다 덧붙이는 저작권·재배포 금지 문구
+_BOILERPLATE_RE = re.compile(
+    r"(ⓒ|©|copyright|all rights reserved|무단\s*전재|재배포\s*금지)[^\n]*",
+    re.IGNORECASE,
+)
+
+
+def normalize_text(text: str) -> str:
+    """
+    매체별 표기 차이를 지우도록 텍스트를 정규화합니다.
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        str: 유니코드 정규화·소문자화·꼬리말/URL 제거·공백 정리를 거친 텍스트
+
+    Examples:
+        >>> normalize_text("  Hello\\n\\n  WORLD  ")
+        'hello world'
+    """
+    # 꼬리말을 먼저 지움 (NFKC는 ⓒ를 c로 바꿔 꼬리말 패턴이 맞지 않게 됨)
+    text = _BOILERPLATE_RE.sub(" ", text or "")
+    text = unicodedata.normalize("NFKC", text)
+    text = _URL_RE.sub(" ", text)
+    text = _EMAIL_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text.lower()).strip()
+
+
+def content_fingerprint(title: str, raw_text: str) -> str:
+    """
+    URL이 달라도 같은 기사면 같은 값이 나오는 콘텐츠 지문을 계산합니다.
+
+    Args:
+        title: 기사 제목
+        raw_text: 기사 본문 (앞 FINGERPRINT_TEXT_CHARS자만 사용)
+
+    Returns:
+        str: 64자리 16진수 BLAKE2b 해시
+
+    Examples:
+        >>> content_fingerprint("Title", "Body") == content_fingerprint(" title ", "BODY")
+        True
+    """
+    normalized = normalize_text(title) + "\n" + normalize_text((raw_text or "")[:FINGERPRINT_TEXT_CHARS])
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=32).hexdigest()
@@ -0,0 +1,39 @@
+"""서비스 메서드 오류 처리 유틸리티"""
+import functools
+import logging
+from typing import Any, Callable, Dict
+
+
+def catch_service_errors(message: str, rollback: bool = False) -> Callable:
+    """
+    서비스 메서드의 예외를 {"error": ...} 응답으로 바꾸는 데코레이터
+
+    메서드 본문은 예외를 그대로 올리고, 로깅·롤백·오류 응답 변환은 바깥 호출에서 한 번만 처리합니다.
+
+    Args:
+        message: 로그에 남길 실패 메시지
+        rollback: 예외 발생 시 self.db 세션을 롤백할지 여부
+
+    Returns:
+        Callable: 데코레이터
+
+    Examples:
+        >>> @catch_service_errors("사용자 설정 업데이트 실패", rollback=True)
+        ... def update_user_preferences(self, user_id, preferences): ...
+    """
+    def decorator(method: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+        logger = logging.getLogger(method.__module__)
+
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+            try:
+                return method(self, *args, **kwargs)
+            except Exception as e:
+                if rollback:
+                    self.db.rollback()
+                logger.error(f"{message}: {str(e)}")
+                return {"error": str(e)}
+
+        return wrapper
+
+    return decorator
@@ -9,33 +9,15 @@ from celery.schedules import crontab
 
 # Celery Beat 스케줄 설정
 BEAT_SCHEDULE = {
-    # 한국 뉴스 수집 (30분마다)
-    'korean-news-30min': {
-        'task': 'scheduled_korean_news_ingestion',
-        'schedule': crontab(minute='*/30'),  # 30분마다
+    # RSS 롤링 수집 (1분마다, 가장 오래 수집하지 않은 피드부터 최대 20개)
+    # 피드별 수집 간격은 multi_rss.FEED_MIN_INTERVAL(30분)로 유지됨
+    'rss-rolling-1min': {
+        'task': 'scheduled_rolling_ingestion',
+        'schedule': 60.0,  # 1분마다
         'options': {
-            'queue': 'rss_ingestion',
-            'priority': 5
-        }
-    },
-    
-    # 미국 뉴스 수집 (30분마다)
-    'us-news-30min': {
-        'task': 'scheduled_us_news_ingestion', 
-        'schedule': crontab(minute='*/30'),  # 30분마다
-        'options': {
-            'queue': 'rss_ingestion',
-            'priority': 5
-        }
-    },
-    
-    # 전체 뉴스 수집 (매일 새벽 2시)
-    'all-news-daily': {
-        'task': 'scheduled_all_news_ingestion',
-        'schedule': crontab(hour=2, minute=0),  # 매일 새벽 2시
-        'options': {
-            'queue': 'rss_ingestion',
-            'priority': 3
+            'queue': 'net',
+            'priority': 5,
+            'expires': 55  # 다음 실행 전까지 시작하지 못한 실행은 버림 (큐에 밀린 실행이 몰리지 않도록)
         }
     },
     
@@ -44,7 +26,7 @@ BEAT_SCHEDULE = {
         'task': 'collect_social_metrics_task',
         'schedule': crontab(minute='*/15'),  # 15분마다
         'options': {
-            'queue': 'rss_ingestion',
+            'queue': 'net',
             'priority': 4
         }
     },
@@ -54,7 +36,17 @@ BEAT_SCHEDULE = {
         'task': 'process_popular_news_task',
         'schedule': crontab(minute='*/30'),  # 30분마다
         'options': {
-            'queue': 'rss_ingestion',
+            'queue': 'net',
+            'priority': 3
+        }
+    },
+    
+    # 인기도 점수 재계산 (10분마다, 최신성 점수 반영)
+    'popularity-rescore': {
+        'task': 'rescore_popularity_task',
+        'schedule': crontab(minute='*/10'),  # 10분마다
+        'options': {
+            'queue': 'default',
             'priority': 3
         }
     },
@@ -75,10 +67,9 @@ BEAT_TIMEZONE = 'Asia/Seoul'
 
 # 스케줄 설명
 SCHEDULE_DESCRIPTIONS = {
-    'korean-news-30min': '한국 뉴스 RSS 수집 (30분마다)',
-    'us-news-30min': '미국 뉴스 RSS 수집 (30분마다)', 
-    'all-news-daily': '전체 뉴스 RSS 수집 (매일 새벽 2시)',
+    'rss-rolling-1min': 'RSS 롤링 수집 (1분마다, 오래된 피드부터 최대 20개)',
     'social-metrics-collection': '소셜 미디어 메트릭 수집 (15분마다)',
     'popular-news-analysis': '인기 뉴스 10개 AI 요약 (30분마다)',
+    'popularity-rescore': '인기도 점수 재계산 (10분마다)',
     'health-check': '시스템 상태 확인 (5분마다)'
 }
@@ -1,24 +1,84 @@
 import os
+import orjson
 from celery import Celery
+from celery.signals import task_postrun, worker_init
+from kombu.serialization import register
 from .beat_config import BEAT_SCHEDULE, BEAT_TIMEZONE
+from ..repo.db import SessionLocal
 
 broker_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
 backend_url = os.getenv("REDIS_URL", "redis://redis:6379/1")
 
-celery = Celery("insighthub", broker=broker_url, backend=backend_url)
+# 태스크 메시지와 결과를 orjson으로 직렬화 (바이트를 그대로 주고받음)
+register(
+    "orjson",
+    lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="binary",
+)
 
-# 태스크 라우팅 설정
+# 워커 시작 시 가져올 태스크 모듈 (autodiscover는 각 패키지의 tasks 모듈만 찾음)
+celery = Celery(
+    "insighthub",
+    broker=broker_url,
+    backend=backend_url,
+    include=[
+        "backend.app.workers.tasks",
+        "backend.app.workers.scheduled_tasks",
+        "backend.app.workers.company_tasks",
+    ],
+)
+
+# 외부 HTTP(OpenAI, RSS, 소셜 API) 응답을 기다리는 시간이 대부분인 태스크용 큐
+# 이 큐는 스레드 풀 워커가 높은 동시성으로 처리함 (infra/docker-compose.yml의 worker_net)
+NETWORK_QUEUE = "net"
+
+# 네트워크 태스크 공통 옵션: 처리가 끝난 뒤 ack해 워커가 죽으면 다른 워커가 다시 받도록 함
+# (스레드 풀의 net 워커는 soft_time_limit/time_limit을 강제하지 않으므로 시간 제한은 태스크 코드가
+#  요청 타임아웃, asyncio.wait_for, 마감 시각 확인으로 직접 지킴. tasks.py, scheduled_tasks.py 참고)
+NETWORK_TASK_OPTIONS = {
+    "acks_late": True,
+    "reject_on_worker_lost": True,
+}
+
+# 태스크 라우팅 설정 (라우팅되지 않은 태스크는 prefork 워커의 default 큐로)
+celery.conf.task_default_queue = "default"
 celery.conf.task_routes = {
+    "tasks.summarize": {"queue": NETWORK_QUEUE},
+    "tasks.summarize_batch": {"queue": NETWORK_QUEUE},
+    "collect_social_metrics_task": {"queue": NETWORK_QUEUE},
+    "process_popular_news_task": {"queue": NETWORK_QUEUE},
+    "scheduled_*_ingestion": {"queue": NETWORK_QUEUE},
     "backend.app.workers.tasks.*": {"queue": "default"},
     "backend.app.workers.scheduled_tasks.*": {"queue": "rss_ingestion"},
 }
 
-# Celery Beat 설정
+# 직렬화 설정 (배포 중 남아 있는 json 메시지도 받을 수 있게 허용)
+celery.conf.task_serializer = "orjson"
+celery.conf.result_serializer = "orjson"
+celery.conf.accept_content = ["orjson", "json"]
+
+# Celery Beat 설정 (스케줄 상태를 로컬 shelve 파일 대신 Redis에 저장)
 celery.conf.beat_schedule = BEAT_SCHEDULE
 celery.conf.timezone = BEAT_TIMEZONE
+celery.conf.beat_scheduler = "redbeat.RedBeatScheduler"
+celery.conf.redbeat_redis_url = broker_url
+
+
+@task_postrun.connect
+def remove_db_session(**kwargs) -> None:
+    """태스크가 끝날 때마다 현재 스레드의 scoped 세션을 정리 (연결은 풀로 반환되어 재사용)"""
+    SessionLocal.remove()
+
 
-# 태스크 등록
-celery.autodiscover_tasks(['backend.app.workers'])
+@worker_init.connect
+def preload_ingestion_modules(**kwargs) -> None:
+    """
+    워커 시작 시 RSS 수집 모듈(feedparser, readability/lxml 포함)을 미리 import
 
-# 태스크 수동 등록
-# from . import tasks, scheduled_tasks  # 순환 import 방지
+    수집 태스크는 순환 import를 피하려고 함수 안에서 import하므로, 미리 올려 두지 않으면
+    워커 시작 후 첫 수집 태스크가 모듈 로딩 시간을 떠안음.
+    prefork 풀은 자식 프로세스가 fork로 로드된 모듈을 물려받고, 스레드 풀은 같은 프로세스를 사용함.
+    """
+    from ..services.ingest import multi_rss  # noqa: F401
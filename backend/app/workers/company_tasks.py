@@ -6,19 +6,32 @@
 2단계: 팔로잉 기업 관련 뉴스만 AI 요약
 """
 
-from celery import shared_task
+from celery import group, shared_task
 from datetime import datetime
 from typing import Dict, Any, List
 import logging
+import time
+
+from sqlalchemy import DateTime, bindparam, delete, func, select, update
 
 from ..repo.db import SessionLocal
-from ..services.company_extractor import process_all_pending_companies, extract_companies_from_content
+from ..services.company_extractor import (
+    extract_companies_from_content,
+    get_pending_content_ids,
+    process_pending_companies_for_ids,
+)
 # from ..services.company_summarizer import summarize_following_companies  # TODO: 구현 예정
 from ..models.company import Company, UserFollowing, CompanyMention
 from ..models.content import Content
 
 logger = logging.getLogger(__name__)
 
+# 일괄 기업 추출 시 배치 태스크 하나가 처리할 콘텐츠 수
+EXTRACTION_CHUNK_SIZE = 20
+
+# 오래된 언급 데이터 정리 시 한 번에 삭제할 행 수
+MENTION_CLEANUP_BATCH_SIZE = 10000
+
 
 @shared_task(bind=True, name="extract_companies_from_content")
 def extract_companies_from_content_task(self, content_id: int) -> Dict[str, Any]:
@@ -50,7 +63,7 @@ def extract_companies_from_content_task(self, content_id: int) -> Dict[str, Any]
             "content_id": content_id,
             "status": "success",
             "result": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": int(time.time())
         }
         
     except Exception as e:
@@ -61,15 +74,23 @@ def extract_companies_from_content_task(self, content_id: int) -> Dict[str, Any]
             "content_id": content_id,
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": int(time.time())
         }
 
 
 @shared_task(bind=True, name="process_all_pending_companies")
-def process_all_pending_companies_task(self) -> Dict[str, Any]:
+def process_all_pending_companies_task(self, limit: int = 100) -> Dict[str, Any]:
     """
     처리되지 않은 모든 콘텐츠에서 기업명 추출
     
+    대상 콘텐츠 ID만 조회해 EXTRACTION_CHUNK_SIZE개씩 나눈 배치 태스크를 group으로
+    등록하고 바로 반환합니다 (추출은 여러 워커에서 병렬로 진행).
+    
+    Parameters
+    ----------
+    limit : int
+        처리할 최대 콘텐츠 수
+    
     Returns
     -------
     Dict[str, Any]
@@ -80,26 +101,78 @@ def process_all_pending_companies_task(self) -> Dict[str, Any]:
     
     try:
         db = SessionLocal()
-        result = process_all_pending_companies(db)
+        content_ids = get_pending_content_ids(db, limit)
         db.close()
         
-        logger.info(f"일괄 기업 추출 완료 - Task ID: {task_id}, Result: {result}")
+        chunks = [
+            content_ids[i:i + EXTRACTION_CHUNK_SIZE]
+            for i in range(0, len(content_ids), EXTRACTION_CHUNK_SIZE)
+        ]
+        group_result = None
+        if chunks:
+            group_result = group(extract_companies_batch_task.s(chunk) for chunk in chunks).apply_async()
+        
+        logger.info(f"일괄 기업 추출 등록 완료 - Task ID: {task_id}, Contents: {len(content_ids)}, Chunks: {len(chunks)}")
+        
+        return {
+            "task_id": task_id,
+            "status": "dispatched",
+            "content_count": len(content_ids),
+            "chunk_task_ids": [task.id for task in group_result.results] if group_result else [],
+            "timestamp": int(time.time())
+        }
+        
+    except Exception as e:
+        logger.error(f"일괄 기업 추출 실패 - Task ID: {task_id}, Error: {str(e)}")
+        
+        return {
+            "task_id": task_id,
+            "status": "error",
+            "error": str(e),
+            "timestamp": int(time.time())
+        }
+
+
+@shared_task(bind=True, name="extract_companies_batch")
+def extract_companies_batch_task(self, content_ids: List[int]) -> Dict[str, Any]:
+    """
+    콘텐츠 묶음에서 기업명 추출
+    
+    Parameters
+    ----------
+    content_ids : List[int]
+        콘텐츠 ID 목록
+        
+    Returns
+    -------
+    Dict[str, Any]
+        처리 결과
+    """
+    task_id = self.request.id
+    logger.info(f"기업 추출 배치 시작 - Contents: {len(content_ids)}, Task ID: {task_id}")
+    
+    try:
+        db = SessionLocal()
+        result = process_pending_companies_for_ids(content_ids, db)
+        db.close()
+        
+        logger.info(f"기업 추출 배치 완료 - Task ID: {task_id}, Result: {result}")
         
         return {
             "task_id": task_id,
             "status": "success",
             "result": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": int(time.time())
         }
         
     except Exception as e:
-        logger.error(f"일괄 기업 추출 실패 - Task ID: {task_id}, Error: {str(e)}")
+        logger.error(f"기업 추출 배치 실패 - Task ID: {task_id}, Error: {str(e)}")
         
         return {
             "task_id": task_id,
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": int(time.time())
         }
 
 
@@ -138,27 +211,35 @@ def update_company_statistics_task(self) -> Dict[str, Any]:
     try:
         db = SessionLocal()
         
-        # 각 기업별 통계 업데이트
-        companies = db.query(Company).all()
-        updated_count = 0
+        # 기업별 언급 횟수와 마지막 언급일을 GROUP BY 한 번으로 집계
+        stats = {
+            company_id: (mention_count, last_mentioned_at)
+            for company_id, mention_count, last_mentioned_at in db.query(
+                CompanyMention.company_id,
+                func.count(CompanyMention.id),
+                func.max(CompanyMention.created_at)
+            ).group_by(CompanyMention.company_id)
+        }
         
-        for company in companies:
-            # 언급 횟수 업데이트
-            mention_count = db.query(CompanyMention).filter(
-                CompanyMention.company_id == company.id
-            ).count()
-            
-            company.total_mentions = mention_count
-            
-            # 마지막 언급일 업데이트
-            last_mention = db.query(CompanyMention).filter(
-                CompanyMention.company_id == company.id
-            ).order_by(CompanyMention.created_at.desc()).first()
-            
-            if last_mention:
-                company.last_mentioned_at = last_mention.created_at
-            
-            updated_count += 1
+        # Company 객체를 로드하지 않고 ID만 조회해 Core UPDATE executemany 한 번으로 갱신
+        # (언급이 없으면 0, 마지막 언급일은 집계 값이 있을 때만 덮어씀)
+        mappings = []
+        for company_id in db.execute(select(Company.id)).scalars():
+            mention_count, last_mentioned_at = stats.get(company_id, (0, None))
+            mappings.append({"b_id": company_id, "b_count": mention_count, "b_last": last_mentioned_at})
+        
+        if mappings:
+            companies = Company.__table__
+            db.connection().execute(
+                update(companies)
+                .where(companies.c.id == bindparam("b_id"))
+                .values(
+                    total_mentions=bindparam("b_count"),
+                    last_mentioned_at=func.coalesce(bindparam("b_last", type_=DateTime), companies.c.last_mentioned_at)
+                ),
+                mappings
+            )
+        updated_count = len(mappings)
         
         db.commit()
         db.close()
@@ -169,7 +250,7 @@ def update_company_statistics_task(self) -> Dict[str, Any]:
             "task_id": task_id,
             "status": "success",
             "updated_companies": updated_count,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": int(time.time())
         }
         
     except Exception as e:
@@ -179,7 +260,7 @@ def update_company_statistics_task(self) -> Dict[str, Any]:
             "task_id": task_id,
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": int(time.time())
         }
 
 
@@ -209,11 +290,24 @@ def cleanup_old_mentions_task(self, days: int = 30) -> Dict[str, Any]:
         # 오래된 언급 데이터 삭제
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
-        deleted_mentions = db.query(CompanyMention).filter(
+        # 한 번에 지우지 않고 배치 단위로 삭제·커밋해 잠금과 WAL 증가를 짧게 유지
+        old_mention_ids = select(CompanyMention.id).where(
             CompanyMention.created_at < cutoff_date
-        ).delete()
+        ).limit(MENTION_CLEANUP_BATCH_SIZE)
+        
+        deleted_mentions = 0
+        while True:
+            deleted = db.execute(
+                delete(CompanyMention)
+                .where(CompanyMention.id.in_(old_mention_ids))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+            
+            deleted_mentions += deleted
+            if deleted < MENTION_CLEANUP_BATCH_SIZE:
+                break
         
-        db.commit()
         db.close()
         
         logger.info(f"오래된 언급 데이터 정리 완료 - Task ID: {task_id}, Deleted: {deleted_mentions}")
@@ -223,7 +317,7 @@ def cleanup_old_mentions_task(self, days: int = 30) -> Dict[str, Any]:
             "status": "success",
             "deleted_mentions": deleted_mentions,
             "cutoff_date": cutoff_date.isoformat(),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": int(time.time())
         }
         
     except Exception as e:
@@ -233,5 +327,5 @@ def cleanup_old_mentions_task(self, days: int = 30) -> Dict[str, Any]:
             "task_id": task_id,
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": int(time.time())
         }
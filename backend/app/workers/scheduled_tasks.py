@@ -6,23 +6,33 @@ Celery Beat을 사용하여 정기적으로 RSS 피드를 자동 수집합니다
 """
 
 from celery import shared_task
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 import logging
+import time
 
 # from ..services.ingest.multi_rss import ingest_multiple_feeds  # 순환 import 방지
 
+from .celery_app import NETWORK_TASK_OPTIONS
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# RSS 수집 태스크 시간 제한 (초). net 워커의 스레드 풀은 Celery 시간 제한을 강제하지 않으므로
+# 수집 루프가 마감 시각을 확인해 남은 피드를 건너뛰고 timeout 결과를 반환함
+INGESTION_DEADLINE = 300
 
-@shared_task(bind=True, name="scheduled_rss_ingestion")
-def scheduled_rss_ingestion(self, feed_groups: Optional[list] = None) -> Dict[str, Any]:
+HEALTH_CHECK_RECENT_HOURS = 1  # 헬스 체크에서 최근 콘텐츠로 셀 기간 (시간)
+
+
+def _run_ingestion(task_id: str, feed_groups: Optional[list] = None) -> Dict[str, Any]:
     """
-    스케줄링된 RSS 피드 수집 태스크
+    RSS 피드를 현재 워커에서 바로 수집하고 태스크 결과 형태로 반환
     
     Parameters
     ----------
+    task_id : str
+        로그와 결과에 남길 태스크 ID
     feed_groups : Optional[list], optional
         수집할 피드 그룹 목록. None이면 모든 그룹 수집
         
@@ -31,22 +41,24 @@ def scheduled_rss_ingestion(self, feed_groups: Optional[list] = None) -> Dict[st
     Dict[str, Any]
         수집 결과 통계
     """
-    task_id = self.request.id
     logger.info(f"스케줄링된 RSS 수집 시작 - Task ID: {task_id}")
     
     try:
-        # 순환 import 방지를 위해 함수 내에서 import
+        # 순환 import 방지를 위해 함수 내에서 import (모듈은 워커 시작 시 미리 로드됨, celery_app 참고)
         from ..services.ingest.multi_rss import ingest_multiple_feeds
         # RSS 피드 수집 실행
-        result = ingest_multiple_feeds(feed_groups)
+        result = ingest_multiple_feeds(feed_groups, deadline=time.monotonic() + INGESTION_DEADLINE)
         
-        logger.info(f"RSS 수집 완료 - Task ID: {task_id}, 수집된 기사: {result['total_saved']}개")
+        if result["timed_out"]:
+            logger.warning(f"RSS 수집 시간 초과 - Task ID: {task_id}, 수집된 기사: {result['total_saved']}개")
+        else:
+            logger.info(f"RSS 수집 완료 - Task ID: {task_id}, 수집된 기사: {result['total_saved']}개")
         
         return {
             "task_id": task_id,
-            "status": "success",
+            "status": "timeout" if result["timed_out"] else "success",
             "result": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": int(time.time())
         }
         
     except Exception as e:
@@ -56,11 +68,37 @@ def scheduled_rss_ingestion(self, feed_groups: Optional[list] = None) -> Dict[st
             "task_id": task_id,
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": int(time.time())
         }
 
 
-@shared_task(bind=True, name="scheduled_korean_news_ingestion")
+@shared_task(
+    bind=True,
+    name="scheduled_rss_ingestion",
+    **NETWORK_TASK_OPTIONS
+)
+def scheduled_rss_ingestion(self, feed_groups: Optional[list] = None) -> Dict[str, Any]:
+    """
+    스케줄링된 RSS 피드 수집 태스크
+    
+    Parameters
+    ----------
+    feed_groups : Optional[list], optional
+        수집할 피드 그룹 목록. None이면 모든 그룹 수집
+        
+    Returns
+    -------
+    Dict[str, Any]
+        수집 결과 통계
+    """
+    return _run_ingestion(self.request.id, feed_groups)
+
+
+@shared_task(
+    bind=True,
+    name="scheduled_korean_news_ingestion",
+    **NETWORK_TASK_OPTIONS
+)
 def scheduled_korean_news_ingestion(self) -> Dict[str, Any]:
     """
     한국 뉴스 RSS 피드 수집 (매시간)
@@ -71,10 +109,15 @@ def scheduled_korean_news_ingestion(self) -> Dict[str, Any]:
         수집 결과 통계
     """
     logger.info("한국 뉴스 RSS 수집 시작")
-    return scheduled_rss_ingestion.delay(['korean']).get()
+    # 이미 워커 안에서 실행 중이므로 다른 태스크로 넘기지 않고 바로 수집
+    return _run_ingestion(self.request.id, ['korean'])
 
 
-@shared_task(bind=True, name="scheduled_us_news_ingestion")
+@shared_task(
+    bind=True,
+    name="scheduled_us_news_ingestion",
+    **NETWORK_TASK_OPTIONS
+)
 def scheduled_us_news_ingestion(self) -> Dict[str, Any]:
     """
     미국 뉴스 RSS 피드 수집 (30분마다)
@@ -85,10 +128,15 @@ def scheduled_us_news_ingestion(self) -> Dict[str, Any]:
         수집 결과 통계
     """
     logger.info("미국 뉴스 RSS 수집 시작")
-    return scheduled_rss_ingestion.delay(['us_news']).get()
+    # 이미 워커 안에서 실행 중이므로 다른 태스크로 넘기지 않고 바로 수집
+    return _run_ingestion(self.request.id, ['us_news'])
 
 
-@shared_task(bind=True, name="scheduled_all_news_ingestion")
+@shared_task(
+    bind=True,
+    name="scheduled_all_news_ingestion",
+    **NETWORK_TASK_OPTIONS
+)
 def scheduled_all_news_ingestion(self) -> Dict[str, Any]:
     """
     모든 뉴스 RSS 피드 수집 (매일 새벽 2시)
@@ -99,7 +147,55 @@ def scheduled_all_news_ingestion(self) -> Dict[str, Any]:
         수집 결과 통계
     """
     logger.info("전체 뉴스 RSS 수집 시작")
-    return scheduled_rss_ingestion.delay().get()
+    # 이미 워커 안에서 실행 중이므로 다른 태스크로 넘기지 않고 바로 수집
+    return _run_ingestion(self.request.id)
+
+
+@shared_task(
+    bind=True,
+    name="scheduled_rolling_ingestion",
+    **NETWORK_TASK_OPTIONS
+)
+def scheduled_rolling_ingestion(self) -> Dict[str, Any]:
+    """
+    가장 오래 수집하지 않은 RSS 피드 묶음 수집 (1분마다)
+    
+    Returns
+    -------
+    Dict[str, Any]
+        수집 결과 통계
+    """
+    task_id = self.request.id
+    
+    try:
+        # 순환 import 방지를 위해 함수 내에서 import (모듈은 워커 시작 시 미리 로드됨, celery_app 참고)
+        from ..services.ingest.multi_rss import ingest_rolling_batch
+        result = ingest_rolling_batch(deadline=time.monotonic() + INGESTION_DEADLINE)
+        
+        if result["timed_out"]:
+            logger.warning(f"롤링 RSS 수집 시간 초과 - Task ID: {task_id}, 수집된 기사: {result['total_saved']}개")
+        else:
+            logger.info(
+                f"롤링 RSS 수집 완료 - Task ID: {task_id}, 피드: {len(result['feed_results'])}개, "
+                f"수집된 기사: {result['total_saved']}개"
+            )
+        
+        return {
+            "task_id": task_id,
+            "status": "timeout" if result["timed_out"] else "success",
+            "result": result,
+            "timestamp": int(time.time())
+        }
+        
+    except Exception as e:
+        logger.error(f"롤링 RSS 수집 실패 - Task ID: {task_id}, 에러: {str(e)}")
+        
+        return {
+            "task_id": task_id,
+            "status": "error",
+            "error": str(e),
+            "timestamp": int(time.time())
+        }
 
 
 @shared_task(bind=True, name="health_check")
@@ -113,24 +209,28 @@ def health_check(self) -> Dict[str, Any]:
         시스템 상태 정보
     """
     try:
-        from ..repo.db import engine
-        from ..repo.content import ContentRepo
+        from sqlalchemy import func, select, text
+        from ..models.content import Content
         from ..repo.db import SessionLocal
         
         # 데이터베이스 연결 확인
         db = SessionLocal()
-        repo = ContentRepo(db)
+        db.execute(text("SELECT 1")).scalar_one()
         
-        # 최근 콘텐츠 수 확인
-        recent_contents = repo.list_contents(tags=None, limit=10, offset=0)
+        # 최근 1시간 동안 발행된 콘텐츠 수 (행을 가져오지 않고 COUNT만 조회)
+        recent_contents = db.execute(
+            select(func.count()).select_from(Content).where(
+                Content.published_at >= datetime.utcnow() - timedelta(hours=HEALTH_CHECK_RECENT_HOURS)
+            )
+        ).scalar_one()
         
         db.close()
         
         return {
             "status": "healthy",
             "database": "connected",
-            "recent_contents": len(recent_contents),
-            "timestamp": datetime.now().isoformat()
+            "recent_contents": recent_contents,
+            "timestamp": int(time.time())
         }
         
     except Exception as e:
@@ -138,5 +238,5 @@ def health_check(self) -> Dict[str, Any]:
         return {
             "status": "unhealthy",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": int(time.time())
         }
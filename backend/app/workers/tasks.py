@@ -1,20 +1,168 @@
-from .celery_app import celery
+from .celery_app import NETWORK_TASK_OPTIONS, celery
 from ..repo.db import SessionLocal
+from ..repo.content import ContentRepo
 from ..models.content import Content, AICache
 from ..models.cost_log import CostLog
 from ..core.config import settings
 from ..utils.cost_calculator import calculate_openai_cost
-from ..services.popular_news_analyzer import PopularNewsAnalyzer
-from ..services.social_metrics_collector import SocialMetricsCollector
-import json
+from ..utils.fingerprint import content_fingerprint
+from ..services.popular_news_analyzer import PopularNewsAnalyzer, score_batch
+from ..services.social_metrics_collector import SocialMetricsCollector, classify_batch
+import asyncio
+import httpx
+import logging
+import orjson
+import re
+import threading
+import time
+from cachetools import TTLCache
+from itertools import chain, islice
+from types import SimpleNamespace
 from openai import OpenAI
-from typing import List, Dict, Any
-from datetime import datetime
+from sqlalchemy import and_, bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import load_only
+from typing import Callable, List, Dict, Any, Optional
+from datetime import datetime, timedelta
 
-# OpenAI 클라이언트 설정
-client = OpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+OPENAI_MAX_CONNECTIONS = 100  # OpenAI HTTP 클라이언트의 최대 동시 연결 수
+OPENAI_MAX_KEEPALIVE = 50  # 재사용을 위해 열어 둘 유휴 연결 수
+OPENAI_TIMEOUT = httpx.Timeout(60.0, connect=5.0)  # 응답 대기 60초, 연결 5초
+
+# OpenAI 클라이언트 설정 (HTTP/2로 여러 요청을 한 TLS 연결에 다중화, 워커 스레드가 연결 풀을 공유)
+client = OpenAI(
+    api_key=settings.OPENAI_API_KEY,
+    http_client=httpx.Client(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=OPENAI_MAX_KEEPALIVE
+        ),
+        timeout=OPENAI_TIMEOUT
+    )
+) if settings.OPENAI_API_KEY else None
 
 MODEL_VERSION = "gpt-3.5-turbo"
+SUMMARY_BATCH_SIZE = 6  # 요약 요청 하나에 묶을 기사 수
+SUMMARY_MAX_TOKENS_PER_ITEM = 600  # 묶음 요청에서 기사 하나당 허용할 출력 토큰 수
+MAX_CONTENT_TAGS = 15  # 요약 후 콘텐츠에 남길 최대 태그 수
+
+# 네트워크 태스크 시간 제한 (초). net 워커의 스레드 풀은 Celery soft/hard 시간 제한을
+# 강제하지 않으므로 태스크 코드에서 직접 제한함 (celery_app.NETWORK_TASK_OPTIONS 참고)
+SUMMARY_REQUEST_TIMEOUT = 45  # OpenAI 요청 하나의 최대 대기 시간
+SUMMARY_BATCH_DEADLINE = 300  # 묶음 태스크 전체 (지나면 남은 요청을 보내지 않고 다음 실행에 맡김)
+SOCIAL_METRICS_TIMEOUT = 120  # 메트릭 수집 전체
+
+# 요약 태스크가 읽는 콘텐츠 컬럼 (raw_text 전체 대신 앞부분만 조회,
+# source와 published_at은 call_openai_summary의 fallback 요약이 사용)
+SUMMARY_CONTENT_COLUMNS = (
+    Content.id, Content.title, Content.hash, Content.raw_text_head, Content.lang, Content.tags,
+    Content.source, Content.published_at
+)
+SUMMARY_MEMO_SIZE = 10_000  # 프로세스 내 AI 캐시 메모 최대 항목 수
+SUMMARY_MEMO_TTL = 3600  # 프로세스 내 AI 캐시 메모 유지 시간 (초)
+
+# 기사 요약 프롬프트 (단건 요청)
+SUMMARY_SYSTEM_PROMPT = """당신은 뉴스 기사를 분석하는 전문 AI 어시스턴트입니다. 
+주어진 기사를 분석하여 정확히 다음 형식의 JSON으로 응답해주세요:
+
+{
+    "summary_bullets": ["핵심 포인트 1", "핵심 포인트 2", "핵심 포인트 3"],
+    "tags": ["태그1", "태그2", "태그3", "태그4", "태그5"],
+    "insight": "이 기사의 주요 인사이트나 의미를 2-3문장으로 설명"
+}
+
+엄격한 요구사항:
+- summary_bullets: 정확히 3-5개의 핵심 포인트 (각각 한 문장, 구체적이고 명확하게)
+- tags: 정확히 5-8개의 관련 태그 (소문자, 영문, 구체적인 키워드)
+- insight: 정확히 2-3문장으로 기사의 의미와 중요성 분석
+
+JSON 형식을 정확히 준수하고, 다른 텍스트는 포함하지 마세요."""
+
+# 기사 요약 프롬프트 (여러 기사를 한 요청으로 묶을 때)
+BATCH_SUMMARY_SYSTEM_PROMPT = """당신은 뉴스 기사를 분석하는 전문 AI 어시스턴트입니다. 
+[id: 숫자]로 구분된 여러 기사를 각각 분석하여 정확히 다음 형식의 JSON으로 응답해주세요:
+
+{
+    "results": [
+        {
+            "id": 기사 id (숫자),
+            "summary_bullets": ["핵심 포인트 1", "핵심 포인트 2", "핵심 포인트 3"],
+            "tags": ["태그1", "태그2", "태그3", "태그4", "태그5"],
+            "insight": "이 기사의 주요 인사이트나 의미를 2-3문장으로 설명"
+        }
+    ]
+}
+
+엄격한 요구사항:
+- results: 주어진 모든 기사에 대해 하나씩, 기사 id를 그대로 사용
+- summary_bullets: 정확히 3-5개의 핵심 포인트 (각각 한 문장, 구체적이고 명확하게)
+- tags: 정확히 5-8개의 관련 태그 (소문자, 영문, 구체적인 키워드)
+- insight: 정확히 2-3문장으로 기사의 의미와 중요성 분석
+
+JSON 형식을 정확히 준수하고, 다른 텍스트는 포함하지 마세요."""
+
+# 제목 키워드 → 태그 (그룹 이름이 태그, 한 번의 스캔으로 모두 찾음)
+# \b 대신 영문자 경계를 써서 "AI가"처럼 한글이 바로 붙은 경우도 잡고 "aitken" 같은 부분 일치는 제외
+TITLE_TAG_PATTERN = re.compile(
+    r"(?<![a-z])(?:"
+    r"(?P<ai>ai|artificial|intelligence)"
+    r"|(?P<technology>tech|technology)"
+    r"|(?P<cryptocurrency>crypto|bitcoin|blockchain)"
+    r")(?![a-z])",
+    re.IGNORECASE
+)
+
+logger = logging.getLogger(__name__)
+
+# AICache 조회 결과 메모 ((키 종류, 해시/지문, 모델) → 결과, 스레드 풀 워커에서 공유하므로 락으로 보호)
+# 캐시 행은 저장 후 바뀌지 않고 미스는 메모하지 않으므로, 새로 저장한 행도 다음 조회에서 바로 보임
+_summary_memo: TTLCache = TTLCache(maxsize=SUMMARY_MEMO_SIZE, ttl=SUMMARY_MEMO_TTL)
+_summary_memo_lock = threading.Lock()
+
+def _memoized_lookup(
+    kind: str,
+    keys: List[str],
+    model_version: str,
+    query: Callable[[List[str]], Dict[str, Dict[str, Any]]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    메모에 있는 결과는 바로 쓰고, 없는 키만 query로 조회해 메모에 채움
+    
+    Parameters
+    ----------
+    kind : str
+        키 종류 ("hash" 또는 "fp")
+    keys : List[str]
+        조회할 해시 또는 지문 목록
+    model_version : str
+        AI 모델 버전
+    query : Callable[[List[str]], Dict[str, Dict[str, Any]]]
+        메모에 없는 키를 DB에서 조회하는 함수
+        
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        키 → 캐시된 AI 결과 (캐시가 없는 키는 빠짐)
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    missing = []
+    with _summary_memo_lock:
+        for key in set(keys):
+            cached = _summary_memo.get((kind, key, model_version))
+            if cached is None:
+                missing.append(key)
+            else:
+                results[key] = cached
+    
+    if missing:
+        fetched = query(missing)
+        with _summary_memo_lock:
+            for key, cached in fetched.items():
+                _summary_memo[(kind, key, model_version)] = cached
+        results.update(fetched)
+    
+    return results
 
 def get_cached_result(content_hash: str, model_version: str, db: any) -> Dict[str, Any] | None:
     """
@@ -40,22 +188,113 @@ def get_cached_result(content_hash: str, model_version: str, db: any) -> Dict[st
     >>> if cached:
     ...     print(f"Found cached result: {cached['status']}")
     """
-    cached = db.query(AICache).filter_by(
-        content_hash=content_hash, 
-        model_version=model_version
-    ).first()
+    return get_cached_results([content_hash], model_version, db).get(content_hash)
+
+def get_cached_result_by_fp(content_fp: str, model_version: str, db: any) -> Dict[str, Any] | None:
+    """
+    콘텐츠 지문으로 캐시에서 AI 결과 조회
+    
+    URL(해시)이 달라도 본문이 같은 재게재 기사는 같은 지문을 가지므로
+    다른 콘텐츠가 이미 받아 둔 요약을 재사용할 수 있습니다.
+    
+    Parameters
+    ----------
+    content_fp : str
+        콘텐츠 지문 (utils.fingerprint.content_fingerprint)
+    model_version : str
+        AI 모델 버전
+    db : any
+        데이터베이스 세션 객체
+        
+    Returns
+    -------
+    Dict[str, Any] | None
+        캐시된 AI 결과 또는 None
+    """
+    return get_cached_results_by_fp([content_fp], model_version, db).get(content_fp)
+
+def get_cached_results_by_fp(content_fps: List[str], model_version: str, db: any) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 콘텐츠 지문의 캐시된 AI 결과를 한 번에 조회
+    
+    Parameters
+    ----------
+    content_fps : List[str]
+        콘텐츠 지문 목록
+    model_version : str
+        AI 모델 버전
+    db : any
+        데이터베이스 세션 객체
+        
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        콘텐츠 지문 → 캐시된 AI 결과 (캐시가 없는 지문은 빠짐)
+    """
+    if not content_fps:
+        return {}
     
-    if cached:
+    def query(fps: List[str]) -> Dict[str, Dict[str, Any]]:
+        rows = db.query(
+            AICache.content_fp, AICache.summary_bullets, AICache.tags, AICache.insight
+        ).filter(
+            AICache.content_fp.in_(fps),
+            AICache.model_version == model_version
+        )
         return {
-            "status": "cached",
-            "summary_bullets": cached.summary_bullets,
-            "tags": cached.tags,
-            "insight": cached.insight
+            row.content_fp: {
+                "status": "cached",
+                "summary_bullets": row.summary_bullets,
+                "tags": row.tags,
+                "insight": row.insight
+            }
+            for row in rows
         }
-    return None
+    
+    return _memoized_lookup("fp", content_fps, model_version, query)
+
+def get_cached_results(content_hashes: List[str], model_version: str, db: any) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 콘텐츠의 캐시된 AI 결과를 한 번에 조회
+    
+    Parameters
+    ----------
+    content_hashes : List[str]
+        콘텐츠 해시 값 목록
+    model_version : str
+        AI 모델 버전
+    db : any
+        데이터베이스 세션 객체
+        
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        콘텐츠 해시 → 캐시된 AI 결과 (캐시가 없는 해시는 빠짐)
+    """
+    if not content_hashes:
+        return {}
+    
+    def query(hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        rows = db.query(
+            AICache.content_hash, AICache.summary_bullets, AICache.tags, AICache.insight
+        ).filter(
+            AICache.content_hash.in_(hashes),
+            AICache.model_version == model_version
+        )
+        return {
+            row.content_hash: {
+                "status": "cached",
+                "summary_bullets": row.summary_bullets,
+                "tags": row.tags,
+                "insight": row.insight
+            }
+            for row in rows
+        }
+    
+    return _memoized_lookup("hash", content_hashes, model_version, query)
 
 def save_to_cache(content_hash: str, model_version: str, summary_bullets: List[str], 
-                  tags: List[str], insight: str, db: any):
+                  tags: List[str], insight: str, db: any, content_fp: str | None = None):
     """
     AI 결과를 캐시에 저장
     
@@ -73,6 +312,8 @@ def save_to_cache(content_hash: str, model_version: str, summary_bullets: List[s
         생성된 인사이트 텍스트
     db : any
         데이터베이스 세션 객체
+    content_fp : str | None, optional
+        콘텐츠 지문 (재게재 기사 캐시 조회용)
         
     Examples
     --------
@@ -80,14 +321,36 @@ def save_to_cache(content_hash: str, model_version: str, summary_bullets: List[s
     ...               ["point1", "point2"], ["tag1", "tag2"], 
     ...               "insight text", db_session)
     """
-    cache_entry = AICache(
-        content_hash=content_hash,
-        model_version=model_version,
-        summary_bullets=summary_bullets,
-        tags=tags,
-        insight=insight
+    save_many_to_cache([{
+        "content_hash": content_hash,
+        "content_fp": content_fp,
+        "model_version": model_version,
+        "summary_bullets": summary_bullets,
+        "tags": tags,
+        "insight": insight
+    }], db)
+
+def save_many_to_cache(cache_rows: List[Dict[str, Any]], db: any):
+    """
+    여러 AI 결과를 INSERT 한 번으로 캐시에 저장
+    
+    다른 워커가 같은 콘텐츠를 먼저 저장했으면 (content_hash, model_version)
+    충돌을 무시하고 건너뜁니다 (ON CONFLICT DO NOTHING).
+    
+    Parameters
+    ----------
+    cache_rows : List[Dict[str, Any]]
+        AICache 컬럼 이름을 키로 하는 행 목록
+    db : any
+        데이터베이스 세션 객체
+    """
+    if not cache_rows:
+        return
+    
+    db.execute(
+        pg_insert(AICache).on_conflict_do_nothing(index_elements=["content_hash", "model_version"]),
+        cache_rows
     )
-    db.add(cache_entry)
 
 def call_openai_summary(content: Content) -> Dict[str, Any]:
     """
@@ -110,7 +373,7 @@ def call_openai_summary(content: Content) -> Dict[str, Any]:
         
     Examples
     --------
-    >>> content = Content(title="AI News", raw_text="AI is advancing...")
+    >>> content = db.query(Content).options(load_only(*SUMMARY_CONTENT_COLUMNS)).get(123)
     >>> result = call_openai_summary(content)
     >>> if result["status"] == "success":
     ...     print(f"Generated {len(result['summary_bullets'])} summaries")
@@ -120,35 +383,19 @@ def call_openai_summary(content: Content) -> Dict[str, Any]:
             raise Exception("OpenAI API key not configured")
             
         # 콘텐츠 텍스트 준비 (제목 + 본문)
-        text_to_analyze = f"제목: {content.title}\n\n본문: {content.raw_text[:3000]}"  # 3000자 제한
+        text_to_analyze = f"제목: {content.title}\n\n본문: {content.raw_text_head or ''}"  # 3000자 제한
         
-        # 개선된 프롬프트
-        system_prompt = """당신은 뉴스 기사를 분석하는 전문 AI 어시스턴트입니다. 
-주어진 기사를 분석하여 정확히 다음 형식의 JSON으로 응답해주세요:
-
-{
-    "summary_bullets": ["핵심 포인트 1", "핵심 포인트 2", "핵심 포인트 3"],
-    "tags": ["태그1", "태그2", "태그3", "태그4", "태그5"],
-    "insight": "이 기사의 주요 인사이트나 의미를 2-3문장으로 설명"
-}
-
-엄격한 요구사항:
-- summary_bullets: 정확히 3-5개의 핵심 포인트 (각각 한 문장, 구체적이고 명확하게)
-- tags: 정확히 5-8개의 관련 태그 (소문자, 영문, 구체적인 키워드)
-- insight: 정확히 2-3문장으로 기사의 의미와 중요성 분석
-
-JSON 형식을 정확히 준수하고, 다른 텍스트는 포함하지 마세요."""
-
         # OpenAI API 호출
         response = client.chat.completions.create(
             model=MODEL_VERSION,
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
                 {"role": "user", "content": text_to_analyze}
             ],
             max_tokens=1200,
             temperature=0.3,  # 더 일관된 결과를 위해 낮춤
-            response_format={"type": "json_object"}  # JSON 응답 강제
+            response_format={"type": "json_object"},  # JSON 응답 강제
+            timeout=SUMMARY_REQUEST_TIMEOUT
         )
         
         # 토큰 사용량 및 비용 계산
@@ -157,7 +404,7 @@ JSON 형식을 정확히 준수하고, 다른 텍스트는 포함하지 마세
         cost_usd, cost_breakdown = calculate_openai_cost(MODEL_VERSION, tokens_in, tokens_out)
         
         # 응답 파싱
-        result = json.loads(response.choices[0].message.content)
+        result = orjson.loads(response.choices[0].message.content)
         
         # 결과 검증 및 정제
         summary_bullets = result.get("summary_bullets", [])[:5]  # 최대 5개
@@ -177,7 +424,7 @@ JSON 형식을 정확히 준수하고, 다른 텍스트는 포함하지 마세
             }
         }
         
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         # JSON 파싱 실패 시 fallback
         return {
             "status": "json_error",
@@ -204,7 +451,122 @@ JSON 형식을 정확히 준수하고, 다른 텍스트는 포함하지 마세
             "insight": f"OpenAI API 호출 중 오류가 발생했습니다: {str(e)[:200]}. 기본 요약을 제공합니다."
         }
 
-@celery.task(name="tasks.summarize")
+def call_openai_summary_batch(contents: List[Content], deadline: Optional[float] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    여러 콘텐츠를 OpenAI 요청 하나로 묶어 요약 및 태그 생성
+    
+    시스템 프롬프트와 HTTP 왕복을 기사들이 나눠 쓰도록 [id: ...]로 구분한 기사 목록을
+    한 메시지로 보내고, 응답의 results 배열을 id로 다시 나눕니다. 응답에서 빠졌거나
+    묶음 요청 자체가 실패한 기사는 call_openai_summary로 하나씩 다시 요청합니다.
+    
+    Parameters
+    ----------
+    contents : List[Content]
+        분석할 콘텐츠 목록 (SUMMARY_BATCH_SIZE개 이하 권장)
+    deadline : Optional[float]
+        time.monotonic() 기준 마감 시각. 지나면 단건 재요청을 보내지 않음
+        
+    Returns
+    -------
+    Dict[int, Dict[str, Any]]
+        콘텐츠 ID → AI 분석 결과 (call_openai_summary와 같은 형태).
+        마감으로 요청하지 못한 기사는 빠짐
+    """
+    if len(contents) == 1:
+        return {contents[0].id: call_openai_summary(contents[0])}
+    
+    results: Dict[int, Dict[str, Any]] = {}
+    try:
+        if not client:
+            raise Exception("OpenAI API key not configured")
+        
+        # 기사별 텍스트 준비 (id + 제목 + 본문, 본문은 3000자 제한)
+        text_to_analyze = "\n\n".join(
+            f"[id: {content.id}]\n제목: {content.title}\n\n본문: {content.raw_text_head or ''}"
+            for content in contents
+        )
+        
+        response = client.chat.completions.create(
+            model=MODEL_VERSION,
+            messages=[
+                {"role": "system", "content": BATCH_SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": text_to_analyze}
+            ],
+            max_tokens=SUMMARY_MAX_TOKENS_PER_ITEM * len(contents),
+            temperature=0.3,
+            response_format={"type": "json_object"},
+            timeout=SUMMARY_REQUEST_TIMEOUT
+        )
+        
+        expected_ids = {content.id for content in contents}
+        for item in orjson.loads(response.choices[0].message.content).get("results", []):
+            try:
+                content_id = int(item.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if content_id not in expected_ids:
+                continue
+            
+            # 결과 검증 및 정제 (단건 요청과 같은 기준)
+            results[content_id] = {
+                "status": "success",
+                "summary_bullets": item.get("summary_bullets", [])[:5],
+                "tags": item.get("tags", [])[:8],
+                "insight": item.get("insight", "")[:500]
+            }
+            
+    except Exception as e:
+        logger.warning("묶음 요약 요청 실패, 기사별로 다시 요청합니다: %s", e)
+    
+    # 묶음 응답에서 빠진 기사는 단건 요청으로 처리
+    for content in contents:
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        if content.id not in results:
+            results[content.id] = call_openai_summary(content)
+    
+    return results
+
+def _apply_summary(content: Content, ai_result: Dict[str, Any]) -> List[str]:
+    """
+    AI 결과를 콘텐츠에 반영하고 병합된 태그 목록을 반환
+    
+    Parameters
+    ----------
+    content : Content
+        갱신할 콘텐츠 객체
+    ai_result : Dict[str, Any]
+        AI 분석 결과 (캐시 또는 API 응답)
+        
+    Returns
+    -------
+    List[str]
+        콘텐츠에 저장된 최종 태그 목록
+    """
+    # 기존 태그, AI 태그, 처리 상태·언어 태그, 제목 키워드 태그 순으로 병합
+    # (dict.fromkeys로 순서를 유지하며 중복 제거 → 프로세스와 무관하게 같은 태그가 남음)
+    tags = dict.fromkeys(chain(
+        content.tags or [],
+        ai_result.get("tags", []),
+        ("ai_summarized", "processed", "korean" if content.lang == "ko" else "english"),
+        (match.lastgroup for match in TITLE_TAG_PATTERN.finditer(content.title))
+    ))
+    tags.pop("pending_summary", None)
+    
+    # 상위 N개 선택
+    improved_tags = list(islice(tags, MAX_CONTENT_TAGS))
+    
+    # 데이터베이스 업데이트
+    content.summary_bullets = ai_result.get("summary_bullets", [])
+    content.tags = improved_tags
+    content.insight = ai_result.get("insight", f"AI 분석: {content.title}")
+    
+    return improved_tags
+
+@celery.task(
+    name="tasks.summarize",
+    **NETWORK_TASK_OPTIONS
+)
 def summarize_task(content_id: int):
     """
     콘텐츠를 요약하고 태그를 생성하는 Celery 태스크 (캐시 포함)
@@ -241,12 +603,16 @@ def summarize_task(content_id: int):
     db = SessionLocal()
     try:
         # 콘텐츠 조회
-        content = db.query(Content).filter_by(id=content_id).first()
+        content = db.get(Content, content_id, options=[load_only(*SUMMARY_CONTENT_COLUMNS)])
         if not content:
             return {"content_id": content_id, "status": "not_found"}
         
-        # 캐시 확인
-        cached_result = get_cached_result(content.hash, MODEL_VERSION, db)
+        # 캐시 확인 (재게재 기사까지 잡도록 지문을 먼저, 그다음 해시)
+        content_fp = content_fingerprint(content.title, content.raw_text_head)
+        cached_result = (
+            get_cached_result_by_fp(content_fp, MODEL_VERSION, db)
+            or get_cached_result(content.hash, MODEL_VERSION, db)
+        )
         if cached_result:
             # 캐시된 결과 사용
             ai_result = cached_result
@@ -261,40 +627,11 @@ def summarize_task(content_id: int):
                     ai_result.get("summary_bullets", []),
                     ai_result.get("tags", []),
                     ai_result.get("insight", ""),
-                    db
+                    db,
+                    content_fp=content_fp
                 )
         
-        # 기존 태그와 병합
-        existing_tags = content.tags or []
-        if "pending_summary" in existing_tags:
-            existing_tags.remove("pending_summary")
-        
-        # AI가 생성한 태그와 기존 태그 병합
-        ai_tags = ai_result.get("tags", [])
-        improved_tags = list(set(existing_tags + ai_tags + ["ai_summarized", "processed"]))
-        
-        # 언어별 태그 추가
-        if content.lang == "ko":
-            improved_tags.append("korean")
-        else:
-            improved_tags.append("english")
-        
-        # 제목에서 키워드 태그 추가 (기존 로직 유지)
-        title_lower = content.title.lower()
-        if any(word in title_lower for word in ["ai", "artificial", "intelligence"]):
-            improved_tags.append("ai")
-        if any(word in title_lower for word in ["tech", "technology"]):
-            improved_tags.append("technology")
-        if any(word in title_lower for word in ["crypto", "bitcoin", "blockchain"]):
-            improved_tags.append("cryptocurrency")
-        
-        # 중복 제거 및 상위 N개 선택
-        improved_tags = list(set(improved_tags))[:15]  # 최대 15개 태그
-        
-        # 데이터베이스 업데이트
-        content.summary_bullets = ai_result.get("summary_bullets", [])
-        content.tags = improved_tags
-        content.insight = ai_result.get("insight", f"AI 분석: {content.title}")
+        improved_tags = _apply_summary(content, ai_result)
         
         db.commit()
         
@@ -314,7 +651,135 @@ def summarize_task(content_id: int):
         db.close()
 
 
-@celery.task
+def chunk_content_ids(content_ids: List[int], size: int = SUMMARY_BATCH_SIZE) -> List[List[int]]:
+    """
+    콘텐츠 ID 목록을 summarize_batch_task 하나가 처리할 크기로 나눔
+    
+    Examples
+    --------
+    >>> group(summarize_batch_task.s(chunk) for chunk in chunk_content_ids(ids)).apply_async()
+    """
+    return [content_ids[i:i + size] for i in range(0, len(content_ids), size)]
+
+
+@celery.task(
+    name="tasks.summarize_batch",
+    **NETWORK_TASK_OPTIONS
+)
+def summarize_batch_task(content_ids: List[int]):
+    """
+    여러 콘텐츠를 한 번에 요약하는 Celery 태스크 (캐시 포함)
+    
+    콘텐츠와 캐시(지문, 해시 순)를 IN 쿼리로 조회하고, 캐시가 없는 콘텐츠만
+    SUMMARY_BATCH_SIZE개씩 묶어 OpenAI에 요청한 뒤 한 번에 커밋합니다.
+    SUMMARY_BATCH_DEADLINE이 지나면 남은 콘텐츠는 요청하지 않고 그대로 둡니다.
+    
+    Parameters
+    ----------
+    content_ids : List[int]
+        처리할 콘텐츠 ID 목록
+        
+    Returns
+    -------
+    Dict[str, Any]
+        태스크 실행 결과
+        - status: 실행 상태 ("success", "error")
+        - results: 콘텐츠별 결과 (summarize_task 결과와 같은 형태,
+          마감으로 요청하지 못한 콘텐츠는 status "timeout")
+        - error: 오류 메시지 (오류 시에만)
+    """
+    deadline = time.monotonic() + SUMMARY_BATCH_DEADLINE
+    db = SessionLocal()
+    try:
+        contents = ContentRepo(db).get_by_ids(content_ids, load_only(*SUMMARY_CONTENT_COLUMNS))
+        fingerprints = {
+            content_id: content_fingerprint(content.title, content.raw_text_head)
+            for content_id, content in contents.items()
+        }
+        
+        # 지문 캐시를 먼저 보고, 지문으로 못 찾은 콘텐츠만 해시로 다시 조회
+        fp_cached = get_cached_results_by_fp(list(fingerprints.values()), MODEL_VERSION, db)
+        hash_cached = get_cached_results(
+            [
+                content.hash for content_id, content in contents.items()
+                if fingerprints[content_id] not in fp_cached
+            ],
+            MODEL_VERSION, db
+        )
+        cached_results = {
+            content_id: fp_cached.get(fingerprints[content_id]) or hash_cached[content.hash]
+            for content_id, content in contents.items()
+            if fingerprints[content_id] in fp_cached or content.hash in hash_cached
+        }
+        
+        # 캐시가 없는 콘텐츠만 지문 기준으로 중복 없이 요청 (재게재 기사는 한 번만 요약)
+        misses = list({
+            fingerprints[content_id]: content
+            for content_id, content in contents.items()
+            if content_id not in cached_results
+        }.values())
+        
+        ai_results: Dict[str, Dict[str, Any]] = {}
+        cache_rows = []
+        for i in range(0, len(misses), SUMMARY_BATCH_SIZE):
+            if time.monotonic() >= deadline:
+                logger.warning(f"묶음 요약 태스크 시간 초과, 남은 콘텐츠 {len(misses) - i}개 생략")
+                break
+            chunk = misses[i:i + SUMMARY_BATCH_SIZE]
+            for content_id, ai_result in call_openai_summary_batch(chunk, deadline).items():
+                content = contents[content_id]
+                ai_results[fingerprints[content_id]] = ai_result
+                
+                # 성공한 경우만 캐시에 저장 (배치 끝에 한 번에 INSERT)
+                if ai_result.get("status") == "success":
+                    cache_rows.append({
+                        "content_hash": content.hash,
+                        "content_fp": fingerprints[content_id],
+                        "model_version": MODEL_VERSION,
+                        "summary_bullets": ai_result.get("summary_bullets", []),
+                        "tags": ai_result.get("tags", []),
+                        "insight": ai_result.get("insight", "")
+                    })
+        save_many_to_cache(cache_rows, db)
+        
+        results = []
+        for content_id in content_ids:
+            content = contents.get(content_id)
+            if content is None:
+                results.append({"content_id": content_id, "status": "not_found"})
+                continue
+            
+            cached_result = cached_results.get(content_id)
+            ai_result = cached_result or ai_results.get(fingerprints[content_id])
+            if ai_result is None:
+                results.append({"content_id": content_id, "status": "timeout"})
+                continue
+            improved_tags = _apply_summary(content, ai_result)
+            
+            results.append({
+                "content_id": content_id,
+                "status": "success",
+                "ai_status": ai_result.get("status", "unknown"),
+                "summary_length": len(content.summary_bullets),
+                "tags_count": len(improved_tags),
+                "cached": cached_result is not None
+            })
+        
+        db.commit()
+        
+        return {"status": "success", "results": results}
+        
+    except Exception as e:
+        db.rollback()
+        return {"content_ids": content_ids, "status": "error", "error": str(e)}
+    finally:
+        db.close()
+
+
+@celery.task(
+    name="process_popular_news_task",
+    **NETWORK_TASK_OPTIONS
+)
 def process_popular_news_task(limit: int = 10):
     """
     인기 뉴스 10개를 선별하고 AI 요약을 생성하는 태스크
@@ -344,7 +809,10 @@ def process_popular_news_task(limit: int = 10):
         db.close()
 
 
-@celery.task
+@celery.task(
+    name="collect_social_metrics_task",
+    **NETWORK_TASK_OPTIONS
+)
 def collect_social_metrics_task():
     """
     소셜 미디어 메트릭을 수집하는 태스크
@@ -358,13 +826,19 @@ def collect_social_metrics_task():
     try:
         # 최근 24시간 내의 뉴스 중 메트릭이 없는 것들 조회
         cutoff_time = datetime.utcnow() - timedelta(hours=24)
-        contents = db.query(Content).filter(
-            and_(
-                Content.published_at >= cutoff_time,
-                Content.is_active == "active",
-                Content.view_count == 0  # 메트릭이 없는 것들
-            )
-        ).limit(50).all()  # 한 번에 50개씩 처리
+        # ORM 객체 대신 필요한 컬럼만 조회 (갱신은 아래에서 UPDATE 한 번으로 처리)
+        contents = db.execute(
+            select(
+                Content.id, Content.title, Content.url, Content.source,
+                Content.published_at, Content.source_key
+            ).where(
+                and_(
+                    Content.published_at >= cutoff_time,
+                    Content.is_active == "active",
+                    Content.view_count == 0  # 메트릭이 없는 것들
+                )
+            ).limit(50)  # 한 번에 50개씩 처리
+        ).all()
         
         if not contents:
             return {
@@ -376,33 +850,82 @@ def collect_social_metrics_task():
         # 소셜 미디어 메트릭 수집기 초기화
         collector = SocialMetricsCollector()
         
-        processed_count = 0
+        # 메트릭 수집 (호스트별로 동시에 수집, 전체 SOCIAL_METRICS_TIMEOUT초 제한)
+        metrics_by_url = asyncio.run(asyncio.wait_for(
+            collector.batch_collect_metrics(
+                [{'url': content.url, 'source': content.source} for content in contents]
+            ),
+            SOCIAL_METRICS_TIMEOUT
+        ))
+        
         results = []
+        updated_contents = []
         
         for content in contents:
             try:
-                # 메트릭 수집
-                metrics = collector.collect_metrics(content.url, content.source)
-                
-                # 데이터베이스 업데이트
-                content.view_count = metrics.get('view_count', 0)
-                content.like_count = metrics.get('like_count', 0)
-                content.share_count = metrics.get('share_count', 0)
-                content.comment_count = metrics.get('comment_count', 0)
-                content.engagement_score = metrics.get('engagement_score', 'low')
+                metrics = metrics_by_url[content.url]
                 
-                processed_count += 1
-                results.append({
-                    "content_id": content.id,
-                    "title": content.title[:50] + "...",
-                    "view_count": content.view_count,
-                    "engagement_score": content.engagement_score
-                })
+                # 점수 계산용으로 기존 컬럼과 새 메트릭을 합친 행
+                updated_contents.append(SimpleNamespace(
+                    **content._mapping,
+                    view_count=metrics.get('view_count', 0),
+                    like_count=metrics.get('like_count', 0),
+                    share_count=metrics.get('share_count', 0),
+                    comment_count=metrics.get('comment_count', 0)
+                ))
                 
             except Exception as e:
                 logger.error(f"메트릭 수집 실패 (콘텐츠 {content.id}): {str(e)}")
                 continue
         
+        # 메트릭과 인기도 점수를 Core UPDATE executemany 한 번으로 갱신
+        if updated_contents:
+            # 참여도 등급은 행마다 계산하지 않고 배열 연산 한 번으로 매김
+            grades = classify_batch(
+                [content.view_count for content in updated_contents],
+                [content.like_count for content in updated_contents],
+                [content.share_count for content in updated_contents],
+                [content.comment_count for content in updated_contents]
+            )
+            for content, grade in zip(updated_contents, grades):
+                content.engagement_score = str(grade)
+            
+            mappings = [
+                {
+                    "b_id": content.id,
+                    "b_view_count": content.view_count,
+                    "b_like_count": content.like_count,
+                    "b_share_count": content.share_count,
+                    "b_comment_count": content.comment_count,
+                    "b_engagement_score": content.engagement_score,
+                    "b_popularity_score": float(score),
+                }
+                for content, score in zip(updated_contents, score_batch(updated_contents))
+            ]
+            content_table = Content.__table__
+            db.connection().execute(
+                update(content_table)
+                .where(content_table.c.id == bindparam("b_id"))
+                .values(
+                    view_count=bindparam("b_view_count"),
+                    like_count=bindparam("b_like_count"),
+                    share_count=bindparam("b_share_count"),
+                    comment_count=bindparam("b_comment_count"),
+                    engagement_score=bindparam("b_engagement_score"),
+                    popularity_score=bindparam("b_popularity_score")
+                ),
+                mappings
+            )
+        
+        for content in updated_contents:
+            results.append({
+                "content_id": content.id,
+                "title": content.title[:50] + "...",
+                "view_count": content.view_count,
+                "engagement_score": content.engagement_score
+            })
+        processed_count = len(updated_contents)
+        
         # 데이터베이스 커밋
         db.commit()
         
@@ -415,9 +938,43 @@ def collect_social_metrics_task():
             "results": results
         }
         
+    except asyncio.TimeoutError:
+        db.rollback()
+        logger.warning("소셜 미디어 메트릭 수집 태스크 시간 초과")
+        return {"status": "timeout", "message": "시간 제한을 초과했습니다."}
     except Exception as e:
         db.rollback()
         logger.error(f"소셜 미디어 메트릭 수집 태스크 실패: {str(e)}")
         return {"status": "error", "message": str(e)}
     finally:
         db.close()
+
+
+@celery.task(name="rescore_popularity_task")
+def rescore_popularity_task(hours: int = 168):
+    """
+    최근 콘텐츠의 인기도 점수를 재계산하는 태스크
+    
+    Parameters
+    ----------
+    hours : int
+        재계산할 기간 (기본값: 168시간)
+        
+    Returns
+    -------
+    Dict[str, Any]
+        처리 결과
+    """
+    db = SessionLocal()
+    try:
+        updated_count = PopularNewsAnalyzer(db).refresh_popularity_scores(hours)
+        
+        logger.info(f"인기도 점수 재계산 완료: {updated_count}건")
+        return {"status": "success", "updated_count": updated_count}
+        
+    except Exception as e:
+        db.rollback()
+        logger.error(f"인기도 점수 재계산 실패: {str(e)}")
+        return {"status": "error", "message": str(e)}
+    finally:
+        db.close()
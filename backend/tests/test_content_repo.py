@@ -75,14 +75,18 @@ class TestContentRepo:
         """ContentRepo 인스턴스 픽스처"""
         return ContentRepo(db=mock_session)
     
-    def test_list_contents_basic(self, content_repo, mock_session, sample_contents):
+    @pytest.fixture
+    def mock_query(self, mock_session):
+        """체이닝 메서드가 자기 자신을 반환하는 가짜 쿼리 픽스처 (테스트는 결과만 설정)"""
+        query = Mock()
+        for method in ("order_by", "filter", "filter_by", "offset", "limit"):
+            getattr(query, method).return_value = query
+        mock_session.query.return_value = query
+        return query
+    
+    def test_list_contents_basic(self, content_repo, mock_session, mock_query, sample_contents):
         """기본 콘텐츠 목록 조회 테스트"""
         # Given: 가짜 쿼리 결과 설정
-        mock_query = Mock()
-        mock_session.query.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
         mock_query.all.return_value = sample_contents
         
         # When: 모든 콘텐츠 조회
@@ -100,17 +104,11 @@ class TestContentRepo:
         mock_query.offset.assert_called_with(0)
         mock_query.limit.assert_called_with(10)
     
-    def test_list_contents_with_tags_filter(self, content_repo, mock_session, sample_contents):
+    def test_list_contents_with_tags_filter(self, content_repo, mock_session, mock_query, sample_contents):
         """태그 필터링 테스트"""
         # Given: AI 태그가 있는 콘텐츠만 반환하도록 설정
         ai_contents = [content for content in sample_contents if "ai" in content.tags]
         
-        mock_query = Mock()
-        mock_session.query.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
         mock_query.all.return_value = ai_contents
         
         # When: AI 태그로 필터링
@@ -125,17 +123,11 @@ class TestContentRepo:
         # 필터 메서드가 호출되었는지 검증
         mock_query.filter.assert_called_once()
     
-    def test_list_contents_with_keyword_search(self, content_repo, mock_session, sample_contents):
+    def test_list_contents_with_keyword_search(self, content_repo, mock_session, mock_query, sample_contents):
         """키워드 검색 테스트"""
         # Given: "AI"가 포함된 콘텐츠만 반환하도록 설정
         ai_contents = [content for content in sample_contents if "AI" in content.title]
         
-        mock_query = Mock()
-        mock_session.query.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
         mock_query.all.return_value = ai_contents
         
         # When: "AI" 키워드로 검색
@@ -149,16 +141,11 @@ class TestContentRepo:
         # 필터 메서드가 호출되었는지 검증
         mock_query.filter.assert_called_once()
     
-    def test_list_contents_with_offset_and_limit(self, content_repo, mock_session, sample_contents):
+    def test_list_contents_with_offset_and_limit(self, content_repo, mock_session, mock_query, sample_contents):
         """오프셋과 리밋 테스트"""
         # Given: 두 번째 콘텐츠부터 1개만 반환하도록 설정
         paginated_content = [sample_contents[1]]  # 인덱스 1 (두 번째 아이템)
         
-        mock_query = Mock()
-        mock_session.query.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
         mock_query.all.return_value = paginated_content
         
         # When: offset=1, limit=1로 조회
@@ -173,17 +160,11 @@ class TestContentRepo:
         mock_query.offset.assert_called_with(1)
         mock_query.limit.assert_called_with(1)
     
-    def test_list_contents_combined_filters(self, content_repo, mock_session, sample_contents):
+    def test_list_contents_combined_filters(self, content_repo, mock_session, mock_query, sample_contents):
         """복합 필터 테스트 (태그 + 키워드)"""
         # Given: tech 태그와 "2025" 키워드 모두 만족하는 콘텐츠
         filtered_content = [sample_contents[1]]  # "Tech Trends 2025"
         
-        mock_query = Mock()
-        mock_session.query.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
         mock_query.all.return_value = filtered_content
         
         # When: tech 태그와 "2025" 키워드로 검색
@@ -198,14 +179,9 @@ class TestContentRepo:
         # 필터가 두 번 호출되었는지 검증 (태그 + 키워드)
         assert mock_query.filter.call_count == 2
     
-    def test_list_contents_empty_result(self, content_repo, mock_session):
+    def test_list_contents_empty_result(self, content_repo, mock_session, mock_query):
         """빈 결과 테스트"""
         # Given: 빈 결과 반환하도록 설정
-        mock_query = Mock()
-        mock_session.query.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
         mock_query.all.return_value = []
         
         # When: 존재하지 않는 태그로 검색
@@ -215,14 +191,9 @@ class TestContentRepo:
         assert result == []
         assert len(result) == 0
     
-    def test_list_contents_large_offset(self, content_repo, mock_session):
+    def test_list_contents_large_offset(self, content_repo, mock_session, mock_query):
         """큰 오프셋 테스트"""
         # Given: 큰 오프셋으로 인해 빈 결과 반환
-        mock_query = Mock()
-        mock_session.query.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
         mock_query.all.return_value = []
         
         # When: 데이터보다 큰 오프셋으로 조회
@@ -236,42 +207,34 @@ class TestContentRepo:
         """ID로 콘텐츠 조회 성공 테스트"""
         # Given: 특정 ID의 콘텐츠 반환하도록 설정
         target_content = sample_contents[0]
-        mock_query = Mock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter_by.return_value = mock_query
-        mock_query.first.return_value = target_content
+        mock_session.get.return_value = target_content
         
         # When: ID 1로 콘텐츠 조회
         result = content_repo.get_by_id(1)
         
-        # Then: 올바른 콘텐츠 반환 검증
+        # Then: 올바른 콘텐츠 반환 검증 (기본 키 조회 사용)
         assert result is not None
         assert result.id == 1
         assert result.title == "AI Revolutionizes Content Creation"
-        mock_query.filter_by.assert_called_with(id=1)
+        mock_session.get.assert_called_once_with(Content, 1)
+        mock_session.query.assert_not_called()
     
     def test_get_by_id_not_found(self, content_repo, mock_session):
         """ID로 콘텐츠 조회 실패 테스트"""
         # Given: 존재하지 않는 ID에 대해 None 반환
-        mock_query = Mock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter_by.return_value = mock_query
-        mock_query.first.return_value = None
+        mock_session.get.return_value = None
         
         # When: 존재하지 않는 ID로 조회
         result = content_repo.get_by_id(999)
         
         # Then: None 반환 검증
         assert result is None
-        mock_query.filter_by.assert_called_with(id=999)
+        mock_session.get.assert_called_once_with(Content, 999)
     
-    def test_get_popular_tags_fallback(self, content_repo, mock_session, sample_contents):
+    def test_get_popular_tags_fallback(self, content_repo, mock_session, mock_query, sample_contents):
         """인기 태그 조회 폴백 메서드 테스트"""
         # Given: SQL 쿼리 실행 실패로 폴백 메서드 사용
         mock_session.execute.side_effect = Exception("SQL Error")
-        mock_query = Mock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
         mock_query.all.return_value = sample_contents
         
         # When: 인기 태그 조회
@@ -0,0 +1,62 @@
+"""
+콘텐츠 지문 테스트 모듈
+
+pytest를 사용하여 content_fingerprint가 매체별 표기 차이를 무시하고
+다른 기사는 구분하는지 테스트합니다.
+"""
+
+import pytest
+
+from backend.app.utils.fingerprint import FINGERPRINT_TEXT_CHARS, content_fingerprint, normalize_text
+
+TITLE = "Fed Holds Rates Steady"
+BODY = "The Federal Reserve left interest rates unchanged on Wednesday."
+
+
+class TestContentFingerprint:
+    """content_fingerprint 함수 테스트"""
+
+    @pytest.mark.parametrize("title, body", [
+        ("  fed holds   rates STEADY ", BODY),                                    # 대소문자, 공백
+        (TITLE, "The  Federal Reserve\nleft interest rates\tunchanged on Wednesday."),
+        (TITLE, BODY + "\nⓒ 한국경제, 무단전재 및 재배포 금지"),                      # 저작권 꼬리말
+        (TITLE, BODY + "\nCopyright 2025 Reuters. All rights reserved."),
+        (TITLE, BODY + " https://example.com/fed?utm=rss"),                        # URL
+        (TITLE, BODY + " newsroom@example.com"),                                   # 이메일
+        ("Ｆｅｄ Ｈｏｌｄｓ Ｒａｔｅｓ Ｓｔｅａｄｙ", BODY),                            # 전각 문자 (NFKC)
+    ])
+    def test_equivalent_variants_share_fingerprint(self, title, body):
+        """표기만 다른 같은 기사는 같은 지문을 갖는지 테스트"""
+        assert content_fingerprint(title, body) == content_fingerprint(TITLE, BODY)
+
+    def test_only_head_of_body_is_used(self):
+        """본문 앞 FINGERPRINT_TEXT_CHARS자 이후의 차이는 무시하는지 테스트"""
+        # Given: 앞부분이 같고 꼬리만 다른 본문
+        head = "a" * FINGERPRINT_TEXT_CHARS
+
+        # Then
+        assert content_fingerprint(TITLE, head + " tail one") == content_fingerprint(TITLE, head + " tail two")
+
+    @pytest.mark.parametrize("title, body", [
+        ("Fed Raises Rates", BODY),
+        (TITLE, "The Federal Reserve raised interest rates on Wednesday."),
+    ])
+    def test_different_articles_differ(self, title, body):
+        """제목이나 본문이 다른 기사는 다른 지문을 갖는지 테스트"""
+        assert content_fingerprint(title, body) != content_fingerprint(TITLE, BODY)
+
+    def test_title_and_body_are_separated(self):
+        """제목과 본문의 경계가 지문에 반영되는지 테스트"""
+        assert content_fingerprint("a b", "c") != content_fingerprint("a", "b c")
+
+    def test_missing_body(self):
+        """본문이 None이어도 빈 본문과 같은 지문을 내는지 테스트"""
+        # Then: 64자리 16진수
+        fingerprint = content_fingerprint(TITLE, None)
+        assert fingerprint == content_fingerprint(TITLE, "")
+        assert len(fingerprint) == 64
+
+    def test_normalize_text(self):
+        """normalize_text 기본 동작 테스트"""
+        assert normalize_text("  Hello\n\n  WORLD  ") == "hello world"
+        assert normalize_text(None) == ""
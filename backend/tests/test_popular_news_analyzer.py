@@ -0,0 +1,104 @@
+"""
+인기도 점수 계산 테스트 모듈
+
+pytest를 사용하여 score_batch(NumPy/numba 경로)가
+PopularNewsAnalyzer.analyze_popularity_score와 같은 점수를 내는지 테스트합니다.
+"""
+
+import pytest
+from unittest.mock import Mock
+from datetime import datetime, timedelta
+from itertools import product
+from types import SimpleNamespace
+from typing import List
+
+from backend.app.services import popular_news_analyzer
+from backend.app.services.popular_news_analyzer import PopularNewsAnalyzer, score_batch
+
+NOW = datetime(2025, 1, 10, 12, 0, 0)
+
+# 구간 경계와 그 바로 옆 값 (조회수, 참여 수)
+VIEW_ENGAGEMENT_CASES = [
+    (0, 0), (0, 5),                               # 조회수 0 → 참여도·조회수 0점
+    (1, 0), (499, 0), (500, 0), (999, 0),
+    (1000, 0), (1999, 0), (2000, 0), (4999, 0),
+    (5000, 0), (9999, 0), (10000, 0), (50000, 0),
+    (100, 10), (100, 9), (100, 5), (100, 4),      # 참여율 10%, 5% 경계
+    (100, 2), (100, 1), (1000, 10), (1000, 9),    # 참여율 2%, 1% 경계
+    (100, 200),                                   # 참여 수가 조회수보다 많음
+]
+
+# 발행 경과 시간 경계 (None = 발행일 없음)
+HOURS_CASES = [None, 0, 1, 1.01, 6, 6.01, 24, 24.01, 72, 72.01, 1000]
+
+SOURCE_KEY_CASES = ["hankyung", "reuters", "other", None]
+
+
+def _make_contents() -> List[SimpleNamespace]:
+    """경계값 조합으로 만든 콘텐츠 행 목록"""
+    contents = []
+    for (views, engagement), hours, source_key in product(VIEW_ENGAGEMENT_CASES, HOURS_CASES, SOURCE_KEY_CASES):
+        contents.append(SimpleNamespace(
+            view_count=views,
+            like_count=engagement,
+            share_count=0,
+            comment_count=0,
+            published_at=None if hours is None else NOW - timedelta(hours=hours),
+            source_key=source_key,
+        ))
+    return contents
+
+
+class TestScoreBatch:
+    """score_batch 함수 테스트"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """가짜 세션을 쓰는 PopularNewsAnalyzer 픽스처 (점수 계산은 DB를 쓰지 않음)"""
+        return PopularNewsAnalyzer(db=Mock())
+
+    @pytest.fixture
+    def contents(self) -> List[SimpleNamespace]:
+        """경계값 콘텐츠 픽스처"""
+        return _make_contents()
+
+    def test_numpy_path_matches_analyze_popularity_score(self, analyzer, contents):
+        """NumPy 경로가 행 단위 계산과 같은 점수를 내는지 테스트"""
+        # When: 배열 연산으로 한 번에 채점
+        scores = score_batch(contents, now=NOW)
+
+        # Then: 모든 행이 행 단위 계산과 일치
+        expected = [analyzer.analyze_popularity_score(content, now=NOW) for content in contents]
+        assert scores.tolist() == pytest.approx(expected)
+
+    @pytest.mark.skipif(not popular_news_analyzer._NUMBA_AVAILABLE, reason="numba 미설치")
+    def test_numba_path_matches_analyze_popularity_score(self, analyzer, contents, monkeypatch):
+        """numba 경로가 행 단위 계산과 같은 점수를 내는지 테스트"""
+        # Given: 행 수와 관계없이 JIT 커널을 쓰도록 설정
+        monkeypatch.setattr(popular_news_analyzer, "_NUMBA_MIN_ROWS", 0)
+
+        # When: JIT 커널로 채점
+        scores = score_batch(contents, now=NOW)
+
+        # Then: 모든 행이 행 단위 계산과 일치
+        expected = [analyzer.analyze_popularity_score(content, now=NOW) for content in contents]
+        assert scores.tolist() == pytest.approx(expected)
+
+    def test_missing_published_at_gets_no_time_score(self, analyzer):
+        """발행일이 없으면 최신성 점수 없이 채점되는지 테스트"""
+        # Given: 발행일만 없는 콘텐츠
+        content = SimpleNamespace(
+            view_count=10000, like_count=1000, share_count=0, comment_count=0,
+            published_at=None, source_key="hankyung"
+        )
+
+        # When
+        score = score_batch([content], now=NOW)[0]
+
+        # Then: 참여도 50 + 조회수 25 + 소스 10
+        assert score == 85.0
+        assert score == analyzer.analyze_popularity_score(content, now=NOW)
+
+    def test_empty_input(self):
+        """빈 목록이면 빈 배열을 반환하는지 테스트"""
+        assert score_batch([]).shape == (0,)
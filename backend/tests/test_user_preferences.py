@@ -0,0 +1,75 @@
+"""
+UserPreferencesService 테스트 모듈
+
+pytest를 사용하여 설정 병합(_merge_preferences)이 모듈 기본값을 바꾸지 않는지 테스트합니다.
+"""
+
+import copy
+import pytest
+from unittest.mock import Mock
+
+from backend.app.services.user_preferences import (
+    DEFAULT_NOTIFICATION_SETTINGS,
+    DEFAULT_PREFERENCES,
+    UserPreferencesService,
+)
+
+
+class TestMergePreferences:
+    """UserPreferencesService._merge_preferences 메서드 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        """가짜 세션을 쓰는 UserPreferencesService 픽스처 (병합은 DB와 Redis를 쓰지 않음)"""
+        return UserPreferencesService(db=Mock())
+
+    def test_user_values_override_defaults(self, service):
+        """사용자 값이 기본값을 덮어쓰고 나머지 하위 설정은 유지되는지 테스트"""
+        # When
+        merged = service._merge_preferences(
+            {"display": {"theme": "light", "language": "ko"}, "newsletter": False},
+            {"display": {"theme": "dark"}, "extra": 1}
+        )
+
+        # Then
+        assert merged == {"display": {"theme": "dark", "language": "ko"}, "newsletter": False, "extra": 1}
+
+    def test_mutating_merged_preferences_keeps_defaults(self, service):
+        """병합 결과를 수정해도 DEFAULT_PREFERENCES가 바뀌지 않는지 테스트"""
+        # Given: 사용자가 아무것도 바꾸지 않은 설정
+        snapshot = copy.deepcopy(DEFAULT_PREFERENCES)
+        merged = service._merge_preferences(DEFAULT_PREFERENCES, {})
+
+        # When: 결과의 모든 하위 딕셔너리와 리스트를 수정
+        for value in merged.values():
+            if isinstance(value, dict):
+                value.clear()
+            elif isinstance(value, list):
+                value.append("mutated")
+
+        # Then
+        assert DEFAULT_PREFERENCES == snapshot
+
+    def test_mutating_merged_notification_settings_keeps_defaults(self, service):
+        """병합 결과를 수정해도 DEFAULT_NOTIFICATION_SETTINGS가 바뀌지 않는지 테스트"""
+        # Given: 일부 하위 설정만 바꾼 알림 설정
+        snapshot = copy.deepcopy(DEFAULT_NOTIFICATION_SETTINGS)
+        merged = service._merge_preferences(DEFAULT_NOTIFICATION_SETTINGS, {"newsletter": True})
+
+        # When
+        merged["quiet_hours"]["enabled"] = True
+
+        # Then
+        assert DEFAULT_NOTIFICATION_SETTINGS == snapshot
+
+    def test_merged_result_does_not_share_user_input(self, service):
+        """병합 결과가 사용자 입력 딕셔너리와 객체를 공유하지 않는지 테스트"""
+        # Given
+        user = {"filters": {"sources": ["hankyung"]}}
+        merged = service._merge_preferences({}, user)
+
+        # When
+        merged["filters"]["sources"].append("reuters")
+
+        # Then
+        assert user == {"filters": {"sources": ["hankyung"]}}
@@ -64,6 +64,7 @@ const AISettings: React.FC = () => {
       'korean-news-hourly': '한국 뉴스 수집',
       'us-news-30min': '미국 뉴스 수집',
       'all-news-daily': '전체 뉴스 수집',
+      'rss-rolling-1min': 'RSS 롤링 수집',
       'health-check': '시스템 상태 확인'
     };
     return nameMap[scheduleName] || scheduleName;